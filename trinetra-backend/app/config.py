@@ -2,6 +2,7 @@
 Trinetra Backend Configuration
 Loads settings from .env file using pydantic-settings.
 """
+import os
 from pydantic_settings import BaseSettings
 from typing import Optional
 
@@ -18,7 +19,94 @@ class Settings(BaseSettings):
     openrouter_api_key: Optional[str] = None
 
     # Crawler settings
-    crawler_interval_seconds: int = 300  # 5 minutes
+    crawler_enabled: bool = True  # False: API only; run crawlers with `python -m app.crawler`
+    crawler_metrics_port: int = 0  # Standalone worker: serve Prometheus metrics on this port (0 = off)
+    spool_enabled: bool = True  # Durable on-disk spool of fetched posts until they are processed
+    spool_segment_mb: int = 8
+    spool_max_mb: int = 256  # Oldest segments are discarded beyond this
+    crawler_capture_dir: str = ""  # Capture every fetched post to gzip JSONL here, for replay (empty = off)
+    crawler_interval_seconds: int = 300  # 5 minutes — config refresh + initial per-source interval
+
+    # Per-source adaptive scheduling
+    crawler_min_interval_seconds: int = 60
+    crawler_max_interval_seconds: int = 1800
+    crawler_max_concurrent_fetches: int = 3
+
+    # Source leases, so scaled-out replicas split the sources instead of all crawling everything.
+    # Empty: none for the crawler inside the API (single instance), firestore for `python -m app.crawler`.
+    # Set CRAWLER_LEASE_BACKEND=firestore when several API replicas run the crawler.
+    crawler_lease_backend: str = ""  # firestore | sqlite | none
+    crawler_lease_seconds: int = 600  # Renewed while a fetch runs; expired leases are taken over
+    crawler_replica_id: str = ""  # Defaults to <hostname>-<pid>
+
+    # Fetching inside a scraper: concurrent requests + per-host politeness (token bucket)
+    scraper_max_concurrency: int = 8
+    crawler_host_rate_per_second: float = 5.0
+    crawler_host_burst: int = 20
+    crawler_host_rate_overrides: str = "www.reddit.com=1"  # "host=rate,host=rate"; rates must be > 0
+    scraper_max_page_kb: int = 1024  # Forum pages are read (and parsed as they stream) up to this size
+    scraper_parse_in_pool: bool = False  # Parse them in the analysis process pool instead (needs analysis_processes > 0)
+
+    # Source health: retries with jittered backoff, then a per-source circuit breaker
+    source_retries: int = 2  # Extra attempts after a timeout / connection error / 429 / 5xx
+    source_retry_base_seconds: float = 1.0
+    source_retry_max_seconds: float = 30.0
+    source_breaker_failures: int = 5  # Consecutive failed fetches that open the circuit
+    source_breaker_reset_seconds: int = 300  # Cool-down before a trial fetch; doubles on failure
+    source_breaker_max_reset_seconds: int = 3600
+
+    # Analysis pipeline (scrape → detect → dedup → persist → notify)
+    pipeline_queue_size: int = 500  # Max posts buffered between two stages
+    pipeline_detect_workers: int = 1
+    pipeline_dedup_workers: int = 4
+    pipeline_persist_workers: int = 4
+    pipeline_notify_workers: int = 2
+
+    # CPU-bound detection: 0 runs it inline on the event loop, N>0 uses N worker processes
+    analysis_processes: int = 0
+    analysis_chunk_size: int = 32  # Posts shipped to a worker process per task
+    analysis_cache_size: int = 10_000  # Detection results memoized by content + detector config (0 = off)
+
+    # Contextual classifier (hashed features + online logistic model) trained from analyst triage
+    classifier_enabled: bool = True
+    classifier_threshold: float = 0.2  # Keyword candidates scored below this are dropped
+    classifier_min_labels: int = 20  # Escalated and Resolved labels each needed before anything is dropped
+    classifier_hash_bits: int = 18  # 2^18 hashed features
+    classifier_learning_rate: float = 0.5
+
+    # Batched threat persistence (Firestore WriteBatch)
+    threat_write_batch_size: int = 100  # Flush when this many threats are pending (max 500)
+    threat_write_flush_seconds: float = 1.0  # ...or when the oldest has waited this long
+
+    # Local crawler state (checkpoints etc.), relative to the backend root
+    crawler_state_dir: str = "crawler_state"
+
+    # In-memory dedup index (Bloom filter + LRU/TTL set of URLs and content hashes)
+    dedup_capacity: int = 200_000
+    dedup_ttl_days: int = 30
+
+    # Near-duplicate merging (SimHash); reposts this similar become sightings of the original
+    near_duplicate_threshold: float = 0.85  # Fraction of equal SimHash bits: 0.85 allows 9 of 64 to differ
+    near_duplicate_capacity: int = 100_000
+    near_duplicate_max_sightings: int = 50  # Listed on the threat document; further sightings are only counted
+
+    # Full threat evidence in a content-addressed, compressed store; threat documents keep a digest + snippet
+    # none keeps evidence inline (first 2000 chars). local writes to crawler_state/evidence on the crawler's
+    # host, readable by the API only when it runs the crawler in-process on that host; use gcs otherwise.
+    evidence_backend: str = "none"  # none | local | gcs
+    evidence_bucket: str = ""  # gcs: bucket name
+    evidence_prefix: str = "evidence"  # gcs: object name prefix
+    evidence_snippet_chars: int = 500  # Inline `rawEvidence` preview
+    evidence_max_kb: int = 2048  # Larger evidence is truncated before storing
+
+    # Shared outbound HTTP client (scrapers, Telegram, AI summaries)
+    http_timeout_seconds: float = 15.0
+    http_max_connections: int = 100
+    http_max_connections_per_host: int = 6
+    http_keepalive_connections: int = 20
+    http_keepalive_expiry_seconds: float = 60.0
+    http_dns_cache_ttl_seconds: int = 300
+    http2_enabled: bool = True  # Used only when the `h2` package is installed
 
     # SMTP Settings (for Email Escalation)
     smtp_server: str = "smtp.gmail.com"
@@ -29,6 +117,7 @@ class Settings(BaseSettings):
     # Telegram Settings
     telegram_bot_token: Optional[str] = None
     telegram_chat_id: Optional[str] = None
+    telegram_alerts_enabled: bool = True  # False skips alerts entirely (corpus replay)
 
     # CORS
     cors_origins: str = "http://localhost:5173,http://localhost:3000,https://trinetra-intel-v3.web.app"
@@ -41,6 +130,15 @@ class Settings(BaseSettings):
     def cors_origin_list(self) -> list[str]:
         return [origin.strip() for origin in self.cors_origins.split(",")]
 
+    def state_path(self, *parts: str) -> str:
+        """Resolve a path inside the crawler state directory."""
+        base = self.crawler_state_dir
+        if not os.path.isabs(base):
+            base = os.path.join(
+                os.path.dirname(os.path.dirname(os.path.abspath(__file__))), base
+            )
+        return os.path.join(base, *parts)
+
     class Config:
         env_file = ".env"
         env_file_encoding = "utf-8"
@@ -0,0 +1,130 @@
+"""
+Standalone crawler worker.
+
+Runs the CrawlerEngine in its own process, separate from the API, so
+API replicas and crawler workers can be scaled independently:
+
+    python -m app.crawler --processes 4
+
+Set CRAWLER_ENABLED=false on the API replicas so they serve requests
+only. Workers split the sources between them through Firestore crawl
+leases (`--leases`, default firestore). Dashboard clients connect to the
+API, not to the worker: the API's threat relay (app.services.threat_relay)
+pushes the threats a worker stores to them.
+
+SIGINT / SIGTERM stop the worker gracefully: in-flight fetches are
+cancelled, queued threats are flushed, and checkpoints are written.
+"""
+import argparse
+import asyncio
+import logging
+import signal
+
+from app import metrics
+from app.config import settings
+from app.firebase_client import initialize_firebase
+
+logger = logging.getLogger("trinetra.crawler")
+
+
+def _parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        prog="python -m app.crawler",
+        description="Run the Trinetra crawler engine without the API server.",
+    )
+    parser.add_argument(
+        "--processes",
+        type=int,
+        default=settings.analysis_processes,
+        help="Analysis worker processes (0 = analyze inline on the event loop)",
+    )
+    parser.add_argument(
+        "--interval",
+        type=int,
+        default=settings.crawler_interval_seconds,
+        help="Config refresh period and initial per-source interval, in seconds",
+    )
+    parser.add_argument(
+        "--leases",
+        choices=("firestore", "sqlite", "none"),
+        default=settings.crawler_lease_backend or "firestore",
+        help="Source lease store shared with the other workers (default: firestore)",
+    )
+    parser.add_argument(
+        "--metrics-port",
+        type=int,
+        default=settings.crawler_metrics_port,
+        help="Serve Prometheus metrics on this port (0 = off)",
+    )
+    parser.add_argument(
+        "--capture",
+        metavar="DIR",
+        default=settings.crawler_capture_dir,
+        help="Capture every fetched post to gzip JSONL in DIR (replay with python -m app.crawler.replay)",
+    )
+    return parser.parse_args()
+
+
+async def _run(interval: int, metrics_port: int) -> None:
+    # Imported after settings are final: the engine reads them on construction
+    from app.crawler.engine import CrawlerEngine
+
+    stop = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        try:
+            loop.add_signal_handler(sig, stop.set)
+        except NotImplementedError:  # Windows: fall back to KeyboardInterrupt
+            pass
+
+    try:
+        initialize_firebase()
+    except Exception as exc:
+        logger.warning(f"Firebase init failed (Firestore may still be activating): {exc}")
+
+    metrics_server = await metrics.serve(metrics_port) if metrics_port else None
+
+    engine = CrawlerEngine(interval_seconds=interval)
+    await engine.start()
+    try:
+        await stop.wait()
+    finally:
+        logger.info("═══ Trinetra Crawler Worker Shutting Down ═══")
+        await engine.stop()
+        if metrics_server:
+            metrics_server.close()
+
+
+def main() -> None:
+    args = _parse_args()
+    settings.analysis_processes = max(0, args.processes)
+    settings.crawler_capture_dir = args.capture
+    settings.crawler_lease_backend = args.leases
+
+    logging.basicConfig(
+        level=logging.INFO,
+        format="%(asctime)s │ %(levelname)-8s │ %(name)-25s │ %(message)s",
+        datefmt="%Y-%m-%d %H:%M:%S",
+    )
+    logger.info(
+        f"═══ Trinetra Crawler Worker Starting "
+        f"({settings.analysis_processes} analysis processes) ═══"
+    )
+    if settings.evidence_backend.lower() == "local":
+        logger.warning(
+            "EVIDENCE_BACKEND=local writes evidence to this worker's disk, which the API can't "
+            "read unless it shares the crawler state directory; use gcs for a separate worker"
+        )
+    logger.info(
+        "WebSocket alerts for this worker's threats are pushed by the API's threat relay "
+        "(API processes with CRAWLER_ENABLED=false)"
+    )
+
+    try:
+        asyncio.run(_run(args.interval, args.metrics_port))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
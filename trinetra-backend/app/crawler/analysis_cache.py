@@ -0,0 +1,91 @@
+"""
+Analysis Cache — memoized detection results for content seen before.
+
+Every cycle re-fetches the same Reddit listings and Pastebin archive,
+and the same paste turns up on several sources, so credential detection
+and NLP analysis kept re-running on identical text. Results are cached
+by (content digest, detector config version): a keyword or pattern
+change yields a new version, so stale results are never served, and the
+old version's entries are dropped at once instead of aging out.
+
+The digest is of the exact content (detection is case-sensitive), and
+entries are evicted least-recently-used beyond `capacity`. Cached
+results are shared, not copied — treat them as read-only.
+"""
+import hashlib
+from collections import OrderedDict
+from typing import Generic, Optional, TypeVar
+
+from app.metrics import Counter
+
+T = TypeVar("T")
+
+ANALYSIS_CACHE_LOOKUPS = Counter(
+    "trinetra_analysis_cache_lookups_total",
+    "Analysis cache lookups by result",
+    ["result"],
+)
+
+
+def analysis_key(content: str) -> bytes:
+    return hashlib.blake2b(content.encode("utf-8", errors="surrogatepass"), digest_size=16).digest()
+
+
+class AnalysisCache(Generic[T]):
+    """
+    Bounded LRU of analysis results for one detector config version at a time.
+
+    Usage:
+        cache = AnalysisCache(capacity=10_000)
+        result = cache.get(content, version)
+        if result is None:
+            result = analyze(content)
+            cache.put(content, version, result)
+    """
+
+    def __init__(self, capacity: int = 10_000):
+        self.capacity = capacity
+        self.version: Optional[str] = None
+        self._entries: OrderedDict[bytes, T] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _use_version(self, version: str) -> None:
+        if version != self.version:
+            self._entries.clear()
+            self.version = version
+
+    def get(self, content: str, version: str) -> Optional[T]:
+        self._use_version(version)
+        key = analysis_key(content)
+        result = self._entries.get(key)
+        if result is None:
+            self.misses += 1
+            ANALYSIS_CACHE_LOOKUPS.labels("miss").inc()
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        ANALYSIS_CACHE_LOOKUPS.labels("hit").inc()
+        return result
+
+    def put(self, content: str, version: str, result: T) -> None:
+        self._use_version(version)
+        key = analysis_key(content)
+        self._entries[key] = result
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.capacity:
+            self._entries.popitem(last=False)
+
+    def stats(self) -> dict:
+        lookups = self.hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "capacity": self.capacity,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / lookups, 3) if lookups else None,
+            "version": self.version,
+        }
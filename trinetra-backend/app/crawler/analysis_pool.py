@@ -0,0 +1,147 @@
+"""
+Analysis Pool — runs CPU-bound threat detection in a persistent process pool.
+
+`NLPAnalyzer.analyze` and `CredentialDetector.scan` are pure-Python regex
+work. Running them on the FastAPI event loop stalls every API request for
+the duration of a crawl cycle. The pool moves that work to separate
+processes: each worker keeps warm analyzer/detector instances (compiled
+patterns and keyword matchers) and only rebuilds them when the detector
+configuration version changes. Posts are shipped in chunks to amortize
+pickling and IPC overhead.
+"""
+import asyncio
+import hashlib
+import json
+import logging
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Callable, Optional
+
+from app.crawler.credential_detector import CredentialDetector, CredentialMatch
+from app.nlp.analyzer import NLPAnalyzer, ThreatIndicator
+
+logger = logging.getLogger(__name__)
+
+# One (credential matches, NLP result) pair per analyzed post
+AnalysisResult = tuple[list[CredentialMatch], ThreatIndicator]
+
+
+def analyze_batch(
+    detector: CredentialDetector, analyzer: NLPAnalyzer, contents: list[str]
+) -> list[AnalysisResult]:
+    """Run both detectors' batch entry points over `contents`; results in input order."""
+    return list(zip(detector.scan_batch(contents), analyzer.analyze_batch(contents)))
+
+
+# ═══ Worker-process state ═══
+# Lives in each worker process; rebuilt only when the config version changes.
+_worker_version: Optional[str] = None
+_worker_analyzer: Optional[NLPAnalyzer] = None
+_worker_detector: Optional[CredentialDetector] = None
+
+
+def _init_worker() -> None:
+    """Warm the worker with default analyzers so the first chunk is fast."""
+    global _worker_analyzer, _worker_detector
+    _worker_analyzer = NLPAnalyzer()
+    _worker_detector = CredentialDetector()
+
+
+def _analyze_chunk(
+    version: str,
+    custom_keywords: list[str],
+    custom_patterns: list[str],
+    contents: list[str],
+) -> list[AnalysisResult]:
+    """Analyze a chunk of posts inside a worker process."""
+    global _worker_version, _worker_analyzer, _worker_detector
+
+    if version != _worker_version:
+        _worker_analyzer = NLPAnalyzer(custom_keywords=custom_keywords)
+        _worker_detector = CredentialDetector(custom_patterns=custom_patterns)
+        _worker_version = version
+
+    return analyze_batch(_worker_detector, _worker_analyzer, contents)
+
+
+def config_version(custom_keywords: list[str], custom_patterns: list[str]) -> str:
+    """Stable fingerprint of the detector inputs."""
+    payload = json.dumps([sorted(custom_keywords), list(custom_patterns)])
+    return hashlib.sha256(payload.encode()).hexdigest()[:16]
+
+
+class AnalysisPool:
+    """
+    Persistent process pool for credential detection and NLP analysis.
+
+    Usage:
+        pool = AnalysisPool(processes=4, chunk_size=32)
+        pool.start()
+        pool.configure(keywords, patterns)
+        results = await pool.analyze([post.content for post in posts])
+        pool.shutdown()
+    """
+
+    def __init__(self, processes: int, chunk_size: int = 32):
+        self.processes = processes
+        self.chunk_size = max(1, chunk_size)
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._custom_keywords: list[str] = []
+        self._custom_patterns: list[str] = []
+        self.version = config_version([], [])
+
+    def start(self) -> None:
+        """Spawn the worker processes."""
+        if self._executor is not None:
+            return
+        # "spawn" avoids forking a process that already holds gRPC/Firestore threads
+        self._executor = ProcessPoolExecutor(
+            max_workers=self.processes,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_worker,
+        )
+        logger.info(f"Analysis pool started with {self.processes} processes")
+
+    def shutdown(self) -> None:
+        """Terminate the worker processes."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+            logger.info("Analysis pool stopped")
+
+    def configure(self, custom_keywords: list[str], custom_patterns: list[str]) -> None:
+        """Update the detector inputs; workers rebuild lazily on the next chunk."""
+        self._custom_keywords = list(custom_keywords)
+        self._custom_patterns = list(custom_patterns)
+        self.version = config_version(self._custom_keywords, self._custom_patterns)
+
+    async def analyze(self, contents: list[str]) -> list[AnalysisResult]:
+        """Analyze posts across the pool. Results are returned in input order."""
+        if self._executor is None:
+            raise RuntimeError("AnalysisPool is not started")
+        if not contents:
+            return []
+
+        loop = asyncio.get_running_loop()
+        futures = [
+            loop.run_in_executor(
+                self._executor,
+                _analyze_chunk,
+                self.version,
+                self._custom_keywords,
+                self._custom_patterns,
+                contents[i:i + self.chunk_size],
+            )
+            for i in range(0, len(contents), self.chunk_size)
+        ]
+
+        results: list[AnalysisResult] = []
+        for chunk_results in await asyncio.gather(*futures):
+            results.extend(chunk_results)
+        return results
+
+    async def run(self, fn: Callable[..., Any], *args) -> Any:
+        """Run another CPU-bound task (e.g. HTML extraction) on the pool's workers."""
+        if self._executor is None:
+            raise RuntimeError("AnalysisPool is not started")
+        return await asyncio.get_running_loop().run_in_executor(self._executor, fn, *args)
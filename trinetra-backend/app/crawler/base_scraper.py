@@ -1,9 +1,26 @@
 """
 Abstract base scraper — defines the interface all scrapers must implement.
 """
+import asyncio
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
+from typing import TYPE_CHECKING, Awaitable, Callable, Iterable, Optional, TypeVar
+
+import httpx
+
+from app.crawler.cursors import CursorStore
+from app.crawler.rate_limiter import HostRateLimiter, parse_retry_after
+from app.crawler.source_health import HealthRegistry
+
+if TYPE_CHECKING:
+    from app.crawler.registry import SourceConfig
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+# Retry-After waits longer than this are not slept through; the fetch fails
+_MAX_RETRY_AFTER_SECONDS = 60
 
 
 @dataclass
@@ -17,6 +34,8 @@ class RawPost:
         default_factory=lambda: datetime.now(timezone.utc).isoformat()
     )
     source_name: str = ""
+    # Untruncated original when `content` was cut down for analysis (kept as evidence)
+    full_content: str = ""
 
 
 class BaseScraper(ABC):
@@ -24,11 +43,124 @@ class BaseScraper(ABC):
     Abstract base class for all scrapers.
     Each scraper must implement the `scrape()` method that returns
     a list of RawPost objects from its target source.
+
+    Scrapers that support incremental crawling read and advance their
+    watermarks through `get_cursor()` / `set_cursor()`; the engine
+    attaches a shared CursorStore that persists them across restarts.
+    Advanced cursors are only staged: the engine commits them with
+    `commit_cursors()` once the fetched posts were handed to the spool or
+    the pipeline, so posts lost to a failure are fetched again.
+
+    Requests go through `fetch()`, which applies the shared per-host rate
+    limiter and honors Retry-After; `gather_bounded()` runs up to
+    `max_concurrency` fetches at a time. `crawl_target()` wraps the crawl
+    of one subreddit / feed / URL in its retry policy and circuit breaker.
+    Page bodies are read up to `max_page_bytes`; CPU-heavy parsing may be
+    sent to `parse_pool` (the engine's AnalysisPool) when one is attached.
+
+    Scrapers built per source document (see app.crawler.registry)
+    implement `from_source()`.
     """
 
-    def __init__(self, name: str, enabled: bool = True):
+    # Namespace of this scraper's cursor keys (travels with its crawl lease)
+    cursor_prefix = ""
+
+    def __init__(self, name: str, enabled: bool = True, max_concurrency: int = 8):
         self.name = name
         self.enabled = enabled
+        self.max_concurrency = max_concurrency
+        self.cursors: Optional[CursorStore] = None
+        self._staged_cursors: dict[str, dict] = {}
+        self.rate_limiter: Optional[HostRateLimiter] = None
+        self.health: Optional[HealthRegistry] = None
+        self.max_page_bytes: Optional[int] = None  # None: the engine's SCRAPER_MAX_PAGE_KB
+        self.parse_pool = None  # Optional AnalysisPool
+
+    @classmethod
+    def from_source(cls, config: "SourceConfig") -> "BaseScraper":
+        """Build a scraper for one `sources` document."""
+        raise NotImplementedError(f"{cls.__name__} can't be configured per source")
+
+    def get_cursor(self, key: str) -> dict:
+        """Committed watermark for `key` (empty dict if none or no store attached)."""
+        return self.cursors.get(key) if self.cursors is not None else {}
+
+    def set_cursor(self, key: str, cursor: dict) -> None:
+        """Stage a new watermark for `key`; it takes effect on `commit_cursors()`."""
+        self._staged_cursors[key] = dict(cursor)
+
+    def commit_cursors(self) -> None:
+        """Advance the watermarks staged by the last scrape (its posts are safe)."""
+        if self.cursors is not None:
+            self.cursors.update(self._staged_cursors)
+        self._staged_cursors = {}
+
+    def discard_cursors(self) -> None:
+        """Drop the watermarks staged by the last scrape, so its posts are fetched again."""
+        self._staged_cursors = {}
+
+    async def fetch(
+        self, client: httpx.AsyncClient, url: str, stream: bool = False, **kwargs
+    ) -> httpx.Response:
+        """
+        GET `url` within the host's rate limit. A 429/503 with a short
+        Retry-After pauses the host and is retried once.
+
+        With `stream=True` the body is not read; the caller iterates it
+        and must close the response (`await resp.aclose()`).
+        """
+        host = httpx.URL(url).host
+        for attempt in range(2):
+            if self.rate_limiter is not None:
+                await self.rate_limiter.acquire(host)
+            if stream:
+                request = client.build_request(
+                    "GET", url, **{k: v for k, v in kwargs.items() if k != "follow_redirects"}
+                )
+                resp = await client.send(
+                    request,
+                    stream=True,
+                    follow_redirects=kwargs.get("follow_redirects", client.follow_redirects),
+                )
+            else:
+                resp = await client.get(url, **kwargs)
+            if resp.status_code not in (429, 503):
+                return resp
+
+            delay = parse_retry_after(resp.headers.get("Retry-After"))
+            if delay is None:
+                return resp
+            if self.rate_limiter is not None:
+                self.rate_limiter.defer(host, delay)
+            if attempt or delay > _MAX_RETRY_AFTER_SECONDS:
+                return resp
+            if stream:
+                await resp.aclose()
+            if self.rate_limiter is None:
+                await asyncio.sleep(delay)
+        return resp
+
+    async def gather_bounded(
+        self, fn: Callable[[T], Awaitable[R]], items: Iterable[T]
+    ) -> list[R]:
+        """Run `fn` over `items` with at most `max_concurrency` in flight, in order."""
+        slots = asyncio.Semaphore(self.max_concurrency)
+
+        async def _run(item: T) -> R:
+            async with slots:
+                return await fn(item)
+
+        return await asyncio.gather(*(_run(item) for item in items))
+
+    async def crawl_target(self, key: str, fn: Callable[[], Awaitable[R]]) -> R:
+        """
+        Crawl one target (e.g. "reddit:netsec") through the attached health
+        registry: transient failures are retried with backoff, and a target
+        whose circuit is open raises CircuitOpenError without a request.
+        """
+        if self.health is None:
+            return await fn()
+        return await self.health.call(key, fn)
 
     @abstractmethod
     async def scrape(self) -> list[RawPost]:
@@ -0,0 +1,108 @@
+"""
+Config Watcher — keeps crawler configuration live from Firestore.
+
+Instead of re-reading the `keywords`, `sources` and
+`config/credential_patterns` collections every cycle, the watcher
+attaches Firestore snapshot listeners so admin UI edits arrive within
+seconds. Listener callbacks run on Firestore's background threads; they
+hand the documents over to the event loop, where the engine compares a
+fingerprint of the relevant fields and only rebuilds analyzers, detectors
+or scrapers whose inputs actually changed.
+
+The engine calls `start()` every cycle, which re-attaches listeners that
+have died. If they can't be attached (e.g. Firestore still activating),
+the engine falls back to `poll()`, which feeds the same change handler.
+"""
+import asyncio
+import hashlib
+import json
+import logging
+from typing import Callable, Optional
+
+from app.firebase_client import get_firestore
+from app.snapshot_listeners import SnapshotListeners
+
+logger = logging.getLogger(__name__)
+
+# Change handler: (kind, documents) where kind is one of WATCHED_KINDS
+ChangeHandler = Callable[[str, list[dict]], None]
+
+WATCHED_KINDS = ("keywords", "credential_patterns", "sources")
+
+
+def fingerprint(value) -> str:
+    """Stable hash of any JSON-serializable value."""
+    payload = json.dumps(value, sort_keys=True, default=str)
+    return hashlib.sha256(payload.encode()).hexdigest()[:16]
+
+
+class ConfigWatcher:
+    """
+    Streams config changes from Firestore into a change handler on the event loop.
+
+    Usage:
+        watcher = ConfigWatcher(engine._on_config_change)
+        watcher.start(asyncio.get_running_loop())   # snapshot listeners, re-attached if dead
+        ...
+        if not watcher.listening:
+            await watcher.poll()                    # fallback
+        watcher.stop()
+    """
+
+    def __init__(self, on_change: ChangeHandler):
+        self.on_change = on_change
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._listeners = SnapshotListeners("Config", [
+            lambda: get_firestore().collection("keywords").on_snapshot(self._listener("keywords")),
+            lambda: get_firestore().collection("config").document("credential_patterns").on_snapshot(
+                self._listener("credential_patterns")
+            ),
+            lambda: get_firestore().collection("sources").on_snapshot(self._listener("sources")),
+        ])
+
+    @property
+    def listening(self) -> bool:
+        return self._listeners.alive
+
+    def start(self, loop: asyncio.AbstractEventLoop) -> bool:
+        """
+        Attach snapshot listeners, or re-attach them if any has died.
+        Returns False if Firestore is unavailable.
+        """
+        self._loop = loop
+        return self._listeners.ensure()
+
+    def stop(self) -> None:
+        """Detach all snapshot listeners."""
+        self._listeners.close()
+
+    async def poll(self) -> None:
+        """Read every watched collection once and feed the change handler."""
+
+        def _read() -> dict[str, list[dict]]:
+            db = get_firestore()
+            pattern_doc = db.collection("config").document("credential_patterns").get()
+            return {
+                "keywords": [doc.to_dict() or {} for doc in db.collection("keywords").get()],
+                "credential_patterns": [pattern_doc.to_dict() or {}] if pattern_doc.exists else [],
+                "sources": [doc.to_dict() or {} for doc in db.collection("sources").get()],
+            }
+
+        for kind, docs in (await asyncio.to_thread(_read)).items():
+            self.on_change(kind, docs)
+
+    def _listener(self, kind: str):
+        """Build a snapshot callback that forwards documents to the event loop."""
+
+        def _callback(snapshots, changes, read_time) -> None:
+            docs = [snap.to_dict() or {} for snap in snapshots if snap.exists]
+            if self._loop is not None and not self._loop.is_closed():
+                self._loop.call_soon_threadsafe(self._dispatch, kind, docs)
+
+        return _callback
+
+    def _dispatch(self, kind: str, docs: list[dict]) -> None:
+        try:
+            self.on_change(kind, docs)
+        except Exception as exc:
+            logger.error(f"Applying {kind} config change failed: {exc}", exc_info=True)
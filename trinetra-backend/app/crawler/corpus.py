@@ -0,0 +1,73 @@
+"""
+Post Corpus — capture scraped posts to compressed JSONL for offline replay.
+
+With CRAWLER_CAPTURE_DIR set, every fetch's RawPosts are appended to a
+daily `corpus-YYYYMMDD.jsonl.gz` file, one JSON object per line:
+
+    {"source_key": "Reddit Scraper", "captured_at": "...", "content": ..., "title": ..., ...}
+
+Each append is written as its own gzip member, which concatenated gzip
+readers handle transparently. `read_corpus()` streams records back for
+`python -m app.crawler.replay`.
+"""
+import asyncio
+import gzip
+import json
+import logging
+import os
+from dataclasses import asdict, fields
+from datetime import datetime, timezone
+from typing import Iterator
+
+from app.crawler.base_scraper import RawPost
+
+logger = logging.getLogger(__name__)
+
+_POST_FIELDS = {f.name for f in fields(RawPost)}
+
+
+class CorpusWriter:
+    """Appends captured posts to daily gzip JSONL files in `directory`."""
+
+    def __init__(self, directory: str):
+        self.directory = directory
+        self.captured = 0
+
+    def path_for(self, when: datetime) -> str:
+        return os.path.join(self.directory, f"corpus-{when:%Y%m%d}.jsonl.gz")
+
+    async def write(self, source_key: str, posts: list[RawPost]) -> None:
+        """Serialize on the event loop, append in a worker thread."""
+        if not posts:
+            return
+        now = datetime.now(timezone.utc)
+        captured_at = now.isoformat()
+        payload = "".join(
+            json.dumps({"source_key": source_key, "captured_at": captured_at, **asdict(post)}) + "\n"
+            for post in posts
+        )
+        try:
+            await asyncio.to_thread(self._append, self.path_for(now), payload)
+            self.captured += len(posts)
+        except OSError as exc:
+            logger.warning(f"Corpus capture failed: {exc}")
+
+    def _append(self, path: str, payload: str) -> None:
+        os.makedirs(self.directory, exist_ok=True)
+        with gzip.open(path, "at", encoding="utf-8") as fh:
+            fh.write(payload)
+
+
+def read_corpus(path: str) -> Iterator[tuple[str, RawPost]]:
+    """Yield (source_key, post) for every record in a captured corpus file."""
+    with gzip.open(path, "rt", encoding="utf-8") as fh:
+        for line_number, line in enumerate(fh, 1):
+            if not line.strip():
+                continue
+            try:
+                record = json.loads(line)
+            except ValueError:
+                logger.warning(f"{path}:{line_number}: skipping malformed record")
+                continue
+            post = RawPost(**{k: v for k, v in record.items() if k in _POST_FIELDS})
+            yield record.get("source_key", ""), post
@@ -0,0 +1,82 @@
+"""
+Cursor Store — per-source crawl watermarks persisted across restarts.
+
+Scrapers record where they stopped (Reddit `before` fullnames, the last
+seen Pastebin key, ETag/Last-Modified validators for forum pages) so the
+next cycle only fetches new items instead of re-downloading and
+re-analyzing content that was already processed.
+"""
+import asyncio
+import json
+import logging
+import os
+from typing import Optional
+
+logger = logging.getLogger(__name__)
+
+
+class CursorStore:
+    """
+    JSON-file backed map of cursor key → cursor dict.
+
+    Keys are namespaced by the scraper, e.g. "reddit:netsec",
+    "pastebin:api", "forum:https://example.com/board".
+    """
+
+    def __init__(self, path: Optional[str] = None):
+        self.path = path
+        self._cursors: dict[str, dict] = {}
+
+    def __len__(self) -> int:
+        return len(self._cursors)
+
+    def get(self, key: str) -> dict:
+        """Return a copy of the cursor for `key` (empty if none recorded)."""
+        return dict(self._cursors.get(key, {}))
+
+    def set(self, key: str, cursor: dict) -> None:
+        """Record a new cursor for `key`."""
+        self._cursors[key] = dict(cursor)
+
+    def items(self, prefix: str) -> dict[str, dict]:
+        """All cursors whose key starts with `prefix`."""
+        return {k: dict(v) for k, v in self._cursors.items() if k.startswith(prefix)}
+
+    def update(self, cursors: dict[str, dict]) -> None:
+        """Adopt cursors recorded elsewhere (e.g. carried by a crawl lease)."""
+        for key, cursor in cursors.items():
+            self._cursors[key] = dict(cursor)
+
+    def clear(self, key: str) -> None:
+        """Forget the cursor for `key` so the next fetch starts fresh."""
+        self._cursors.pop(key, None)
+
+    def load(self) -> int:
+        """Load cursors from disk. Returns the number of cursors loaded."""
+        if not self.path or not os.path.exists(self.path):
+            return 0
+        try:
+            with open(self.path, "r", encoding="utf-8") as fh:
+                self._cursors = json.load(fh)
+        except (OSError, ValueError) as exc:
+            logger.warning(f"Cursor file unreadable, crawling from scratch: {exc}")
+            self._cursors = {}
+        logger.info(f"Loaded {len(self._cursors)} crawl cursors from {self.path}")
+        return len(self._cursors)
+
+    def save_sync(self) -> None:
+        """Atomically write cursors to disk."""
+        if self.path:
+            self._write(json.dumps(self._cursors))
+
+    async def save(self) -> None:
+        """Serialize on the event loop, write the file in a worker thread."""
+        if self.path:
+            await asyncio.to_thread(self._write, json.dumps(self._cursors))
+
+    def _write(self, payload: str) -> None:
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as fh:
+            fh.write(payload)
+        os.replace(tmp_path, self.path)
@@ -0,0 +1,183 @@
+"""
+Dedup Index — local, in-memory index of already-stored threats.
+
+Replaces the per-post Firestore `where("url", "==", ...)` query with
+microsecond lookups that never touch the network:
+
+- A Bloom filter answers "definitely new" for unseen posts in O(k).
+- A bounded LRU map with a TTL confirms Bloom hits, so false positives
+  never drop a genuine threat.
+
+Keys are the post URL and a SHA-256 hash of its normalized content, so a
+repost of the same text under a new URL is also caught. The index is
+warmed from the `threats` collection at startup and checkpointed to disk
+so restarts don't start cold.
+"""
+import asyncio
+import gzip
+import hashlib
+import json
+import logging
+import math
+import os
+import re
+import time
+from collections import OrderedDict
+from typing import Optional
+
+from app.crawler.base_scraper import RawPost
+
+logger = logging.getLogger(__name__)
+
+_WHITESPACE = re.compile(r"\s+")
+
+
+def content_hash(content: str) -> str:
+    """SHA-256 of whitespace/case-normalized content."""
+    normalized = _WHITESPACE.sub(" ", content).strip().lower()
+    return hashlib.sha256(normalized.encode()).hexdigest()
+
+
+class BloomFilter:
+    """Fixed-size Bloom filter using double hashing over a BLAKE2b digest."""
+
+    def __init__(self, capacity: int, error_rate: float = 0.01):
+        capacity = max(1, capacity)
+        self.size = max(8, math.ceil(-capacity * math.log(error_rate) / (math.log(2) ** 2)))
+        self.hash_count = max(1, round(self.size / capacity * math.log(2)))
+        self._bits = bytearray((self.size + 7) // 8)
+
+    def _positions(self, key: str):
+        digest = hashlib.blake2b(key.encode(), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:], "little") | 1
+        return ((h1 + i * h2) % self.size for i in range(self.hash_count))
+
+    def add(self, key: str) -> None:
+        for pos in self._positions(key):
+            self._bits[pos >> 3] |= 1 << (pos & 7)
+
+    def __contains__(self, key: str) -> bool:
+        return all(self._bits[pos >> 3] & (1 << (pos & 7)) for pos in self._positions(key))
+
+
+class DedupIndex:
+    """
+    Bloom filter in front of a bounded LRU/TTL set of URL and content-hash keys.
+
+    Usage:
+        index = DedupIndex(capacity=200_000, ttl_seconds=30 * 86400, checkpoint_path=...)
+        index.load_checkpoint()
+        for data in stored_threats:
+            index.index_stored(data)
+        if not index.seen(post):
+            index.add(post)
+    """
+
+    def __init__(
+        self,
+        capacity: int = 200_000,
+        ttl_seconds: float = 30 * 86400,
+        checkpoint_path: Optional[str] = None,
+    ):
+        self.capacity = capacity
+        self.ttl_seconds = ttl_seconds
+        self.checkpoint_path = checkpoint_path
+        self._bloom = BloomFilter(capacity * 2)
+        self._entries: OrderedDict[str, float] = OrderedDict()  # key -> added at
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @staticmethod
+    def keys_for(url: str, content: str) -> list[str]:
+        """Index keys for a post: its URL and its content hash."""
+        keys = []
+        if url:
+            keys.append(f"url:{url}")
+        if content and content.strip():
+            keys.append(f"hash:{content_hash(content)}")
+        return keys
+
+    def seen(self, post: RawPost) -> bool:
+        """True if the post's URL or content was already indexed."""
+        return any(self._contains(key) for key in self.keys_for(post.url, post.content))
+
+    def add(self, post: RawPost) -> None:
+        """Record a post as stored."""
+        for key in self.keys_for(post.url, post.content):
+            self._add_key(key)
+
+    def discard(self, post: RawPost) -> None:
+        """Forget a post (e.g. its write failed and it should be retried)."""
+        for key in self.keys_for(post.url, post.content):
+            self._entries.pop(key, None)
+
+    def _contains(self, key: str) -> bool:
+        if key not in self._bloom:
+            return False  # Definitely never seen
+
+        added_at = self._entries.get(key)
+        if added_at is None:
+            return False  # Bloom false positive or evicted entry
+        if time.time() - added_at > self.ttl_seconds:
+            del self._entries[key]
+            return False
+
+        self._entries.move_to_end(key)
+        return True
+
+    def _add_key(self, key: str, added_at: Optional[float] = None) -> None:
+        self._bloom.add(key)
+        self._entries[key] = added_at if added_at is not None else time.time()
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.capacity:
+            self._entries.popitem(last=False)
+
+    # ═══ Warm-up & Checkpointing ═══
+
+    def index_stored(self, data: dict) -> None:
+        """Index a stored threat document (used when warming from Firestore)."""
+        if data.get("url"):
+            self._add_key(f"url:{data['url']}")
+        if data.get("content_hash"):
+            self._add_key(f"hash:{data['content_hash']}")
+
+    def load_checkpoint(self) -> int:
+        """Load entries from the on-disk checkpoint, dropping expired ones."""
+        if not self.checkpoint_path or not os.path.exists(self.checkpoint_path):
+            return 0
+
+        try:
+            with gzip.open(self.checkpoint_path, "rt", encoding="utf-8") as fh:
+                entries = json.load(fh).get("entries", [])
+        except (OSError, ValueError) as exc:
+            logger.warning(f"Dedup checkpoint unreadable, starting cold: {exc}")
+            return 0
+
+        cutoff = time.time() - self.ttl_seconds
+        loaded = 0
+        for key, added_at in entries:
+            if added_at >= cutoff:
+                self._add_key(key, added_at)
+                loaded += 1
+
+        logger.info(f"Dedup index loaded {loaded} keys from {self.checkpoint_path}")
+        return loaded
+
+    def save_checkpoint(self) -> None:
+        """Atomically write the current entries to disk."""
+        if self.checkpoint_path:
+            self._write_checkpoint(list(self._entries.items()))
+
+    async def checkpoint(self) -> None:
+        """Snapshot on the event loop, write the file in a worker thread."""
+        if self.checkpoint_path:
+            await asyncio.to_thread(self._write_checkpoint, list(self._entries.items()))
+
+    def _write_checkpoint(self, entries: list[tuple[str, float]]) -> None:
+        os.makedirs(os.path.dirname(self.checkpoint_path) or ".", exist_ok=True)
+        tmp_path = f"{self.checkpoint_path}.tmp"
+        with gzip.open(tmp_path, "wt", encoding="utf-8") as fh:
+            json.dump({"entries": entries}, fh)
+        os.replace(tmp_path, self.checkpoint_path)
@@ -7,34 +7,97 @@ This is the heart of the Trinetra intelligence pipeline.
 """
 import asyncio
 import logging
+import os
+import socket
+import time
+from dataclasses import asdict
 from datetime import datetime, timezone
 from typing import Optional
 
-from app.crawler.base_scraper import RawPost
+from app.crawler.base_scraper import BaseScraper, RawPost
+from app.crawler.corpus import CorpusWriter
+from app.crawler.cursors import CursorStore
+from app.crawler.scheduler import AdaptiveScheduler
+from app.crawler.spool import PostSpool
+from app.crawler.rate_limiter import HostRateLimiter
+from app.crawler.source_health import HealthRegistry
+from app.crawler.leases import Lease, create_lease_store
+from app.crawler.config_watcher import ConfigWatcher, fingerprint
 from app.crawler.scrapers.reddit_scraper import RedditScraper
 from app.crawler.scrapers.pastebin_scraper import PastebinScraper
-from app.crawler.scrapers.generic_scraper import GenericForumScraper
+from app.crawler.registry import SourceConfig, create_scraper
 from app.crawler.credential_detector import CredentialDetector
+from app.crawler.analysis_cache import AnalysisCache
+from app.crawler.analysis_pool import AnalysisPool, AnalysisResult, analyze_batch, config_version
+from app.crawler.threat_writer import ThreatWriter
+from app.crawler.dedup_index import DedupIndex, content_hash
+from app.crawler.near_duplicate import NearDuplicateIndex, simhash
+from app.crawler.relevance_filter import RelevanceFilter, post_text
+from app.crawler.pipeline import AnalysisPipeline, PipelineItem, PipelineStage
 from app.nlp.analyzer import NLPAnalyzer
 from app.nlp.threat_scorer import calculate_threat_score
-from app.firebase_client import get_firestore
+from app.evidence_store import EvidenceStore, get_evidence_store
+from app.firebase_client import count_writes, get_firestore
+from app.http_client import close_http_client, get_http_client
+from firebase_admin import firestore
+from app.config import settings
+from app.metrics import Counter, Histogram, current_endpoint
 
 logger = logging.getLogger(__name__)
 
+# A spooled post that fails processing this many times is given up on
+_MAX_SPOOL_ATTEMPTS = 5
+
+SCRAPER_FETCH_SECONDS = Histogram(
+    "trinetra_scraper_fetch_seconds",
+    "Time for one scraper fetch",
+    ["scraper"],
+)
+SCRAPER_ERRORS = Counter(
+    "trinetra_scraper_errors_total",
+    "Failed scraper fetches",
+    ["scraper"],
+)
+CRAWL_POSTS = Histogram(
+    "trinetra_crawl_posts",
+    "Posts returned per crawl cycle of a source",
+    ["scraper"],
+    buckets=(0, 1, 5, 10, 25, 50, 100, 250, 500, 1000),
+)
+CRAWL_CYCLE_SECONDS = Histogram(
+    "trinetra_crawl_cycle_seconds",
+    "Duration of a source's crawl cycle: fetch plus processing of its posts",
+    ["scraper"],
+    buckets=(0.1, 0.5, 1, 2.5, 5, 10, 30, 60, 120, 300, 600),
+)
+CLASSIFIER_SUPPRESSED = Counter(
+    "trinetra_classifier_suppressed_total",
+    "Keyword candidates dropped by the contextual classifier",
+)
+DETECTION_LATENCY_SECONDS = Histogram(
+    "trinetra_detection_latency_seconds",
+    "Time from a post's timestamp to its threat alert",
+    buckets=(1, 5, 15, 30, 60, 300, 900, 1800, 3600, 14400, 43200, 86400, 259200),
+)
+
 
 class CrawlerEngine:
     """
     Main orchestrator for the Trinetra threat intelligence pipeline.
 
     Pipeline flow:
-    1. Load active sources and keywords from Firestore
-    2. Execute all scrapers in parallel
-    3. For each scraped post:
-       a. Run credential detection
-       b. Run NLP analysis
-       c. Calculate threat score
-       d. If threat detected → store in Firestore + broadcast via WebSocket
-    4. Log results and schedule next run
+    1. Keep active sources, keywords and credential patterns live via
+       Firestore snapshot listeners (polled every `interval` as a fallback)
+    2. Each source runs on its own adaptive schedule; due sources are
+       fetched concurrently, up to a global cap. With several replicas,
+       a source is only fetched by the replica holding its lease
+    3. Each post flows through bounded, concurrent stages:
+       a. detect — credential detection + NLP analysis + threat score
+       b. dedup  — skip threats that were already stored
+       c. persist — store in Firestore
+       d. notify — broadcast via WebSocket + Telegram alert
+    4. The fetch's yield (posts, threats, errors) sets when that source
+       runs next
     """
 
     def __init__(self, interval_seconds: int = 300):
@@ -42,28 +105,164 @@ class CrawlerEngine:
         Initialize the crawler engine.
 
         Args:
-            interval_seconds: Time between crawl cycles (default: 5 minutes)
+            interval_seconds: Config refresh period and initial per-source
+                crawl interval (default: 5 minutes)
         """
         self.interval = interval_seconds
         self._running = False
         self._task: Optional[asyncio.Task] = None
+        self._source_tasks: set[asyncio.Task] = set()
+
+        # One adaptive schedule per source, with a global cap on concurrent fetches
+        self.scheduler = AdaptiveScheduler(
+            base_interval=interval_seconds,
+            min_interval=settings.crawler_min_interval_seconds,
+            max_interval=settings.crawler_max_interval_seconds,
+        )
+        self._fetch_slots = asyncio.Semaphore(settings.crawler_max_concurrent_fetches)
+
+        # Source leases shared with the other replicas
+        self.replica_id = settings.crawler_replica_id or f"{socket.gethostname()}-{os.getpid()}"
+        self.lease_store = create_lease_store(
+            settings.crawler_lease_backend, settings.state_path("leases.sqlite3")
+        )
+
+        # Per-source crawl watermarks and per-host politeness, shared by all scrapers
+        self.cursor_store = CursorStore(settings.state_path("cursors.json"))
+        self.rate_limiter = HostRateLimiter(
+            rate=settings.crawler_host_rate_per_second,
+            burst=settings.crawler_host_burst,
+            overrides=HostRateLimiter.parse_overrides(settings.crawler_host_rate_overrides),
+        )
+
+        # Retries, circuit breakers and fetch stats per source and per crawl target
+        self.health = HealthRegistry(
+            failure_threshold=settings.source_breaker_failures,
+            reset_seconds=settings.source_breaker_reset_seconds,
+            max_reset_seconds=settings.source_breaker_max_reset_seconds,
+            retries=settings.source_retries,
+            retry_base_seconds=settings.source_retry_base_seconds,
+            retry_max_seconds=settings.source_retry_max_seconds,
+        )
+
+        # Optional process pool that keeps CPU-bound detection (and,
+        # optionally, forum page parsing) off the event loop
+        self.analysis_pool: Optional[AnalysisPool] = None
+        if settings.analysis_processes > 0:
+            self.analysis_pool = AnalysisPool(
+                processes=settings.analysis_processes,
+                chunk_size=settings.analysis_chunk_size,
+            )
 
         # Initialize scrapers
-        self.reddit_scraper = RedditScraper()
-        self.pastebin_scraper = PastebinScraper()
-        self.generic_scraper = GenericForumScraper()
+        self.reddit_scraper = self._attach(RedditScraper())
+        self.pastebin_scraper = self._attach(PastebinScraper())
+        # One scraper per configured forum source, keyed by source key
+        self.source_scrapers: dict[str, BaseScraper] = {}
+        self._source_versions: dict[str, str] = {}
 
-        # Initialize analysis tools (will be refreshed each cycle)
+        # Initialize analysis tools (rebuilt only when their config changes)
         self.credential_detector = CredentialDetector()
         self.nlp_analyzer = NLPAnalyzer()
+        self._active_keywords: list[str] = []
+        self._custom_patterns: list[str] = []
+
+        # Results for content analyzed before, keyed by content and detector config version
+        self._analysis_version = config_version([], [])
+        self.analysis_cache: Optional[AnalysisCache[AnalysisResult]] = (
+            AnalysisCache(settings.analysis_cache_size) if settings.analysis_cache_size > 0 else None
+        )
+
+        # Contextual classifier that drops keyword candidates analysts would dismiss
+        self.relevance: Optional[RelevanceFilter] = None
+        if settings.classifier_enabled:
+            self.relevance = RelevanceFilter(
+                settings.state_path("relevance_model.npz"),
+                threshold=settings.classifier_threshold,
+                min_labels=settings.classifier_min_labels,
+                bits=settings.classifier_hash_bits,
+                learning_rate=settings.classifier_learning_rate,
+            )
+
+        # Live keywords / credential patterns / sources from Firestore
+        self.config_watcher = ConfigWatcher(self._on_config_change)
+        self._config_versions: dict[str, str] = {}
+
+        # Local index of stored threats (replaces per-post Firestore queries)
+        self.dedup_index = DedupIndex(
+            capacity=settings.dedup_capacity,
+            ttl_seconds=settings.dedup_ttl_days * 86400,
+            checkpoint_path=settings.state_path("dedup_index.json.gz"),
+        )
 
-    async def start(self) -> None:
-        """Start the crawl loop as an async background task."""
+        # SimHash index that merges re-pasted/cross-posted leaks into one threat
+        self.near_dup_index = NearDuplicateIndex(
+            threshold=settings.near_duplicate_threshold,
+            capacity=settings.near_duplicate_capacity,
+        )
+        # Threats claimed by the dedup stage but not committed yet, with the
+        # sightings of their near-duplicates waiting for that commit
+        self._uncommitted: dict[str, list[dict]] = {}
+
+        # Batches threat writes; notifications wait for the commit
+        self.threat_writer = ThreatWriter(
+            batch_size=settings.threat_write_batch_size,
+            flush_interval=settings.threat_write_flush_seconds,
+        )
+
+        # Full evidence goes to a content-addressed store; threat docs keep a digest + snippet
+        self.evidence_store: Optional[EvidenceStore] = None
+        try:
+            self.evidence_store = get_evidence_store()
+        except Exception as exc:
+            logger.warning(f"Evidence store unavailable, keeping evidence inline: {exc}")
+
+        # Optional capture of fetched posts for `python -m app.crawler.replay`
+        self.corpus: Optional[CorpusWriter] = (
+            CorpusWriter(settings.crawler_capture_dir) if settings.crawler_capture_dir else None
+        )
+
+        # Durable spool: fetched posts survive crashes and Firestore outages
+        self.spool: Optional[PostSpool] = None
+        if settings.spool_enabled:
+            self.spool = PostSpool(
+                settings.state_path("spool"),
+                segment_bytes=settings.spool_segment_mb * 1024 * 1024,
+                max_bytes=settings.spool_max_mb * 1024 * 1024,
+            )
+        self._spool_in_flight: set[int] = set()
+        self._spool_attempts: dict[int, int] = {}
+        self._requeue_task: Optional[asyncio.Task] = None
+
+        # Staged analysis pipeline (workers are spawned on start)
+        self.pipeline = self._build_pipeline()
+
+    async def start(self, crawl: bool = True) -> None:
+        """
+        Start the analysis pipeline and the crawl loop as background tasks.
+        With `crawl=False` only the analysis path runs and posts are fed
+        through `pipeline.submit()` (used by corpus replay).
+        """
         if self._running:
             logger.warning("Crawler engine is already running")
             return
 
         self._running = True
+        # Firestore reads/writes from the crawler's tasks are attributed to it
+        current_endpoint.set("crawler")
+        if self.analysis_pool:
+            self.analysis_pool.start()
+        if self.relevance:
+            await asyncio.to_thread(self.relevance.load)
+        await self.threat_writer.start()
+        await self.pipeline.start()
+        if not crawl:
+            return
+
+        if self.spool:
+            await asyncio.to_thread(self.spool.open)
+        self.cursor_store.load()
+        get_http_client()  # Shared connection pool, reused by every fetch
         self._task = asyncio.create_task(self._crawl_loop())
         logger.info(
             f"Crawler engine started. Interval: {self.interval}s"
@@ -78,155 +277,648 @@ class CrawlerEngine:
                 await self._task
             except asyncio.CancelledError:
                 pass
+        tasks = [*self._source_tasks, *([self._requeue_task] if self._requeue_task else [])]
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        self.config_watcher.stop()
+        await self.pipeline.stop()
+        await self.threat_writer.stop()
+        if self.spool:
+            self.spool.close()
+        self.dedup_index.save_checkpoint()
+        self.cursor_store.save_sync()
+        if self.analysis_pool:
+            self.analysis_pool.shutdown()
+        await close_http_client()
         logger.info("Crawler engine stopped")
 
     async def _crawl_loop(self) -> None:
-        """Main crawl loop — runs indefinitely until stopped."""
+        """
+        Main crawl loop — runs indefinitely until stopped.
+        Attaches config listeners (retried every `interval` until they
+        attach) and launches each source as soon as its own schedule
+        makes it due.
+        """
+        await self._warm_indexes()
+        next_refresh = 0.0
+
         while self._running:
             try:
-                logger.info("═══ Starting crawl cycle ═══")
-                await self._execute_cycle()
-                logger.info(
-                    f"═══ Crawl cycle complete. Next in {self.interval}s ═══"
-                )
+                now = time.monotonic()
+                if now >= next_refresh:
+                    await self._refresh_config()
+                    self.scheduler.sync(self._sources())
+                    await self.dedup_index.checkpoint()
+                    if self._requeue_task is None or self._requeue_task.done():
+                        # Its own task: re-queuing waits on a full pipeline, scheduling must not
+                        self._requeue_task = asyncio.create_task(self._requeue_spooled())
+                    await self._publish_health()
+                    await self._train_relevance()
+                    next_refresh = now + self.interval
+
+                for key in self.scheduler.pop_due(now):
+                    task = asyncio.create_task(self._run_source(key))
+                    self._source_tasks.add(task)
+                    task.add_done_callback(self._source_tasks.discard)
+
+                delay = min(self.scheduler.seconds_until_next(), next_refresh - time.monotonic())
             except Exception as exc:
-                logger.error(f"Crawl cycle failed: {exc}", exc_info=True)
+                logger.error(f"Crawl scheduling failed: {exc}", exc_info=True)
+                delay = 5.0
 
-            # Wait for next cycle
+            # Sleep until the next source is due (or the next config refresh)
             try:
-                await asyncio.sleep(self.interval)
+                await asyncio.sleep(max(delay, 0.5))
             except asyncio.CancelledError:
                 break
 
-    async def _execute_cycle(self) -> None:
-        """Execute a single crawl-analyze-store cycle."""
-        # Step 1: Refresh configuration from Firestore
-        await self._refresh_config()
+    def _attach(self, scraper):
+        """Wire a scraper to the engine's shared cursor store, rate limiter, health registry and pools."""
+        scraper.cursors = self.cursor_store
+        scraper.rate_limiter = self.rate_limiter
+        scraper.health = self.health
+        if scraper.max_page_bytes is None:
+            scraper.max_page_bytes = settings.scraper_max_page_kb * 1024
+        scraper.parse_pool = self.analysis_pool if settings.scraper_parse_in_pool else None
+        scraper.max_concurrency = settings.scraper_max_concurrency
+        return scraper
+
+    def _sources(self) -> dict:
+        """Enabled scrapers keyed by source key (the scraper name)."""
+        scrapers = [self.reddit_scraper, self.pastebin_scraper, *self.source_scrapers.values()]
+        return {scraper.name: scraper for scraper in scrapers if scraper.enabled}
+
+    async def _run_source(self, key: str) -> None:
+        """
+        Fetch one source, push its posts through the pipeline, wait for
+        them to be processed, then reschedule the source based on its yield.
+        Sources leased by another replica are skipped until the lease ends,
+        and sources whose circuit breaker is open until their cool-down ends.
+        """
+        lease = await self._claim_lease(key)
+        if lease is not None and not lease.acquired:
+            self.scheduler.defer(key, lease.expires_at - time.time())
+            return
 
-        # Step 2: Scrape from all sources in parallel
-        raw_posts = await self._scrape_all()
-        logger.info(f"Total posts scraped: {len(raw_posts)}")
+        heartbeat = asyncio.create_task(self._renew_lease(key)) if lease else None
+        scraper: Optional[BaseScraper] = None
+        posts: list[RawPost] = []
+        threats = 0
+        failed = False
+        skip_for: Optional[float] = None
+        try:
+            scraper = self._sources().get(key)
+            if scraper is None:
+                return
+            if not self.health.allow(key):
+                skip_for = self.health.retry_in(key)
+                return
+            if lease:
+                self.cursor_store.update(lease.cursors)
+
+            async with self._fetch_slots:
+                started = time.monotonic()
+                error: Optional[Exception] = None
+                try:
+                    posts = await scraper.scrape()
+                except Exception as exc:
+                    failed, error = True, exc
+                    logger.warning(f"Scraper {scraper.name} failed: {exc}")
+                fetch_seconds = time.monotonic() - started
+                SCRAPER_FETCH_SECONDS.labels(key).observe(fetch_seconds)
+                self.health.record(key, not failed, fetch_seconds, error)
+
+            if self.corpus:
+                await self.corpus.write(key, posts)
+
+            if failed:
+                scraper.discard_cursors()  # The posts of the targets that did succeed were lost too
+
+            if self.spool:
+                # Once spooled, the posts are durable and the cursors may advance
+                seqs = await self.spool.append(key, posts)
+                # In flight from now on, so a concurrent re-queue doesn't submit them again
+                self._spool_in_flight.update(seqs)
+                scraper.commit_cursors()
+                await self.cursor_store.save()
+            else:
+                seqs = [None] * len(posts)
+
+            done = []
+            try:
+                for post, seq in zip(posts, seqs):
+                    done.append(await self._submit(post, key, seq))
+            except BaseException:
+                # Not submitted: leave them to the next re-queue
+                self._spool_in_flight.difference_update(
+                    seq for seq in seqs[len(done):] if seq is not None
+                )
+                raise
+            if not self.spool:
+                scraper.commit_cursors()
+            threats = sum(await asyncio.gather(*done))
+
+            # Without a spool, cursors only advance on disk once the posts are processed
+            await self.cursor_store.save()
+            if self.spool:
+                await self.spool.flush_acks()
+
+            CRAWL_POSTS.labels(key).observe(len(posts))
+            CRAWL_CYCLE_SECONDS.labels(key).observe(time.monotonic() - started)
+            logger.info(
+                f"{key}: {len(posts)} posts, {threats} threats "
+                f"in {time.monotonic() - started:.1f}s"
+            )
+        except Exception as exc:
+            failed = True
+            logger.error(f"Crawl of {key} failed: {exc}", exc_info=True)
+        finally:
+            if scraper is not None:
+                scraper.discard_cursors()  # Nothing left staged unless the posts were lost
+            if heartbeat:
+                heartbeat.cancel()
+            if failed:
+                SCRAPER_ERRORS.labels(key).inc()
+            if skip_for is not None:
+                self.scheduler.defer(key, skip_for)
+            else:
+                self.scheduler.record(key, posts=len(posts), threats=threats, failed=failed)
+            if lease:
+                await self._release_lease(key)
+
+    async def _submit(self, post: RawPost, key: str, seq: Optional[int]) -> asyncio.Future:
+        """Queue a post for analysis, tracking its spool entry while in flight."""
+        if seq is not None:
+            self._spool_in_flight.add(seq)
+        return await self.pipeline.submit(post, source_key=key, spool_seq=seq)
+
+    def _on_item_done(self, item: PipelineItem, stored: bool) -> None:
+        """Acknowledge a spooled post unless its processing failed (then it is retried)."""
+        if item.threat_id:
+            orphaned = self._uncommitted.pop(item.threat_id, None)
+            if orphaned:
+                logger.warning(
+                    f"Dropping {len(orphaned)} sighting(s) of {item.threat_id}: it was not stored"
+                )
 
-        if not raw_posts:
-            logger.info("No new posts found this cycle")
+        seq = item.spool_seq
+        if seq is None or self.spool is None:
             return
+        self._spool_in_flight.discard(seq)
 
-        # Step 3: Analyze each post
-        threats_found = 0
-        for post in raw_posts:
-            try:
-                is_stored = await self._analyze_and_store(post)
-                if is_stored:
-                    threats_found += 1
-            except Exception as exc:
-                logger.warning(f"Failed to analyze post: {exc}")
+        if item.failed:
+            attempts = self._spool_attempts.get(seq, 0) + 1
+            if attempts < _MAX_SPOOL_ATTEMPTS:
+                self._spool_attempts[seq] = attempts
+                return
+            logger.warning(f"Giving up on spooled post after {attempts} attempts: {item.post.url}")
 
-        logger.info(f"Threats detected and stored: {threats_found}")
+        self._spool_attempts.pop(seq, None)
+        self.spool.ack(seq)
 
-    async def _refresh_config(self) -> None:
-        """Load active sources and keywords from Firestore."""
+    async def _requeue_spooled(self) -> None:
+        """Re-submit spooled posts left unprocessed by a failure or a restart."""
+        if self.spool is None:
+            return
+        await self.spool.flush_acks()
+        try:
+            pending = await asyncio.to_thread(self.spool.pending, set(self._spool_in_flight))
+        except OSError as exc:
+            logger.warning(f"Reading the post spool failed: {exc}")
+            return
+        if not pending:
+            return
+
+        logger.info(f"Re-queuing {len(pending)} unprocessed posts from the spool")
+        for entry in pending:
+            # Appended (or re-queued) since the snapshot was taken
+            if entry.seq in self._spool_in_flight:
+                continue
+            await self._submit(entry.post, entry.source_key, entry.seq)
+
+    async def _claim_lease(self, key: str) -> Optional[Lease]:
+        """Claim the source's lease (None when leases are off or the store is unreachable)."""
+        if self.lease_store is None:
+            return None
         try:
-            db = get_firestore()
-
-            # Load custom keywords for NLP analyzer
-            keyword_docs = db.collection("keywords").get()
-            active_keywords = [
-                doc.to_dict().get("term", "")
-                for doc in keyword_docs
-                if doc.to_dict().get("active", False)
-            ]
-            self.nlp_analyzer = NLPAnalyzer(custom_keywords=active_keywords)
-
-            # Load custom credential patterns
-            config_doc = db.collection("config").document("credential_patterns").get()
-            custom_patterns = []
-            if config_doc.exists:
-                patterns_str = config_doc.to_dict().get("patterns", "")
-                custom_patterns = [
-                    p.strip() for p in patterns_str.split("\n") if p.strip()
-                ]
-            self.credential_detector = CredentialDetector(
-                custom_patterns=custom_patterns
+            return await asyncio.to_thread(
+                self.lease_store.claim, key, self.replica_id, settings.crawler_lease_seconds
             )
+        except Exception as exc:
+            logger.warning(f"Lease claim for {key} failed, crawling unleased: {exc}")
+            return None
+
+    async def _renew_lease(self, key: str) -> None:
+        """Keep the lease alive while a long fetch is still running."""
+        ttl = settings.crawler_lease_seconds
+        while True:
+            await asyncio.sleep(ttl / 3)
+            try:
+                if not await asyncio.to_thread(self.lease_store.renew, key, self.replica_id, ttl):
+                    logger.warning(f"Lease on {key} was taken over by another replica")
+                    return
+            except Exception as exc:
+                logger.warning(f"Lease renewal for {key} failed: {exc}")
+
+    async def _release_lease(self, key: str) -> None:
+        """Hand the source back, holding it until its next run and sharing its cursors."""
+        schedule = self.scheduler.snapshot().get(key)
+        scraper = self._sources().get(key)
+        cursors = self.cursor_store.items(scraper.cursor_prefix) if scraper and scraper.cursor_prefix else {}
+        hold = schedule.next_run - time.monotonic() if schedule else 0.0
+        try:
+            await asyncio.to_thread(
+                self.lease_store.release, key, self.replica_id, max(hold, 0.0), cursors
+            )
+        except Exception as exc:
+            logger.warning(f"Lease release for {key} failed: {exc}")
 
-            # Load active source URLs for generic scraper
-            source_docs = db.collection("sources").get()
-            generic_urls = []
-            for doc in source_docs:
-                data = doc.to_dict()
-                if data.get("active", False) and data.get("url"):
-                    source_type = data.get("type", "").lower()
-                    if source_type not in ("reddit", "pastebin"):
-                        generic_urls.append(data["url"])
+    async def _publish_health(self) -> None:
+        """
+        Share this replica's source health through Firestore, so API
+        replicas (and the other crawler replicas) can serve it.
+        """
+        snapshot = self.health.snapshot()
+        if not snapshot:
+            return
+        doc = {
+            "replica": self.replica_id,
+            "updated_at": datetime.now(timezone.utc).isoformat(),
+            "sources": snapshot,
+        }
+        try:
+            doc_ref = get_firestore().collection("source_health").document(self.replica_id)
+            await asyncio.to_thread(doc_ref.set, doc)
+        except Exception as exc:
+            logger.warning(f"Publishing source health failed: {exc}")
 
-            self.generic_scraper = GenericForumScraper(urls=generic_urls)
+    async def _warm_indexes(self) -> None:
+        """
+        Load the dedup checkpoint, then index every stored threat's URL,
+        content hash and SimHash fingerprint from Firestore.
+        """
+        self.dedup_index.load_checkpoint()
 
-            logger.info(
-                f"Config refreshed: {len(active_keywords)} keywords, "
-                f"{len(custom_patterns)} custom patterns, "
-                f"{len(generic_urls)} generic URLs"
+        def _load() -> list[tuple[str, dict]]:
+            query = get_firestore().collection("threats").select(
+                ["url", "content_hash", "simhash"]
             )
+            return [(doc.id, doc.to_dict() or {}) for doc in query.stream()]
+
+        try:
+            stored = await asyncio.to_thread(_load)
         except Exception as exc:
-            logger.warning(f"Config refresh failed, using defaults: {exc}")
+            logger.warning(f"Dedup index warm-up from Firestore failed: {exc}")
+            return
 
-    async def _scrape_all(self) -> list[RawPost]:
-        """Execute all scrapers in parallel and collect results."""
-        tasks = []
+        for threat_id, data in stored:
+            self.dedup_index.index_stored(data)
+            if data.get("simhash"):
+                self.near_dup_index.add(threat_id, int(data["simhash"], 16))
 
-        if self.reddit_scraper.enabled:
-            tasks.append(self._safe_scrape(self.reddit_scraper))
-        if self.pastebin_scraper.enabled:
-            tasks.append(self._safe_scrape(self.pastebin_scraper))
-        if self.generic_scraper.enabled and self.generic_scraper.urls:
-            tasks.append(self._safe_scrape(self.generic_scraper))
+        logger.info(
+            f"Dedup indexes warmed: {len(stored)} threats, "
+            f"{len(self.dedup_index)} keys, {len(self.near_dup_index)} fingerprints"
+        )
 
-        results = await asyncio.gather(*tasks)
+    async def _refresh_config(self) -> None:
+        """
+        Keep config live: attach Firestore snapshot listeners (re-attaching
+        any that died), or poll the config collections once if listeners
+        can't be attached.
+        """
+        if self.config_watcher.start(asyncio.get_running_loop()):
+            return
+        try:
+            await self.config_watcher.poll()
+        except Exception as exc:
+            logger.warning(f"Config refresh failed, using current config: {exc}")
 
-        # Flatten all post lists
-        all_posts: list[RawPost] = []
-        for post_list in results:
-            all_posts.extend(post_list)
+    def _on_config_change(self, kind: str, docs: list[dict]) -> None:
+        """
+        Apply a config snapshot. Analyzers, detectors and scrapers are only
+        rebuilt when the fields they are built from actually changed.
+        """
+        if kind == "keywords":
+            inputs = sorted(
+                doc.get("term", "") for doc in docs if doc.get("active", False)
+            )
+        elif kind == "credential_patterns":
+            patterns_str = docs[0].get("patterns", "") if docs else ""
+            inputs = [p.strip() for p in patterns_str.split("\n") if p.strip()]
+        elif kind == "sources":
+            configs = [config for config in map(SourceConfig.from_doc, docs) if config]
+            inputs = sorted((asdict(config) for config in configs), key=lambda c: c["key"])
+        else:
+            return
 
-        return all_posts
+        version = fingerprint(inputs)
+        if self._config_versions.get(kind) == version:
+            return
+        self._config_versions[kind] = version
 
-    async def _safe_scrape(self, scraper) -> list[RawPost]:
-        """Wrapper to safely execute a scraper with error handling."""
-        try:
-            return await scraper.scrape()
-        except Exception as exc:
-            logger.warning(f"Scraper {scraper.name} failed: {exc}")
-            return []
+        if kind == "keywords":
+            self._active_keywords = inputs
+            self.nlp_analyzer = NLPAnalyzer(custom_keywords=inputs)
+        elif kind == "credential_patterns":
+            self._custom_patterns = inputs
+            self.credential_detector = CredentialDetector(custom_patterns=inputs)
+        else:
+            self._apply_sources(configs)
+
+        if kind != "sources":
+            self._analysis_version = config_version(self._active_keywords, self._custom_patterns)
+            if self.analysis_pool:
+                self.analysis_pool.configure(self._active_keywords, self._custom_patterns)
+
+        logger.info(f"Config updated ({kind}, version {version}): {len(inputs)} entries")
 
-    async def _analyze_and_store(self, post: RawPost) -> bool:
+    def _apply_sources(self, configs: list[SourceConfig]) -> None:
         """
-        Analyze a single post for threats. If a threat is detected,
-        store it in Firestore and broadcast via WebSocket.
+        Rebuild the per-source scrapers. A scraper whose source settings did
+        not change is kept as is, so its compiled selectors are reused.
+        """
+        scrapers: dict[str, BaseScraper] = {}
+        versions: dict[str, str] = {}
+        for config in configs:
+            version = fingerprint(asdict(config))
+            current = self.source_scrapers.get(config.key)
+            if current is not None and self._source_versions.get(config.key) == version:
+                scrapers[config.key], versions[config.key] = current, version
+                continue
+            try:
+                scraper = create_scraper(config)
+            except Exception as exc:
+                logger.warning(f"Cannot build scraper for source {config.url}: {exc}")
+                continue
+            if scraper is not None:
+                scrapers[config.key] = self._attach(scraper)
+                versions[config.key] = version
+
+        self.source_scrapers = scrapers
+        self._source_versions = versions
+        self.scheduler.sync(self._sources())
+
+    def _build_pipeline(self) -> AnalysisPipeline:
+        """Wire the engine's stage handlers into a staged pipeline."""
+        # Detection is batched so a full batch can be spread across the process pool
+        detect_batch = settings.analysis_chunk_size * max(1, settings.analysis_processes)
+        return AnalysisPipeline(
+            [
+                PipelineStage(
+                    "detect",
+                    self._detect_stage,
+                    settings.pipeline_detect_workers,
+                    batch_size=detect_batch,
+                ),
+                PipelineStage("dedup", self._dedup_stage, settings.pipeline_dedup_workers),
+                PipelineStage(
+                    "persist",
+                    self._persist_stage,
+                    settings.pipeline_persist_workers,
+                    batch_size=settings.threat_write_batch_size,
+                ),
+                PipelineStage("notify", self._notify_stage, settings.pipeline_notify_workers),
+            ],
+            queue_size=settings.pipeline_queue_size,
+            on_done=self._on_item_done,
+        )
 
-        Returns True if a threat was stored.
+    async def _detect_stage(
+        self, items: list[PipelineItem]
+    ) -> list[Optional[PipelineItem]]:
         """
-        # Run credential detection
-        cred_matches = self.credential_detector.scan(post.content)
+        Run credential detection and NLP analysis on a batch of posts,
+        in the process pool when one is configured, then score each result.
+        Drops posts that are not threats or score too low.
+        """
+        analyses = await self._analyze([item.post.content for item in items])
+
+        scored = [
+            self._score_item(item, cred_matches, nlp_result)
+            for item, (cred_matches, nlp_result) in zip(items, analyses)
+        ]
+        if self.relevance:
+            self._filter_relevance(scored)
+        return scored
 
-        # Run NLP analysis
-        nlp_result = self.nlp_analyzer.analyze(post.content)
+    async def _analyze(self, contents: list[str]) -> list[AnalysisResult]:
+        """
+        Detection results for a batch, in input order. Content in the analysis
+        cache is not analyzed again, and repeats within the batch only once.
+        """
+        version = self._analysis_version
+        results: list[Optional[AnalysisResult]] = [None] * len(contents)
+        pending: dict[str, list[int]] = {}
+        for i, content in enumerate(contents):
+            cached = (
+                self.analysis_cache.get(content, version) if self.analysis_cache is not None else None
+            )
+            if cached is None:
+                pending.setdefault(content, []).append(i)
+            else:
+                results[i] = cached
+        if not pending:
+            return results
+
+        unique = list(pending)
+        if self.analysis_pool:
+            fresh = await self.analysis_pool.analyze(unique)
+        else:
+            fresh = analyze_batch(self.credential_detector, self.nlp_analyzer, unique)
+
+        # Results for a config that changed meanwhile are used but not cached
+        cache = self.analysis_cache if version == self._analysis_version else None
+        for content, result in zip(unique, fresh):
+            if cache is not None:
+                cache.put(content, version, result)
+            for i in pending[content]:
+                results[i] = result
+        return results
+
+    def _filter_relevance(self, scored: list[Optional[PipelineItem]]) -> None:
+        """Score keyword candidates with the contextual classifier; drop the unlikely ones in place."""
+        candidates = [i for i, item in enumerate(scored) if item is not None]
+        if not candidates:
+            return
+        probabilities = self.relevance.score(
+            [post_text(scored[i].post.title, scored[i].post.content) for i in candidates]
+        )
+        for i, probability in zip(candidates, probabilities):
+            item = scored[i]
+            item.relevance = float(probability)
+            if not self.relevance.keep(item.relevance, bool(item.cred_matches)):
+                CLASSIFIER_SUPPRESSED.inc()
+                logger.debug(f"Classifier dropped {item.post.url} (p={item.relevance:.2f})")
+                scored[i] = None
+
+    async def _train_relevance(self) -> None:
+        """Update the contextual classifier with new analyst triage labels."""
+        if not self.relevance:
+            return
+        try:
+            await self.relevance.train_from_triage(self.evidence_store)
+        except Exception as exc:
+            logger.warning(f"Classifier training from triage failed: {exc}")
 
+    @staticmethod
+    def _score_item(
+        item: PipelineItem, cred_matches: list, nlp_result
+    ) -> Optional[PipelineItem]:
+        """Score an analyzed post; returns None if it is not worth storing."""
         # If neither analysis found anything, skip
         if not nlp_result.is_threat and not cred_matches:
-            return False
+            return None
 
         # Calculate unified threat score
         threat_score = calculate_threat_score(nlp_result, cred_matches)
 
         # Skip very low-score detections (likely false positives)
         if threat_score["score"] < 20:
-            return False
+            return None
+
+        item.cred_matches = cred_matches
+        item.nlp_result = nlp_result
+        item.threat_score = threat_score
+        return item
 
-        # Check for duplicates (skip if very similar content already exists)
-        if await self._is_duplicate(post):
-            return False
+    async def _dedup_stage(self, item: PipelineItem) -> Optional[PipelineItem]:
+        """
+        Drop candidates that were already stored as threats, and merge
+        near-duplicates into the existing threat as an extra sighting.
+        New candidates are claimed in both indexes right away so a repost
+        later in the same cycle is caught too.
+        """
+        post = item.post
+        if self._is_duplicate(post):
+            return None
+
+        item.fingerprint = simhash(post.content)
+        if item.fingerprint is not None:
+            original_id = self.near_dup_index.find(item.fingerprint)
+            if original_id:
+                self.dedup_index.add(post)
+                sighting = {
+                    "url": post.url,
+                    "source": post.source_name,
+                    "timestamp": post.timestamp,
+                }
+                waiting = self._uncommitted.get(original_id)
+                if waiting is not None:
+                    # The original is still on its way to Firestore; record once it is committed
+                    waiting.append(sighting)
+                else:
+                    await self._record_sightings(original_id, [sighting])
+                return None
+
+        item.threat_id = self._generate_threat_id(post)
+        self.dedup_index.add(post)
+        self._uncommitted[item.threat_id] = []
+        if item.fingerprint is not None:
+            self.near_dup_index.add(item.threat_id, item.fingerprint)
+        return item
+
+    async def _record_sightings(self, threat_id: str, sightings: list[dict]) -> None:
+        """
+        Attach near-duplicate posts to an existing (committed) threat instead
+        of alerting again. Every sighting is counted, but only the first
+        `near_duplicate_max_sightings` are listed on the document, which
+        would otherwise grow toward Firestore's 1 MiB limit for pastes that
+        are reposted over and over. The cap is checked and the sightings are
+        written in one transaction, so concurrent sightings can't overshoot it.
+        """
+        db = get_firestore()
+        doc_ref = db.collection("threats").document(threat_id)
+
+        @firestore.transactional
+        def _write(transaction) -> None:
+            snapshot = doc_ref.get(field_paths=["sighting_count"], transaction=transaction)
+            count = (snapshot.to_dict() or {}).get("sighting_count", 1)
+            room = settings.near_duplicate_max_sightings - (count - 1)
+            update = {
+                "sighting_count": count + len(sightings),
+                "last_seen": sightings[-1]["timestamp"],
+            }
+            if room > 0:
+                update["sightings"] = firestore.ArrayUnion(sightings[:room])
+            transaction.update(doc_ref, update)
+
+        try:
+            await asyncio.to_thread(_write, db.transaction())
+            count_writes()
+            for sighting in sightings:
+                logger.info(f"Near-duplicate merged into {threat_id}: {sighting['url']}")
+        except Exception as exc:
+            logger.warning(f"Failed to record {len(sightings)} sighting(s) on {threat_id}: {exc}")
+
+    async def _persist_stage(
+        self, items: list[PipelineItem]
+    ) -> list[Optional[PipelineItem]]:
+        """
+        Store full evidence, build threat documents and hand them to the
+        batching writer. Only items whose write was committed move on to
+        notification.
+        """
+        evidence = await asyncio.gather(*(self._store_evidence(item.post) for item in items))
+        for item, stored_evidence in zip(items, evidence):
+            item.threat_doc = self._build_threat_doc(item, stored_evidence)
+
+        results = await asyncio.gather(
+            *(
+                self.threat_writer.submit(item.threat_doc["id"], item.threat_doc)
+                for item in items
+            ),
+            return_exceptions=True,
+        )
+
+        stored: list[Optional[PipelineItem]] = []
+        for item, result in zip(items, results):
+            if isinstance(result, BaseException):
+                # Already reported per document by the writer; allow a retry
+                item.failed = True
+                self.dedup_index.discard(item.post)
+                self.near_dup_index.discard(item.threat_doc["id"])
+                stored.append(None)
+                continue
+
+            logger.info(
+                f"NEW THREAT: [{item.threat_score['severity']}] {item.post.title[:50]} "
+                f"(score: {item.threat_score['score']}, source: {item.post.source_name})"
+            )
+            sightings = self._uncommitted.pop(item.threat_doc["id"], None)
+            if sightings:
+                await self._record_sightings(item.threat_doc["id"], sightings)
+            stored.append(item)
+        return stored
 
-        # Build threat document
-        threat_id = self._generate_threat_id(post)
+    async def _store_evidence(self, post: RawPost) -> Optional[tuple[str, int]]:
+        """
+        Put the post's full content in the evidence store.
+        Returns (digest, size in bytes), or None to keep the evidence inline.
+        """
+        if self.evidence_store is None:
+            return None
+        data = (post.full_content or post.content).encode("utf-8")
+        max_bytes = settings.evidence_max_kb * 1024
+        if len(data) > max_bytes:
+            data = data[:max_bytes].decode("utf-8", errors="ignore").encode("utf-8")
+        try:
+            digest = await asyncio.to_thread(self.evidence_store.put, data)
+        except Exception as exc:
+            logger.warning(f"Storing evidence for {post.url} failed, keeping it inline: {exc}")
+            return None
+        return digest, len(data)
+
+    def _build_threat_doc(
+        self, item: PipelineItem, evidence: Optional[tuple[str, int]] = None
+    ) -> dict:
+        """Build the Firestore threat document for a scored post."""
+        post = item.post
+        nlp_result = item.nlp_result
+        threat_score = item.threat_score
+
+        threat_id = item.threat_id or self._generate_threat_id(post)
         threat_doc = {
             "id": threat_id,
             "title": post.title[:200] or f"Alert from {post.source_name}",
@@ -236,26 +928,33 @@ class CrawlerEngine:
             "severity": threat_score["severity"],
             "credibility": threat_score["credibility"],
             "timestamp": post.timestamp,
+            "detected_at": datetime.now(timezone.utc).isoformat(),  # Threat relay picks up new docs by this
             "status": "New",
-            "rawEvidence": post.content[:2000],  # Store first 2000 chars
+            "rawEvidence": post.content[:2000],  # Store first 2000 chars (no evidence store)
             "details": threat_score["detail_summary"],
             "location": None,  # Could be enriched with GeoIP later
             "url": post.url,
+            "content_hash": content_hash(post.content),
+            "simhash": f"{item.fingerprint:016x}" if item.fingerprint is not None else None,
+            "sighting_count": 1,
             "matched_keywords": nlp_result.matched_keywords[:10],
-            "credential_types": [m.type for m in cred_matches],
+            "credential_types": [m.type for m in item.cred_matches],
             "entities_found": nlp_result.entities_found[:10],
+            "relevance": round(item.relevance, 3) if item.relevance is not None else None,
         }
-
-        # Store in Firestore
-        db = get_firestore()
-        db.collection("threats").document(threat_id).set(threat_doc)
-
-        logger.info(
-            f"NEW THREAT: [{threat_score['severity']}] {post.title[:50]} "
-            f"(score: {threat_score['score']}, source: {post.source_name})"
-        )
-
-        # Broadcast via WebSocket
+        if evidence is not None:
+            # Full text is served by GET /api/threats/{id}/evidence
+            digest, size = evidence
+            threat_doc["rawEvidence"] = post.content[:settings.evidence_snippet_chars]
+            threat_doc["evidence_digest"] = digest
+            threat_doc["evidence_size"] = size
+        return threat_doc
+
+    async def _notify_stage(self, item: PipelineItem) -> Optional[PipelineItem]:
+        """Broadcast a stored threat and alert on Critical/High severity."""
+        threat_doc = item.threat_doc
+
+        # Broadcast via WebSocket (a standalone worker has no clients; the API's threat relay does it)
         try:
             from app.routers.websocket import broadcast_threat
             await broadcast_threat(threat_doc)
@@ -263,7 +962,7 @@ class CrawlerEngine:
             logger.warning(f"WebSocket broadcast failed: {exc}")
 
         # Send Telegram Alert for Critical & High Threats
-        if threat_doc["severity"] in ["Critical", "High"]:
+        if settings.telegram_alerts_enabled and threat_doc["severity"] in ["Critical", "High"]:
             try:
                 from app.services.telegram_service import send_telegram_alert
                 # Fire and forget task
@@ -271,24 +970,24 @@ class CrawlerEngine:
             except Exception as exc:
                 logger.warning(f"Failed to trigger Telegram alert: {exc}")
 
-        return True
+        try:
+            posted = datetime.fromisoformat(item.post.timestamp.replace("Z", "+00:00"))
+            if posted.tzinfo is None:
+                posted = posted.replace(tzinfo=timezone.utc)
+            DETECTION_LATENCY_SECONDS.observe(
+                max(0.0, (datetime.now(timezone.utc) - posted).total_seconds())
+            )
+        except (ValueError, AttributeError):
+            pass
+
+        return item
 
-    async def _is_duplicate(self, post: RawPost) -> bool:
+    def _is_duplicate(self, post: RawPost) -> bool:
         """
-        Simple duplicate check — looks for threats from the same URL
-        that were already stored.
+        Duplicate check against the local dedup index — matches threats
+        already stored with the same URL or the same content.
         """
-        if not post.url:
-            return False
-
-        db = get_firestore()
-        existing = (
-            db.collection("threats")
-            .where("url", "==", post.url)
-            .limit(1)
-            .get()
-        )
-        return len(existing) > 0
+        return self.dedup_index.seen(post)
 
     @staticmethod
     def _generate_threat_id(post: RawPost) -> str:
@@ -311,5 +1010,5 @@ def get_engine() -> CrawlerEngine:
     """Get or create the singleton crawler engine instance."""
     global _engine
     if _engine is None:
-        _engine = CrawlerEngine()
+        _engine = CrawlerEngine(interval_seconds=settings.crawler_interval_seconds)
     return _engine
@@ -0,0 +1,299 @@
+"""
+Streaming HTML Extraction — pull forum posts out of a page without a DOM.
+
+`GenericForumScraper` used to download a whole page, build a complete
+BeautifulSoup tree and then keep 25 containers and 5000 characters of it.
+`PostExtractor` is an lxml parser *target*: the page is fed in chunks as
+it arrives, start / end / text events are matched against compiled
+selectors, and only the text of the current post container is kept.
+Extraction stops as soon as enough containers were seen, so the rest of
+the page is never downloaded.
+
+Selectors are compiled to (tag, classes, id) matchers. Only simple
+compound selectors are supported — `tag`, `.class`, `#id`, `tag.a.b`,
+comma-separated; a selector with combinators or attributes compiles to
+None and the scraper falls back to BeautifulSoup. Containers nested in
+another container are part of the outer post, not separate posts.
+"""
+import functools
+import re
+from typing import Optional
+from urllib.parse import urljoin
+
+from lxml import etree
+
+from app.crawler.base_scraper import RawPost
+
+# Text inside these elements is not page text (mirrors BeautifulSoup's get_text)
+_SKIP_TAGS = frozenset({"script", "style", "template"})
+
+_COMPOUND = re.compile(r"^(?P<tag>[a-zA-Z][\w-]*|\*)?(?P<rest>(?:[.#][\w-]+)*)$")
+
+
+class SelectorMatcher:
+    """Matches elements against a comma-separated list of simple compound selectors."""
+
+    def __init__(self, compounds: list[tuple[Optional[str], frozenset[str], Optional[str]]]):
+        self._compounds = compounds
+        # Fast path: a tag-only alternative matches by name alone
+        self._tags = frozenset(tag for tag, classes, id_ in compounds if tag and not classes and not id_)
+
+    def matches(self, tag: str, attrs) -> bool:
+        if tag in self._tags:
+            return True
+        classes = None
+        for want_tag, want_classes, want_id in self._compounds:
+            if want_tag and want_tag != tag:
+                continue
+            if want_id and attrs.get("id") != want_id:
+                continue
+            if want_classes:
+                if classes is None:
+                    classes = set(attrs.get("class", "").split())
+                if not want_classes <= classes:
+                    continue
+            return True
+        return False
+
+
+@functools.lru_cache(maxsize=256)
+def compile_selector(selector: str) -> Optional[SelectorMatcher]:
+    """Compile a CSS selector list, or None if it uses anything beyond tag/class/id."""
+    compounds = []
+    for part in selector.split(","):
+        match = _COMPOUND.match(part.strip())
+        if not part.strip() or not match:
+            return None
+        tag = match["tag"].lower() if match["tag"] and match["tag"] != "*" else None
+        rest = match["rest"]
+        ids = re.findall(r"#([\w-]+)", rest)
+        if len(ids) > 1:
+            return None
+        compounds.append((tag, frozenset(re.findall(r"\.([\w-]+)", rest)), ids[0] if ids else None))
+    return SelectorMatcher(compounds)
+
+
+def compile_selectors(selectors: dict[str, str]) -> Optional[dict[str, SelectorMatcher]]:
+    """Compile a scraper's selector set; None if any selector needs the DOM fallback."""
+    compiled = {name: compile_selector(selector) for name, selector in selectors.items()}
+    if any(matcher is None for matcher in compiled.values()):
+        return None
+    return compiled
+
+
+class _Capture:
+    """Text of the first element matching a field selector inside a container."""
+    __slots__ = ("depth", "parts", "size", "done")
+
+    def __init__(self, depth: int):
+        self.depth = depth
+        self.parts: list[str] = []
+        self.size = 0
+        self.done = False
+
+
+class PostExtractor:
+    """
+    lxml parser target that turns forum HTML into RawPosts as it streams in.
+
+    Usage:
+        extractor = PostExtractor(url, compile_selectors(selectors))
+        for chunk in chunks:
+            extractor.feed(chunk)
+            if extractor.done:
+                break
+        posts = extractor.close()
+    """
+
+    def __init__(
+        self,
+        url: str,
+        matchers: dict[str, SelectorMatcher],
+        encoding: Optional[str] = None,
+        max_posts: int = 25,
+        max_chars: int = 5000,
+    ):
+        self.url = url
+        self.max_posts = max_posts
+        self.max_chars = max_chars
+        self._container = matchers["post_container"]
+        self._fields = {name: matchers[name] for name in ("title", "content", "author")}
+
+        self.posts: list[RawPost] = []
+        self.containers = 0
+        self._depth = 0
+        self._skip = 0
+        self._text: list[str] = []
+        self._container_depth: Optional[int] = None
+        self._captures: dict[str, _Capture] = {}
+        self._link: Optional[str] = None
+        self._link_seen = False
+
+        # Fallback when the page has no containers: its text and <title>
+        self._page_parts: list[str] = []
+        self._page_size = 0
+        self._title: Optional[list[str]] = None
+        self._in_title = False
+
+        self._parser = etree.HTMLParser(target=self, encoding=encoding, no_network=True)
+
+    @property
+    def done(self) -> bool:
+        """True once `max_posts` containers were extracted; the rest of the page is not needed."""
+        return self.containers >= self.max_posts
+
+    def feed(self, data: bytes) -> None:
+        if not self.done:
+            self._parser.feed(data)
+
+    def close(self) -> list[RawPost]:
+        """Finish parsing (open elements are closed) and return the extracted posts."""
+        try:
+            self._parser.close()
+        except etree.Error:
+            pass  # Nothing was fed
+        if self.containers == 0:
+            return self._page_post()
+        return self.posts
+
+    # ═══ Parser target ═══
+
+    def start(self, tag, attrs) -> None:
+        self._flush()
+        if self.done or not isinstance(tag, str):
+            return
+        self._depth += 1
+        if tag in _SKIP_TAGS:
+            self._skip += 1
+        if tag == "title" and self._title is None:
+            self._title, self._in_title = [], True
+
+        if self._container_depth is None:
+            if self._container.matches(tag, attrs):
+                self._container_depth = self._depth
+                self._captures, self._link, self._link_seen = {}, None, False
+            return
+
+        for name, matcher in self._fields.items():
+            if name not in self._captures and matcher.matches(tag, attrs):
+                self._captures[name] = _Capture(self._depth)
+        if tag == "a" and not self._link_seen:
+            self._link_seen = True
+            self._link = attrs.get("href")
+
+    def end(self, tag) -> None:
+        self._flush()
+        if self.done or not isinstance(tag, str):
+            return
+        if tag in _SKIP_TAGS and self._skip:
+            self._skip -= 1
+        if tag == "title":
+            self._in_title = False
+
+        if self._container_depth is not None:
+            for capture in self._captures.values():
+                if capture.depth == self._depth:
+                    capture.done = True
+            if self._depth == self._container_depth:
+                self._finish_container()
+        self._depth -= 1
+
+    def data(self, text: str) -> None:
+        if not self.done:
+            self._text.append(text)
+
+    def comment(self, text: str) -> None:
+        self._flush()
+
+    def _flush(self) -> None:
+        """Dispatch the text node collected since the last tag event."""
+        if not self._text:
+            return
+        raw = "".join(self._text)
+        self._text = []
+        if self._in_title:
+            self._title.append(raw)
+        text = raw.strip()
+        if not text or self._skip:
+            return
+
+        if self._container_depth is not None:
+            for capture in self._captures.values():
+                if not capture.done and capture.size < self.max_chars:
+                    capture.parts.append(text)
+                    capture.size += len(text) + 1
+        elif not self.containers and self._page_size <= self.max_chars:
+            self._page_parts.append(text)
+            self._page_size += len(text) + 1
+
+    # ═══ Posts ═══
+
+    def _field(self, name: str) -> str:
+        capture = self._captures.get(name)
+        return " ".join(capture.parts) if capture else ""
+
+    def _finish_container(self) -> None:
+        self._container_depth = None
+        self.containers += 1
+        self._page_parts = []
+
+        title = self._field("title")
+        content = self._field("content")
+        author = self._field("author")
+
+        combined = f"{title}\n\n{content}" if content else title
+        if not combined.strip() or len(combined) < 10:
+            return
+
+        post_url = self.url
+        href = self._link
+        if href:
+            if href.startswith("http"):
+                post_url = href
+            elif href.startswith("/"):
+                post_url = urljoin(self.url, href)
+
+        self.posts.append(
+            RawPost(
+                content=combined[:self.max_chars],
+                title=title[:200] if title else "Untitled Post",
+                author=author or "Anonymous",
+                url=post_url,
+                source_name=f"Forum: {self.url}",
+            )
+        )
+
+    def _page_post(self) -> list[RawPost]:
+        """No containers matched: the page's visible text becomes a single post."""
+        page_text = "\n".join(self._page_parts)
+        if not page_text or len(page_text) <= 50:
+            return []
+        title = "".join(self._title) if self._title else ""
+        return [
+            RawPost(
+                content=page_text[:self.max_chars],
+                title=title or self.url,
+                url=self.url,
+                source_name=f"Forum: {self.url}",
+            )
+        ]
+
+
+def extract_posts(
+    data: bytes,
+    url: str,
+    selectors: dict[str, str],
+    encoding: Optional[str] = None,
+    max_posts: int = 25,
+    max_chars: int = 5000,
+) -> list[RawPost]:
+    """
+    Extract posts from a complete (already size-capped) page. Takes selector
+    strings so it can run in a worker process, which compiles (and caches) them.
+    """
+    matchers = compile_selectors(selectors)
+    if matchers is None:
+        raise ValueError("Selectors are not supported by the streaming extractor")
+    extractor = PostExtractor(url, matchers, encoding, max_posts=max_posts, max_chars=max_chars)
+    extractor.feed(data)
+    return extractor.close()
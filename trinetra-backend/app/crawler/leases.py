@@ -0,0 +1,221 @@
+"""
+Crawl Leases — shard sources across crawler replicas.
+
+When several processes run the crawler engine (standalone workers, or
+API replicas with the in-process crawler), each source must be fetched
+by only one of them. Before fetching a source, a replica claims a
+time-limited lease on it through a shared coordination store; only the
+holder fetches. When the fetch is done, the lease is released with a
+hold-off until the source's next scheduled run, so no other replica
+re-fetches it in the meantime, and the source's crawl cursors travel
+with the lease to whichever replica claims it next. Leases of crashed
+replicas simply expire and are taken over.
+
+Stores:
+- FirestoreLeaseStore — Firestore transactions (production)
+- SQLiteLeaseStore    — local file, for tests and single-host setups
+
+A single in-process crawler needs no leases (CRAWLER_LEASE_BACKEND=none,
+the default inside the API), and then does not depend on Firestore
+being reachable to start crawling.
+"""
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from abc import ABC, abstractmethod
+from dataclasses import dataclass, field
+from typing import Optional
+
+from firebase_admin import firestore
+
+from app.firebase_client import count_writes, get_firestore
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class Lease:
+    """Outcome of a claim: who holds the source, until when, and its cursors."""
+    key: str
+    owner: str
+    expires_at: float  # Unix time
+    acquired: bool
+    cursors: dict = field(default_factory=dict)
+
+
+class LeaseStore(ABC):
+    """
+    Coordination store interface. Calls are blocking; the engine runs
+    them in a worker thread.
+    """
+
+    @abstractmethod
+    def claim(self, key: str, owner: str, ttl: float) -> Lease:
+        """Take the lease on `key` if it is free, expired or already ours."""
+
+    @abstractmethod
+    def renew(self, key: str, owner: str, ttl: float) -> bool:
+        """Extend a lease we hold. Returns False if it was lost."""
+
+    @abstractmethod
+    def release(self, key: str, owner: str, hold_seconds: float, cursors: dict) -> None:
+        """
+        Finish a fetch: store the source's cursors and keep other replicas
+        off the source for `hold_seconds` (until its next scheduled run).
+        """
+
+
+class FirestoreLeaseStore(LeaseStore):
+    """Leases as documents in a Firestore collection, claimed in transactions."""
+
+    def __init__(self, collection: str = "crawl_leases"):
+        self.collection = collection
+
+    def _ref(self, key: str):
+        # Source keys may contain characters that aren't valid in document IDs
+        return get_firestore().collection(self.collection).document(key.replace("/", "_"))
+
+    def claim(self, key: str, owner: str, ttl: float) -> Lease:
+        db = get_firestore()
+        ref = self._ref(key)
+
+        @firestore.transactional
+        def _claim(transaction) -> Lease:
+            snapshot = ref.get(transaction=transaction)
+            data = snapshot.to_dict() if snapshot.exists else {}
+            now = time.time()
+            cursors = data.get("cursors", {})
+
+            if data.get("owner") not in (None, owner) and data.get("expires_at", 0) > now:
+                return Lease(key, data["owner"], data["expires_at"], False, cursors)
+
+            expires_at = now + ttl
+            transaction.set(ref, {
+                "key": key,
+                "owner": owner,
+                "expires_at": expires_at,
+                "cursors": cursors,
+            })
+            return Lease(key, owner, expires_at, True, cursors)
+
+        lease = _claim(db.transaction())
+        if lease.acquired:
+            count_writes()
+        return lease
+
+    def renew(self, key: str, owner: str, ttl: float) -> bool:
+        db = get_firestore()
+        ref = self._ref(key)
+
+        @firestore.transactional
+        def _renew(transaction) -> bool:
+            snapshot = ref.get(transaction=transaction)
+            if not snapshot.exists or snapshot.to_dict().get("owner") != owner:
+                return False
+            transaction.update(ref, {"expires_at": time.time() + ttl})
+            return True
+
+        renewed = _renew(db.transaction())
+        if renewed:
+            count_writes()
+        return renewed
+
+    def release(self, key: str, owner: str, hold_seconds: float, cursors: dict) -> None:
+        db = get_firestore()
+        ref = self._ref(key)
+
+        @firestore.transactional
+        def _release(transaction) -> bool:
+            snapshot = ref.get(transaction=transaction)
+            if snapshot.exists and snapshot.to_dict().get("owner") != owner:
+                return False  # Lease was taken over; our cursors are stale
+            transaction.set(ref, {
+                "key": key,
+                "owner": owner,
+                "expires_at": time.time() + hold_seconds,
+                "cursors": cursors,
+            })
+            return True
+
+        if _release(db.transaction()):
+            count_writes()
+
+
+class SQLiteLeaseStore(LeaseStore):
+    """Leases in a local SQLite table — a stand-in for Firestore in tests."""
+
+    def __init__(self, path: str):
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        self._conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS leases ("
+            "key TEXT PRIMARY KEY, owner TEXT, expires_at REAL, cursors TEXT)"
+        )
+        self._lock = threading.Lock()
+
+    def _transaction(self):
+        self._conn.execute("BEGIN IMMEDIATE")
+
+    def _row(self, key: str) -> Optional[tuple]:
+        return self._conn.execute(
+            "SELECT owner, expires_at, cursors FROM leases WHERE key = ?", (key,)
+        ).fetchone()
+
+    def _write(self, key: str, owner: str, expires_at: float, cursors: str) -> None:
+        self._conn.execute(
+            "INSERT OR REPLACE INTO leases (key, owner, expires_at, cursors) VALUES (?, ?, ?, ?)",
+            (key, owner, expires_at, cursors),
+        )
+
+    def claim(self, key: str, owner: str, ttl: float) -> Lease:
+        with self._lock:
+            self._transaction()
+            try:
+                row = self._row(key)
+                now = time.time()
+                cursors = row[2] if row else "{}"
+                if row and row[0] != owner and row[1] > now:
+                    lease = Lease(key, row[0], row[1], False, json.loads(cursors))
+                else:
+                    self._write(key, owner, now + ttl, cursors)
+                    lease = Lease(key, owner, now + ttl, True, json.loads(cursors))
+                self._conn.execute("COMMIT")
+            except Exception:
+                self._conn.execute("ROLLBACK")
+                raise
+        return lease
+
+    def renew(self, key: str, owner: str, ttl: float) -> bool:
+        with self._lock:
+            cursor = self._conn.execute(
+                "UPDATE leases SET expires_at = ? WHERE key = ? AND owner = ?",
+                (time.time() + ttl, key, owner),
+            )
+        return cursor.rowcount == 1
+
+    def release(self, key: str, owner: str, hold_seconds: float, cursors: dict) -> None:
+        with self._lock:
+            self._transaction()
+            try:
+                row = self._row(key)
+                if not row or row[0] == owner:
+                    self._write(key, owner, time.time() + hold_seconds, json.dumps(cursors))
+                self._conn.execute("COMMIT")
+            except Exception:
+                self._conn.execute("ROLLBACK")
+                raise
+
+
+def create_lease_store(backend: str, path: str = "") -> Optional[LeaseStore]:
+    """Build the configured store ("firestore", "sqlite" or "none")."""
+    backend = backend.lower()
+    if backend == "firestore":
+        return FirestoreLeaseStore()
+    if backend == "sqlite":
+        return SQLiteLeaseStore(path)
+    if backend not in ("", "none"):
+        logger.warning(f"Unknown lease backend '{backend}', crawling without leases")
+    return None
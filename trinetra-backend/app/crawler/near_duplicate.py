@@ -0,0 +1,139 @@
+"""
+Near-Duplicate Detector — SimHash fingerprints with a banded LSH index.
+
+The same leak is routinely re-pasted on Pastebin or cross-posted across
+subreddits under a new URL, with small edits (headers, signatures,
+whitespace). Exact URL/content-hash dedup misses these. Each post gets a
+64-bit SimHash over word shingles; two posts are near-duplicates when
+their fingerprints differ in at most `max_distance` bits.
+
+The index splits fingerprints into (up to) four 16-bit bands. By the
+pigeonhole principle, two fingerprints within `max_distance` bits differ
+in at most `max_distance // bands` bits of some band, so a lookup probes
+each band at every value within that radius and only compares against
+the few threats found there instead of scanning everything.
+
+A one-word edit or a repost header moves a 300-word post's SimHash by up
+to ~9 bits, while unrelated posts are ~32 bits apart; the default
+threshold of 0.85 (9 bits) merges the former and keeps the latter apart.
+"""
+import hashlib
+import itertools
+import logging
+import re
+from collections import OrderedDict
+from typing import Optional
+
+logger = logging.getLogger(__name__)
+
+FINGERPRINT_BITS = 64
+_SHINGLE_SIZE = 3
+_MIN_TOKENS = 16  # Shorter posts are too unstable to fingerprint reliably
+_TOKEN = re.compile(r"\w+")
+_MAX_BANDS = 4
+
+
+def simhash(content: str) -> Optional[int]:
+    """
+    64-bit SimHash of the content's word 3-shingles.
+    Returns None for posts too short to fingerprint.
+    """
+    tokens = _TOKEN.findall(content.lower())
+    if len(tokens) < _MIN_TOKENS:
+        return None
+
+    # One 64-char bit string per shingle hash; columns are then counted at C speed
+    rows = [
+        format(
+            int.from_bytes(
+                hashlib.blake2b(" ".join(tokens[i:i + _SHINGLE_SIZE]).encode(), digest_size=8).digest(),
+                "big",
+            ),
+            "064b",
+        )
+        for i in range(len(tokens) - _SHINGLE_SIZE + 1)
+    ]
+
+    fingerprint = 0
+    for position, column in enumerate(zip(*rows)):
+        if column.count("1") * 2 > len(rows):
+            fingerprint |= 1 << (FINGERPRINT_BITS - 1 - position)
+    return fingerprint
+
+
+def similarity(a: int, b: int) -> float:
+    """Fraction of matching bits between two fingerprints."""
+    return 1.0 - bin(a ^ b).count("1") / FINGERPRINT_BITS
+
+
+class NearDuplicateIndex:
+    """
+    Bounded banded index of threat fingerprints.
+
+    Usage:
+        index = NearDuplicateIndex(threshold=0.85)
+        match = index.find(fingerprint)      # threat ID or None
+        index.add(threat_id, fingerprint)
+    """
+
+    def __init__(self, threshold: float = 0.85, capacity: int = 100_000):
+        self.max_distance = max(0, int((1.0 - threshold) * FINGERPRINT_BITS))
+        self.capacity = capacity
+
+        band_count = min(self.max_distance + 1, _MAX_BANDS)
+        self._band_width = FINGERPRINT_BITS // band_count
+        self._band_count = band_count
+        self._band_mask = (1 << self._band_width) - 1
+        # Some band is within this many bits of the query's; probe every value that close
+        radius = self.max_distance // band_count
+        self._probes = [
+            sum(1 << bit for bit in bits)
+            for r in range(radius + 1)
+            for bits in itertools.combinations(range(self._band_width), r)
+        ]
+
+        self._bands: list[dict[int, list[str]]] = [{} for _ in range(band_count)]
+        self._fingerprints: OrderedDict[str, int] = OrderedDict()  # threat ID -> fingerprint
+
+    def __len__(self) -> int:
+        return len(self._fingerprints)
+
+    def _band_values(self, fingerprint: int):
+        for band in range(self._band_count):
+            yield band, (fingerprint >> (band * self._band_width)) & self._band_mask
+
+    def find(self, fingerprint: int) -> Optional[str]:
+        """Return the ID of the closest indexed threat within the threshold, if any."""
+        best_id, best_distance = None, self.max_distance + 1
+        for band, value in self._band_values(fingerprint):
+            buckets = self._bands[band]
+            for probe in self._probes:
+                for threat_id in buckets.get(value ^ probe, ()):
+                    distance = bin(fingerprint ^ self._fingerprints[threat_id]).count("1")
+                    if distance < best_distance:
+                        best_id, best_distance = threat_id, distance
+        return best_id
+
+    def add(self, threat_id: str, fingerprint: int) -> None:
+        """Index a stored threat's fingerprint, evicting the oldest when full."""
+        if threat_id in self._fingerprints:
+            self.discard(threat_id)
+
+        self._fingerprints[threat_id] = fingerprint
+        for band, value in self._band_values(fingerprint):
+            self._bands[band].setdefault(value, []).append(threat_id)
+
+        while len(self._fingerprints) > self.capacity:
+            self.discard(next(iter(self._fingerprints)))
+
+    def discard(self, threat_id: str) -> None:
+        """Remove a threat from the index."""
+        fingerprint = self._fingerprints.pop(threat_id, None)
+        if fingerprint is None:
+            return
+        for band, value in self._band_values(fingerprint):
+            bucket = self._bands[band].get(value)
+            if bucket:
+                bucket.remove(threat_id)
+                if not bucket:
+                    del self._bands[band][value]
@@ -0,0 +1,233 @@
+"""
+Analysis Pipeline — staged, bounded-concurrency processing of scraped posts.
+
+Posts flow through a chain of stages linked by bounded asyncio queues:
+
+    scrape → detect/score → dedup → persist → notify
+
+Each stage runs its own pool of worker tasks, so slow I/O stages
+(Firestore lookups and writes, WebSocket broadcasts) overlap with each
+other instead of adding up. Bounded queues provide backpressure: when a
+downstream stage falls behind, producers wait on `submit()` rather than
+buffering an entire crawl cycle in memory.
+"""
+import asyncio
+import logging
+import time
+from dataclasses import dataclass, field
+from typing import Awaitable, Callable, Optional
+
+from app.crawler.base_scraper import RawPost
+from app.metrics import Counter, Gauge, Histogram
+
+logger = logging.getLogger(__name__)
+
+STAGE_SECONDS = Histogram(
+    "trinetra_pipeline_stage_seconds",
+    "Time per stage handler call (one item, or one batch for batched stages)",
+    ["stage"],
+)
+STAGE_ITEMS = Counter(
+    "trinetra_pipeline_items_total",
+    "Items leaving each stage, by outcome (passed, dropped, failed)",
+    ["stage", "outcome"],
+)
+QUEUE_DEPTH = Gauge(
+    "trinetra_pipeline_queue_depth",
+    "Items waiting in each stage's input queue",
+    ["stage"],
+)
+
+
+@dataclass
+class PipelineItem:
+    """A post travelling through the pipeline, enriched stage by stage."""
+    post: RawPost
+    source_key: str = ""
+    # Resolves to True if the post was stored as a threat, False otherwise
+    done: Optional[asyncio.Future] = None
+    nlp_result: object = None
+    cred_matches: list = field(default_factory=list)
+    threat_score: Optional[dict] = None
+    relevance: Optional[float] = None  # Contextual classifier's P(threat)
+    threat_id: str = ""
+    fingerprint: Optional[int] = None  # SimHash of the post content
+    threat_doc: Optional[dict] = None
+    spool_seq: Optional[int] = None  # Position in the durable post spool, if spooled
+    failed: bool = False  # Processing failed (as opposed to a deliberate drop); worth retrying
+
+
+# A stage handler receives an item and returns it (to pass it on) or None (to drop it).
+# Batched stages (batch_size > 1) receive a list of items and return a list of the
+# same length, with None in place of every dropped item.
+StageHandler = Callable[[PipelineItem], Awaitable[Optional[PipelineItem]]]
+BatchStageHandler = Callable[
+    [list[PipelineItem]], Awaitable[list[Optional[PipelineItem]]]
+]
+
+
+@dataclass
+class PipelineStage:
+    """Configuration and counters for a single pipeline stage."""
+    name: str
+    handler: StageHandler | BatchStageHandler
+    workers: int = 1
+    batch_size: int = 1  # >1: handler receives up to this many queued items at once
+    processed: int = 0
+    dropped: int = 0
+    failed: int = 0
+    timings: Optional[list[float]] = None  # Set to a list to record every handler call's duration
+
+
+class AnalysisPipeline:
+    """
+    Runs scraped posts through a sequence of stages, each backed by a
+    bounded input queue and a configurable number of worker tasks.
+
+    Usage:
+        pipeline = AnalysisPipeline([...stages...], queue_size=500)
+        await pipeline.start()
+        done = await pipeline.submit(post)   # blocks when the first queue is full
+        stored = await done                  # True if the post became a threat
+        await pipeline.join()                # wait until every submitted post is done
+        await pipeline.stop()
+    """
+
+    def __init__(
+        self,
+        stages: list[PipelineStage],
+        queue_size: int = 500,
+        on_done: Optional[Callable[[PipelineItem, bool], None]] = None,
+    ):
+        if not stages:
+            raise ValueError("AnalysisPipeline requires at least one stage")
+        self.stages = stages
+        self.queue_size = queue_size
+        self._queues: list[asyncio.Queue] = [
+            asyncio.Queue(maxsize=queue_size) for _ in stages
+        ]
+        self._workers: list[asyncio.Task] = []
+        self.completed = 0  # Items that made it through the final stage
+        self.on_done = on_done  # Called with (item, stored) when an item leaves the pipeline
+
+    @property
+    def running(self) -> bool:
+        return bool(self._workers)
+
+    async def start(self) -> None:
+        """Spawn the worker tasks for every stage."""
+        if self._workers:
+            return
+
+        for index, stage in enumerate(self.stages):
+            QUEUE_DEPTH.labels(stage.name).set_function(self._queues[index].qsize)
+            for worker_id in range(max(1, stage.workers)):
+                self._workers.append(
+                    asyncio.create_task(
+                        self._run_worker(index),
+                        name=f"pipeline-{stage.name}-{worker_id}",
+                    )
+                )
+
+        logger.info(
+            "Analysis pipeline started: "
+            + ", ".join(f"{s.name}×{max(1, s.workers)}" for s in self.stages)
+        )
+
+    async def stop(self) -> None:
+        """Cancel all workers. Items still queued are discarded."""
+        for task in self._workers:
+            task.cancel()
+        await asyncio.gather(*self._workers, return_exceptions=True)
+        self._workers = []
+
+    async def submit(
+        self, post: RawPost, source_key: str = "", spool_seq: Optional[int] = None
+    ) -> asyncio.Future:
+        """
+        Enqueue a post for processing, waiting if the pipeline is saturated.
+        Returns a future that resolves once the post leaves the pipeline:
+        True if it was stored as a threat, False if it was dropped or failed.
+        """
+        done = asyncio.get_running_loop().create_future()
+        await self._queues[0].put(
+            PipelineItem(post=post, source_key=source_key, done=done, spool_seq=spool_seq)
+        )
+        return done
+
+    async def join(self) -> None:
+        """
+        Wait until every submitted item has left the pipeline.
+        Items are forwarded before being marked done, so joining the
+        queues in stage order is sufficient.
+        """
+        for queue in self._queues:
+            await queue.join()
+
+    def stats(self) -> dict[str, dict[str, int]]:
+        """Per-stage counters and current queue depths."""
+        return {
+            stage.name: {
+                "processed": stage.processed,
+                "dropped": stage.dropped,
+                "failed": stage.failed,
+                "queued": queue.qsize(),
+            }
+            for stage, queue in zip(self.stages, self._queues)
+        }
+
+    async def _run_worker(self, index: int) -> None:
+        """Worker loop for a single stage."""
+        stage = self.stages[index]
+        inbox = self._queues[index]
+        outbox = self._queues[index + 1] if index + 1 < len(self._queues) else None
+
+        while True:
+            batch = [await inbox.get()]
+            # Batched stages drain whatever is already queued, up to batch_size
+            while len(batch) < stage.batch_size and not inbox.empty():
+                batch.append(inbox.get_nowait())
+
+            try:
+                started = time.perf_counter()
+                if stage.batch_size > 1:
+                    results = await stage.handler(batch)
+                else:
+                    results = [await stage.handler(batch[0])]
+                elapsed = time.perf_counter() - started
+                STAGE_SECONDS.labels(stage.name).observe(elapsed)
+                if stage.timings is not None:
+                    stage.timings.append(elapsed)
+
+                for item, result in zip(batch, results):
+                    stage.processed += 1
+                    STAGE_ITEMS.labels(stage.name, "dropped" if result is None else "passed").inc()
+                    if result is None:
+                        stage.dropped += 1
+                        self._resolve(item, False)
+                    elif outbox is not None:
+                        await outbox.put(result)
+                    else:
+                        self.completed += 1
+                        self._resolve(result, True)
+            except asyncio.CancelledError:
+                raise
+            except Exception as exc:
+                stage.failed += len(batch)
+                STAGE_ITEMS.labels(stage.name, "failed").inc(len(batch))
+                logger.warning(f"Pipeline stage '{stage.name}' failed: {exc}")
+                for item in batch:
+                    item.failed = True
+                    self._resolve(item, False)
+            finally:
+                for _ in batch:
+                    inbox.task_done()
+
+    def _resolve(self, item: PipelineItem, stored: bool) -> None:
+        if item.done is not None and not item.done.done():
+            item.done.set_result(stored)
+        if self.on_done is not None:
+            try:
+                self.on_done(item, stored)
+            except Exception as exc:
+                logger.warning(f"Pipeline completion hook failed: {exc}")
@@ -0,0 +1,118 @@
+"""
+Host Rate Limiter — per-host token buckets shared by all scrapers.
+
+Scrapers fetch concurrently, so politeness is enforced per host rather
+than by fetching one request at a time: each host has a token bucket
+(`rate` requests/second, bursts of up to `burst`). A `Retry-After`
+from a 429/503 response pauses the whole host until it expires.
+"""
+import asyncio
+import logging
+import time
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Optional
+
+logger = logging.getLogger(__name__)
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Seconds to wait from a Retry-After header (delta-seconds or HTTP-date)."""
+    if not value:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        when = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=timezone.utc)
+    return max(0.0, (when - datetime.now(timezone.utc)).total_seconds())
+
+
+class TokenBucket:
+    """
+    Reservation-based token bucket: each caller reserves a token up front
+    and is told how long to wait for it, so concurrent callers queue up
+    without a lock.
+    """
+
+    def __init__(self, rate: float, burst: int):
+        self.rate = rate
+        self.burst = burst
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+        self._blocked_until = 0.0
+
+    def reserve(self, now: Optional[float] = None) -> float:
+        """Take one token and return the seconds until it may be used."""
+        now = time.monotonic() if now is None else now
+        self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+        self._tokens -= 1
+        wait = -self._tokens / self.rate if self._tokens < 0 else 0.0
+        return max(wait, self._blocked_until - now)
+
+    def block(self, seconds: float, now: Optional[float] = None) -> None:
+        """Hold every request until `seconds` from now."""
+        now = time.monotonic() if now is None else now
+        self._blocked_until = max(self._blocked_until, now + seconds)
+
+
+class HostRateLimiter:
+    """
+    One token bucket per host.
+
+    Usage:
+        limiter = HostRateLimiter(rate=5, burst=20, overrides={"www.reddit.com": 1.0})
+        await limiter.acquire("www.reddit.com")
+        limiter.defer("www.reddit.com", 30)   # honor Retry-After
+    """
+
+    def __init__(
+        self,
+        rate: float = 5.0,
+        burst: int = 20,
+        overrides: Optional[dict[str, float]] = None,
+    ):
+        if not rate > 0:
+            raise ValueError(f"Host rate must be positive, got {rate}")
+        self.rate = rate
+        self.burst = burst
+        self.overrides = overrides or {}
+        self._buckets: dict[str, TokenBucket] = {}
+
+    def _bucket(self, host: str) -> TokenBucket:
+        bucket = self._buckets.get(host)
+        if bucket is None:
+            rate = self.overrides.get(host, self.rate)
+            bucket = self._buckets[host] = TokenBucket(rate, self.burst)
+        return bucket
+
+    async def acquire(self, host: str) -> None:
+        """Wait until a request to `host` is allowed."""
+        wait = self._bucket(host).reserve()
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+    def defer(self, host: str, seconds: float) -> None:
+        """Pause all requests to `host` for `seconds` (from Retry-After)."""
+        logger.info(f"Rate limited by {host}, pausing for {seconds:.0f}s")
+        self._bucket(host).block(seconds)
+
+    @staticmethod
+    def parse_overrides(spec: str) -> dict[str, float]:
+        """Parse "host=rate,host=rate" into a dict. Rates must be positive."""
+        overrides = {}
+        for entry in spec.split(","):
+            host, _, rate = entry.partition("=")
+            if host.strip() and rate.strip():
+                value = float(rate)
+                if not value > 0:
+                    raise ValueError(
+                        f"Rate override for {host.strip()} must be positive, got {rate.strip()!r}"
+                    )
+                overrides[host.strip()] = value
+        return overrides
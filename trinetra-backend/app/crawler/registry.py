@@ -0,0 +1,133 @@
+"""
+Scraper Registry — maps `sources` documents to scraper instances.
+
+Every active source document with a URL (other than the built-in Reddit
+and Pastebin feeds) becomes its own scraper, chosen by the document's
+`scraper` field (default "forum"), with its own schedule, lease and
+health record. A document can tune its scraper:
+
+    {
+      "id": 1712345678901, "name": "Exploit board", "active": true,
+      "type": "Forum", "url": "https://forum.example/board",
+      "scraper": "forum",
+      "selectors": {"post_container": "div.thread", "content": ".msg-body"},
+      "max_posts": 40, "max_page_kb": 512, "timeout_seconds": 10
+    }
+
+Scraper classes register under a name with `@register_scraper("name")`
+and build themselves from a `SourceConfig` via `from_source()`. Other
+installed packages can add scrapers through the `trinetra.scrapers`
+entry point group:
+
+    [project.entry-points."trinetra.scrapers"]
+    discourse = "my_pkg.discourse:DiscourseScraper"
+"""
+import logging
+from dataclasses import dataclass, field
+from importlib.metadata import entry_points
+from typing import Optional
+
+from app.crawler.base_scraper import BaseScraper
+
+logger = logging.getLogger(__name__)
+
+ENTRY_POINT_GROUP = "trinetra.scrapers"
+
+# Source types served by the engine's built-in scrapers rather than per-source ones
+BUILTIN_TYPES = ("reddit", "pastebin")
+
+_registry: dict[str, type[BaseScraper]] = {}
+_entry_points_loaded = False
+
+
+@dataclass
+class SourceConfig:
+    """Crawl settings of one `sources` document."""
+    key: str                       # Engine source key, stable across renames
+    url: str
+    scraper: str = "forum"
+    name: str = ""
+    selectors: dict[str, str] = field(default_factory=dict)
+    max_posts: int = 25
+    max_page_kb: Optional[int] = None      # None: SCRAPER_MAX_PAGE_KB
+    timeout_seconds: Optional[float] = None
+
+    @classmethod
+    def from_doc(cls, doc: dict) -> Optional["SourceConfig"]:
+        """Config for an active, URL-bearing source document (None otherwise)."""
+        url = doc.get("url")
+        if not doc.get("active", False) or not url:
+            return None
+        if doc.get("type", "").lower() in BUILTIN_TYPES:
+            return None
+
+        scraper = str(doc.get("scraper") or "forum").lower()
+        selectors = doc.get("selectors") or {}
+        try:
+            return cls(
+                key=source_key(doc),
+                url=url,
+                scraper=scraper,
+                name=doc.get("name", ""),
+                selectors={str(k): str(v) for k, v in selectors.items() if v},
+                max_posts=int(doc.get("max_posts") or 25),
+                max_page_kb=int(doc["max_page_kb"]) if doc.get("max_page_kb") else None,
+                timeout_seconds=(
+                    float(doc["timeout_seconds"]) if doc.get("timeout_seconds") else None
+                ),
+            )
+        except (TypeError, ValueError, AttributeError) as exc:
+            logger.warning(f"Ignoring invalid crawl settings on source {url}: {exc}")
+            return None
+
+
+def source_key(doc: dict) -> str:
+    """Engine key of a source document, e.g. "forum#1712345678901"."""
+    scraper = str(doc.get("scraper") or "forum").lower()
+    return f"{scraper}#{doc.get('id') or doc.get('url')}"
+
+
+def register_scraper(name: str):
+    """Class decorator registering a scraper under `name`."""
+    def decorator(cls: type[BaseScraper]) -> type[BaseScraper]:
+        _registry[name.lower()] = cls
+        return cls
+    return decorator
+
+
+def _load_entry_points() -> None:
+    global _entry_points_loaded
+    if _entry_points_loaded:
+        return
+    _entry_points_loaded = True
+    for entry_point in entry_points(group=ENTRY_POINT_GROUP):
+        try:
+            _registry.setdefault(entry_point.name.lower(), entry_point.load())
+        except Exception as exc:
+            logger.warning(f"Failed to load scraper plugin '{entry_point.name}': {exc}")
+
+
+def get_scraper_class(name: str) -> Optional[type[BaseScraper]]:
+    """Registered scraper class for `name`, including entry-point plugins."""
+    # Built-in scrapers register themselves on import
+    import app.crawler.scrapers.generic_scraper  # noqa: F401
+
+    _load_entry_points()
+    return _registry.get(name.lower())
+
+
+def available_scrapers() -> list[str]:
+    get_scraper_class("")
+    return sorted(_registry)
+
+
+def create_scraper(config: SourceConfig) -> Optional[BaseScraper]:
+    """Build the scraper for a source (None, with a warning, if its type is unknown)."""
+    cls = get_scraper_class(config.scraper)
+    if cls is None:
+        logger.warning(
+            f"Unknown scraper '{config.scraper}' for {config.url} "
+            f"(available: {', '.join(available_scrapers())})"
+        )
+        return None
+    return cls.from_source(config)
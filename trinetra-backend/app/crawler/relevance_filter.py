@@ -0,0 +1,185 @@
+"""
+Relevance Filter — the contextual classifier stage of the crawl pipeline.
+
+Keyword candidates are scored in batches by `OnlineLogisticClassifier`
+(app.nlp.classifier); candidates below `threshold` are dropped before
+they cost a Firestore write and an alert. Posts with credential matches
+are never dropped: a regex hit on a key or token is evidence on its own.
+
+The model learns from analyst triage. Escalating or resolving a threat
+through the API writes a label to the `triage_labels` collection; every
+replica reads new labels on its config refresh, updates its model and
+saves it locally together with the label cursor. Until it has seen
+`min_labels` labels of each outcome the filter only scores, it does not
+drop anything.
+"""
+import asyncio
+import logging
+from datetime import datetime, timezone
+from typing import Optional
+
+import numpy as np
+from google.cloud.firestore_v1.field_path import FieldPath
+
+from app.evidence_store import EvidenceStore
+from app.firebase_client import get_firestore
+from app.nlp.classifier import OnlineLogisticClassifier
+
+logger = logging.getLogger(__name__)
+
+TRIAGE_COLLECTION = "triage_labels"
+
+# Threat status set by an analyst -> training label (1 = real threat)
+TRIAGE_LABELS = {"Escalated": 1, "Resolved": 0}
+
+# Labels read from Firestore per query
+_LABEL_PAGE_SIZE = 500
+
+# Evidence beyond this is not needed to train on
+_MAX_TRAINING_BYTES = 64 * 1024
+
+
+def post_text(title: str, content: str) -> str:
+    """What the classifier sees of a post; training and scoring must both use it."""
+    return f"{title}\n\n{content}" if title else content
+
+
+def triage_label_doc(threat_id: str, threat: dict, status: str) -> Optional[dict]:
+    """The `triage_labels` document recording an analyst's verdict on a threat."""
+    label = TRIAGE_LABELS.get(status)
+    if label is None:
+        return None
+    return {
+        "threat_id": threat_id,
+        "label": label,
+        "status": status,
+        "title": threat.get("title", ""),
+        "text": post_text(threat.get("title", ""), threat.get("rawEvidence", "")),
+        "evidence_digest": threat.get("evidence_digest"),
+        "created_at": datetime.now(timezone.utc).isoformat(),
+    }
+
+
+class RelevanceFilter:
+    """
+    Usage:
+        relevance = RelevanceFilter(path, threshold=0.2, min_labels=20)
+        relevance.load()
+        scores = relevance.score([post_text(post.title, post.content) for post in candidates])
+        await relevance.train_from_triage(evidence_store)
+    """
+
+    def __init__(
+        self,
+        path: str,
+        threshold: float = 0.2,
+        min_labels: int = 20,
+        bits: int = 18,
+        learning_rate: float = 0.5,
+    ):
+        self.path = path
+        self.threshold = threshold
+        self.min_labels = min_labels
+        self.bits = bits
+        self.learning_rate = learning_rate
+        self.model = OnlineLogisticClassifier(bits, learning_rate)
+        # `created_at` and document ID of the last label trained on
+        self._label_cursor = ""
+        self._label_cursor_id = ""
+
+    def load(self) -> None:
+        loaded = OnlineLogisticClassifier.load(self.path)
+        if loaded is None:
+            return
+        model, meta = loaded
+        if model.vectorizer.bits != self.bits:
+            logger.warning(
+                f"Classifier feature size changed ({model.vectorizer.bits} -> {self.bits} bits), "
+                "retraining from all triage labels"
+            )
+            return
+        self.model = model
+        self._label_cursor = str(meta.get("label_cursor", ""))
+        self._label_cursor_id = str(meta.get("label_cursor_id", ""))
+        logger.info(f"Loaded relevance classifier trained on {self.model.n_labels} labels")
+
+    @property
+    def active(self) -> bool:
+        """Whether the model has seen enough of both outcomes to drop candidates."""
+        return bool(self.model.label_counts.min() >= self.min_labels)
+
+    def score(self, texts: list[str]) -> np.ndarray:
+        """P(threat) of each post's `post_text`, in input order."""
+        return self.model.predict_proba(texts)
+
+    def keep(self, probability: float, has_credentials: bool) -> bool:
+        return has_credentials or not self.active or probability >= self.threshold
+
+    # ═══ Training ═══
+
+    async def train_from_triage(self, evidence_store: Optional[EvidenceStore] = None) -> int:
+        """Train on triage labels written since the last call. Returns how many were new."""
+        trained = 0
+        while True:
+            page = await asyncio.to_thread(
+                self._read_labels, self._label_cursor, self._label_cursor_id
+            )
+            docs = [doc for _, doc in page if doc.get("created_at")]
+            if docs:
+                texts = await asyncio.gather(*(self._training_text(doc, evidence_store) for doc in docs))
+                labels = [int(doc.get("label", 0)) for doc in docs]
+                self.model.partial_fit(list(texts), labels)
+                trained += len(docs)
+            if page:
+                self._label_cursor_id, last = page[-1]
+                self._label_cursor = last.get("created_at", self._label_cursor)
+            if len(page) < _LABEL_PAGE_SIZE:
+                break
+
+        if trained:
+            await asyncio.to_thread(
+                self.model.save,
+                self.path,
+                label_cursor=self._label_cursor,
+                label_cursor_id=self._label_cursor_id,
+            )
+            negatives, positives = self.model.label_counts
+            logger.info(
+                f"Relevance classifier trained on {trained} new triage labels "
+                f"({positives} escalated / {negatives} resolved in total)"
+            )
+        return trained
+
+    @staticmethod
+    def _read_labels(cursor: str, cursor_id: str) -> list[tuple[str, dict]]:
+        """
+        (document ID, label) of the next page after the cursor. Pages are
+        ordered by `created_at`, then document ID, so labels written in the
+        same instant are neither skipped nor read twice.
+        """
+        query = (
+            get_firestore().collection(TRIAGE_COLLECTION)
+            .order_by("created_at")
+            .order_by(FieldPath.document_id())
+        )
+        if cursor and cursor_id:
+            query = query.start_after({"created_at": cursor, FieldPath.document_id(): cursor_id})
+        elif cursor:
+            query = query.start_after({"created_at": cursor})  # Cursor saved before IDs were
+        docs = query.limit(_LABEL_PAGE_SIZE).get()
+        return [(doc.id, doc.to_dict() or {}) for doc in docs]
+
+    @staticmethod
+    async def _training_text(doc: dict, evidence_store: Optional[EvidenceStore]) -> str:
+        """The threat's title and full evidence when it is in the store, else the label's snippet."""
+        digest = doc.get("evidence_digest")
+        if digest and evidence_store is not None:
+            def _read() -> bytes:
+                with evidence_store.open(digest) as fh:
+                    return fh.read(_MAX_TRAINING_BYTES)
+            try:
+                data = await asyncio.to_thread(_read)
+                return post_text(doc.get("title", ""), data.decode("utf-8", errors="replace"))
+            except Exception as exc:
+                logger.debug(f"Training on snippet of {doc.get('threat_id')}: {exc}")
+        return doc.get("text", "")
@@ -0,0 +1,332 @@
+"""
+Corpus Replay — benchmark the analysis path offline.
+
+Pushes a corpus captured with CRAWLER_CAPTURE_DIR (or the worker's
+`--capture`) through the full pipeline — detect, dedup, persist,
+notify — against an in-memory Firestore, without Reddit, Pastebin or
+Firebase credentials:
+
+    python -m app.crawler.replay crawler_state/corpus/corpus-20260101.jsonl.gz --processes 4
+
+Reports throughput (posts/sec), per-stage latency percentiles,
+end-to-end per-post latency and peak memory, so detector or scorer
+changes can be compared on real traffic shapes.
+"""
+import argparse
+import asyncio
+import copy
+import itertools
+import logging
+import sys
+import threading
+import time
+import uuid
+from typing import Optional
+
+from google.cloud.firestore_v1 import transforms
+
+from app.config import settings
+from app.crawler.corpus import read_corpus
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+logger = logging.getLogger(__name__)
+
+
+# ═══ In-memory Firestore ═══
+
+class _Snapshot:
+    def __init__(self, reference: "_DocumentRef", data: Optional[dict]):
+        self.reference = reference
+        self.id = reference.id
+        self.exists = data is not None
+        self._data = data
+
+    def to_dict(self) -> Optional[dict]:
+        return copy.deepcopy(self._data) if self._data is not None else None
+
+
+class _DocumentRef:
+    def __init__(self, store: "InMemoryFirestore", collection: str, doc_id: str):
+        self._store = store
+        self._collection = collection
+        self.id = doc_id
+
+    def get(self, **kwargs) -> _Snapshot:
+        with self._store.lock:
+            return _Snapshot(self, self._store.docs(self._collection).get(self.id))
+
+    def set(self, data: dict, merge: bool = False) -> None:
+        self._store.write(self._collection, self.id, data, merge=merge)
+
+    def update(self, data: dict) -> None:
+        if self.id not in self._store.docs(self._collection):
+            raise KeyError(f"No document to update: {self._collection}/{self.id}")
+        self._store.write(self._collection, self.id, data, merge=True)
+
+    def delete(self) -> None:
+        with self._store.lock:
+            self._store.docs(self._collection).pop(self.id, None)
+
+
+class _Query:
+    def __init__(self, store: "InMemoryFirestore", collection: str, filters=(), fields=None):
+        self._store = store
+        self._collection = collection
+        self._filters = tuple(filters)
+        self._fields = fields
+
+    def where(self, field: str, op: str, value) -> "_Query":
+        if op != "==":
+            raise NotImplementedError(f"In-memory Firestore supports only '==', not {op!r}")
+        return _Query(self._store, self._collection, self._filters + ((field, value),), self._fields)
+
+    def select(self, fields: list[str]) -> "_Query":
+        return _Query(self._store, self._collection, self._filters, list(fields))
+
+    def limit(self, count: int) -> "_Query":
+        return self  # Result sets in a replay are small enough to return whole
+
+    def stream(self, **kwargs):
+        with self._store.lock:
+            items = list(self._store.docs(self._collection).items())
+        for doc_id, data in items:
+            if all(data.get(field) == value for field, value in self._filters):
+                if self._fields is not None:
+                    data = {k: v for k, v in data.items() if k in self._fields}
+                yield _Snapshot(_DocumentRef(self._store, self._collection, doc_id), data)
+
+    def get(self, **kwargs) -> list[_Snapshot]:
+        return list(self.stream())
+
+
+class _CollectionRef(_Query):
+    def __init__(self, store: "InMemoryFirestore", name: str):
+        super().__init__(store, name)
+
+    def document(self, doc_id: Optional[str] = None) -> _DocumentRef:
+        return _DocumentRef(self._store, self._collection, doc_id or uuid.uuid4().hex[:20])
+
+
+class _WriteBatch:
+    def __init__(self, store: "InMemoryFirestore"):
+        self._store = store
+        self._ops: list = []
+
+    def set(self, ref: _DocumentRef, data: dict, merge: bool = False) -> None:
+        self._ops.append(lambda: ref.set(data, merge=merge))
+
+    def update(self, ref: _DocumentRef, data: dict) -> None:
+        self._ops.append(lambda: ref.update(data))
+
+    def delete(self, ref: _DocumentRef) -> None:
+        self._ops.append(ref.delete)
+
+    def commit(self) -> list:
+        for op in self._ops:
+            op()
+        return [None] * len(self._ops)
+
+
+class _Transaction(_WriteBatch):
+    """
+    Enough of a Transaction for `firestore.transactional`: the store lock
+    is held from begin to commit or rollback, so transactions serialize.
+    """
+    _read_only = False
+    _max_attempts = 1
+
+    def __init__(self, store: "InMemoryFirestore"):
+        super().__init__(store)
+        self._id = None
+
+    def _clean_up(self) -> None:
+        self._ops = []
+
+    def _begin(self, retry_id=None) -> None:
+        self._store.lock.acquire()
+        self._id = b"in-memory"
+
+    def _commit(self) -> list:
+        try:
+            return self.commit()
+        finally:
+            self._release()
+
+    def _rollback(self) -> None:
+        self._ops = []
+        self._release()
+
+    def _release(self) -> None:
+        if self._id is not None:
+            self._id = None
+            self._store.lock.release()
+
+
+class InMemoryFirestore:
+    """
+    Just enough of the Firestore client for the crawler's analysis path:
+    documents, batches, transactions, `==` filters, field selection,
+    ArrayUnion and Increment transforms.
+    """
+
+    def __init__(self):
+        self.lock = threading.RLock()
+        self._collections: dict[str, dict[str, dict]] = {}
+
+    def docs(self, collection: str) -> dict[str, dict]:
+        return self._collections.setdefault(collection, {})
+
+    def collection(self, name: str) -> _CollectionRef:
+        return _CollectionRef(self, name)
+
+    def batch(self) -> _WriteBatch:
+        return _WriteBatch(self)
+
+    def transaction(self) -> _Transaction:
+        return _Transaction(self)
+
+    def write(self, collection: str, doc_id: str, data: dict, merge: bool) -> None:
+        with self.lock:
+            docs = self.docs(collection)
+            current = dict(docs.get(doc_id, {})) if merge else {}
+            for key, value in data.items():
+                if isinstance(value, transforms.ArrayUnion):
+                    existing = list(current.get(key, []))
+                    current[key] = existing + [v for v in value.values if v not in existing]
+                elif isinstance(value, transforms.Increment):
+                    current[key] = current.get(key, 0) + value.value
+                else:
+                    current[key] = copy.deepcopy(value)
+            docs[doc_id] = current
+
+
+# ═══ Replay ═══
+
+def _percentile(sorted_values: list[float], q: float) -> float:
+    """Nearest-rank percentile of an already sorted list."""
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, max(0, round(q / 100 * len(sorted_values)) - 1))
+    return sorted_values[index]
+
+
+def _peak_memory_mb() -> Optional[float]:
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports KiB, macOS bytes
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+async def replay(paths: list[str], limit: Optional[int] = None) -> dict:
+    """Run the corpus through a fresh engine against an in-memory Firestore."""
+    from app.crawler.engine import CrawlerEngine
+    from app.firebase_client import use_firestore
+
+    store = InMemoryFirestore()
+    use_firestore(store)
+    settings.telegram_alerts_enabled = False  # Notify still runs, without real alerts
+
+    engine = CrawlerEngine()
+    engine.dedup_index.checkpoint_path = None
+    engine.cursor_store.path = None
+    engine.corpus = None
+    engine.spool = None
+    engine.evidence_store = None
+    for stage in engine.pipeline.stages:
+        stage.timings = []
+
+    # Load up front so decompression isn't counted as pipeline time
+    records = list(itertools.islice(
+        itertools.chain.from_iterable(read_corpus(path) for path in paths),
+        limit or None,
+    ))
+    if not records:
+        raise SystemExit("Corpus is empty")
+
+    await engine.start(crawl=False)
+    latencies: list[float] = []
+    started = time.perf_counter()
+    futures = []
+    for source_key, post in records:
+        submitted = time.perf_counter()
+        done = await engine.pipeline.submit(post, source_key=source_key)
+        done.add_done_callback(lambda _, t=submitted: latencies.append(time.perf_counter() - t))
+        futures.append(done)
+    stored = sum(await asyncio.gather(*futures))
+    elapsed = time.perf_counter() - started
+    await engine.stop()
+
+    threats = store.docs("threats")
+    return {
+        "posts": len(records),
+        "threats": stored,
+        "sightings": sum(max(0, doc.get("sighting_count", 1) - 1) for doc in threats.values()),
+        "elapsed": elapsed,
+        "stages": {
+            stage.name: (stage.batch_size, sorted(stage.timings), stage.processed)
+            for stage in engine.pipeline.stages
+        },
+        "latencies": sorted(latencies),
+        "peak_memory_mb": _peak_memory_mb(),
+    }
+
+
+def _print_report(result: dict) -> None:
+    posts, elapsed = result["posts"], result["elapsed"]
+    print(f"\nReplayed {posts} posts in {elapsed:.2f}s — {posts / elapsed:.1f} posts/sec")
+    print(f"Threats stored: {result['threats']}, near-duplicate sightings: {result['sightings']}")
+
+    print(f"\n{'stage':<10}{'calls':>8}{'items':>8}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}{'total s':>10}")
+    for name, (batch_size, timings, processed) in result["stages"].items():
+        print(
+            f"{name:<10}{len(timings):>8}{processed:>8}"
+            f"{_percentile(timings, 50) * 1000:>10.2f}"
+            f"{_percentile(timings, 95) * 1000:>10.2f}"
+            f"{_percentile(timings, 99) * 1000:>10.2f}"
+            f"{sum(timings):>10.2f}"
+        )
+
+    latencies = result["latencies"]
+    print(
+        f"\nEnd-to-end per post: p50 {_percentile(latencies, 50) * 1000:.1f} ms, "
+        f"p95 {_percentile(latencies, 95) * 1000:.1f} ms, "
+        f"p99 {_percentile(latencies, 99) * 1000:.1f} ms"
+    )
+    if result["peak_memory_mb"] is not None:
+        print(f"Peak memory (RSS): {result['peak_memory_mb']:.1f} MiB")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        prog="python -m app.crawler.replay",
+        description="Replay a captured post corpus through the analysis pipeline offline.",
+    )
+    parser.add_argument("corpus", nargs="+", help="Captured corpus file(s) (.jsonl.gz)")
+    parser.add_argument(
+        "--processes", type=int, default=settings.analysis_processes,
+        help="Analysis worker processes (0 = analyze inline on the event loop)",
+    )
+    parser.add_argument("--limit", type=int, default=None, help="Replay at most this many posts")
+    parser.add_argument("--verbose", action="store_true", help="Show pipeline log output")
+    args = parser.parse_args()
+
+    # Offline: no leases, no captures of the replay itself
+    settings.analysis_processes = max(0, args.processes)
+    settings.crawler_lease_backend = "none"
+    settings.crawler_capture_dir = ""
+
+    logging.basicConfig(
+        level=logging.INFO if args.verbose else logging.WARNING,
+        format="%(asctime)s │ %(levelname)-8s │ %(name)-25s │ %(message)s",
+        datefmt="%Y-%m-%d %H:%M:%S",
+    )
+    _print_report(asyncio.run(replay(args.corpus, args.limit)))
+
+
+if __name__ == "__main__":
+    main()
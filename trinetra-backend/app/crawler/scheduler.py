@@ -0,0 +1,156 @@
+"""
+Adaptive Scheduler — one crawl schedule per source instead of one global interval.
+
+Each source keeps its own interval, which adapts to what its recent
+fetches produced:
+
+- a fetch that yields threats halves the interval,
+- a fetch with new posts but no threats shortens it,
+- an empty fetch lengthens it,
+- a failed fetch backs it off exponentially.
+
+Intervals stay within [min_interval, max_interval], so fast-moving paste
+feeds are polled often while quiet or failing forums fade to the
+maximum. Sources are kept in a min-heap ordered by next-run time.
+"""
+import heapq
+import random
+import time
+from dataclasses import dataclass
+from typing import Iterable, Optional
+
+# Weight of the latest fetch in the exponential moving averages
+_EMA_ALPHA = 0.3
+
+
+@dataclass
+class SourceSchedule:
+    """Scheduling state and recent performance of a single source."""
+    key: str
+    interval: float
+    next_run: float
+    runs: int = 0
+    errors: int = 0
+    yield_ema: float = 0.0   # Average (new posts + threats) per fetch
+    error_ema: float = 0.0   # Average failure rate
+    last_posts: int = 0
+    last_threats: int = 0
+
+
+class AdaptiveScheduler:
+    """
+    Priority scheduler over per-source schedules.
+
+    Usage:
+        scheduler.sync(["Reddit Scraper", "Pastebin Scraper"])
+        for key in scheduler.pop_due():
+            ... fetch ...
+            scheduler.record(key, posts=12, threats=1, failed=False)
+    """
+
+    def __init__(
+        self,
+        base_interval: float = 300,
+        min_interval: float = 60,
+        max_interval: float = 1800,
+    ):
+        self.base_interval = base_interval
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self._schedules: dict[str, SourceSchedule] = {}
+        self._heap: list[tuple[float, str]] = []
+        self._in_flight: set[str] = set()
+
+    def sync(self, keys: Iterable[str], now: Optional[float] = None) -> None:
+        """Add newly configured sources (due immediately) and drop removed ones."""
+        now = time.monotonic() if now is None else now
+        keys = set(keys)
+
+        for key in list(self._schedules):
+            if key not in keys:
+                del self._schedules[key]
+
+        for key in keys:
+            if key not in self._schedules:
+                self._schedules[key] = SourceSchedule(
+                    key=key, interval=self.base_interval, next_run=now
+                )
+                heapq.heappush(self._heap, (now, key))
+
+    def pop_due(self, now: Optional[float] = None) -> list[str]:
+        """Return every source whose next run time has passed, marking it in flight."""
+        now = time.monotonic() if now is None else now
+        due = []
+        while self._heap and self._heap[0][0] <= now:
+            next_run, key = heapq.heappop(self._heap)
+            schedule = self._schedules.get(key)
+            # Skip heap entries for removed sources or superseded run times
+            if schedule is None or schedule.next_run != next_run or key in self._in_flight:
+                continue
+            self._in_flight.add(key)
+            due.append(key)
+        return due
+
+    def seconds_until_next(self, now: Optional[float] = None) -> float:
+        """Time until the earliest scheduled run (inf if nothing is scheduled)."""
+        now = time.monotonic() if now is None else now
+        while self._heap:
+            next_run, key = self._heap[0]
+            schedule = self._schedules.get(key)
+            if schedule is None or schedule.next_run != next_run or key in self._in_flight:
+                heapq.heappop(self._heap)
+                continue
+            return max(0.0, next_run - now)
+        return float("inf")
+
+    def record(
+        self,
+        key: str,
+        posts: int,
+        threats: int,
+        failed: bool,
+        now: Optional[float] = None,
+    ) -> None:
+        """Record a fetch outcome, adapt the source's interval and reschedule it."""
+        now = time.monotonic() if now is None else now
+        self._in_flight.discard(key)
+        schedule = self._schedules.get(key)
+        if schedule is None:
+            return
+
+        schedule.runs += 1
+        schedule.last_posts = posts
+        schedule.last_threats = threats
+        schedule.yield_ema += _EMA_ALPHA * ((posts + threats) - schedule.yield_ema)
+        schedule.error_ema += _EMA_ALPHA * (float(failed) - schedule.error_ema)
+
+        if failed:
+            schedule.errors += 1
+            factor = 2.0
+        elif threats:
+            factor = 0.5
+        elif posts:
+            factor = 0.8
+        else:
+            factor = 1.5
+
+        schedule.interval = min(
+            self.max_interval, max(self.min_interval, schedule.interval * factor)
+        )
+        # ±10% jitter keeps sources from falling into lockstep
+        schedule.next_run = now + schedule.interval * random.uniform(0.9, 1.1)
+        heapq.heappush(self._heap, (schedule.next_run, key))
+
+    def defer(self, key: str, seconds: float, now: Optional[float] = None) -> None:
+        """Reschedule a due source without adapting its interval (e.g. leased elsewhere)."""
+        now = time.monotonic() if now is None else now
+        self._in_flight.discard(key)
+        schedule = self._schedules.get(key)
+        if schedule is None:
+            return
+        schedule.next_run = now + max(seconds, 1.0)
+        heapq.heappush(self._heap, (schedule.next_run, key))
+
+    def snapshot(self) -> dict[str, SourceSchedule]:
+        """Current schedule of every source."""
+        return dict(self._schedules)
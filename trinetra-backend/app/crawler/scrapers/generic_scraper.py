@@ -4,8 +4,13 @@ Supports configurable CSS selectors for extracting posts from any forum.
 """
 import httpx
 import logging
+import soupsieve
 from bs4 import BeautifulSoup
 from app.crawler.base_scraper import BaseScraper, RawPost
+from app.crawler.html_extract import PostExtractor, compile_selectors, extract_posts
+from app.crawler.registry import SourceConfig, register_scraper
+from app.crawler.source_health import CircuitOpenError
+from app.http_client import get_http_client
 
 logger = logging.getLogger(__name__)
 
@@ -17,6 +22,8 @@ _DEFAULT_SELECTORS = {
     "author": ".author, .username, .user, .poster",
 }
 
+_DEFAULT_MAX_PAGE_BYTES = 1024 * 1024
+
 _HEADERS = {
     "User-Agent": (
         "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
@@ -27,50 +34,167 @@ _HEADERS = {
 }
 
 
+@register_scraper("forum")
 class GenericForumScraper(BaseScraper):
     """
     Scrapes forum posts from any publicly accessible URL using
     configurable CSS selectors. Designed to be flexible and extensible.
+    Selectors are compiled once per scraper instance; a source document
+    overrides any of them (see `from_source`).
+
+    Pages are fetched with conditional GETs: the ETag / Last-Modified
+    validators of each URL are kept as its cursor, and an unchanged page
+    (304 Not Modified) yields no posts.
+
+    Pages are parsed as they stream in (see app.crawler.html_extract) and
+    the download stops after `max_posts` post containers or `max_page_bytes`;
+    with a `parse_pool` attached, the capped page is parsed in a worker
+    process instead.
     """
 
+    cursor_prefix = "forum:"
+
     def __init__(
         self,
         urls: list[str] | None = None,
         selectors: dict[str, str] | None = None,
+        name: str = "Generic Forum Scraper",
+        max_posts: int = 25,
+        timeout: float = 20.0,
     ):
-        super().__init__(name="Generic Forum Scraper")
+        super().__init__(name=name)
         self.urls = urls or []
-        self.selectors = selectors or _DEFAULT_SELECTORS
+        self.selectors = {**_DEFAULT_SELECTORS, **(selectors or {})}
+        self.max_posts = max_posts
+        self.timeout = timeout
+        # Simple tag/class/id selectors are matched while the page streams in;
+        # anything else goes through BeautifulSoup with selectors compiled here, once
+        self._matchers = compile_selectors(self.selectors)
+        self._css = (
+            {field: soupsieve.compile(selector) for field, selector in self.selectors.items()}
+            if self._matchers is None else None
+        )
+
+    @classmethod
+    def from_source(cls, config: SourceConfig) -> "GenericForumScraper":
+        """One scraper per forum source, with the document's selectors and budgets."""
+        scraper = cls(
+            urls=[config.url],
+            selectors=config.selectors,
+            name=config.key,
+            max_posts=config.max_posts,
+            timeout=config.timeout_seconds or 20.0,
+        )
+        if config.max_page_kb:
+            scraper.max_page_bytes = config.max_page_kb * 1024
+        # Only this URL's cursor travels with the source's lease
+        scraper.cursor_prefix = f"forum:{config.url}"
+        return scraper
 
     async def scrape(self) -> list[RawPost]:
-        """Scrape all configured URLs."""
-        all_posts: list[RawPost] = []
-
-        async with httpx.AsyncClient(
-            headers=_HEADERS, timeout=20.0, follow_redirects=True
-        ) as client:
-            for url in self.urls:
-                try:
-                    posts = await self._scrape_url(client, url)
-                    all_posts.extend(posts)
-                    logger.info(f"Generic: scraped {len(posts)} posts from {url}")
-                except Exception as exc:
-                    logger.warning(f"Generic: failed to scrape {url}: {exc}")
-
-        return all_posts
+        """Scrape all configured URLs. Raises only if every URL that was tried failed."""
+        client = get_http_client()
+        failures: list[Exception] = []
+
+        async def _scrape_one(url: str) -> list[RawPost]:
+            try:
+                posts = await self.crawl_target(
+                    f"forum:{url}", lambda: self._scrape_url(client, url)
+                )
+                logger.info(f"Generic: scraped {len(posts)} posts from {url}")
+                return posts
+            except CircuitOpenError as exc:
+                logger.debug(f"Generic: skipping {url}: {exc}")
+                return []
+            except Exception as exc:
+                failures.append(exc)
+                logger.warning(f"Generic: failed to scrape {url}: {exc}")
+                return []
+
+        results = await self.gather_bounded(_scrape_one, self.urls)
+        posts = [post for posts in results for post in posts]
+        if failures and len(failures) == len(self.urls):
+            raise RuntimeError(f"all {len(failures)} forum URLs failed: {failures[0]}")
+        return posts
 
     async def _scrape_url(
         self, client: httpx.AsyncClient, url: str
     ) -> list[RawPost]:
-        """Scrape a single forum URL."""
-        resp = await client.get(url)
-        resp.raise_for_status()
-
-        soup = BeautifulSoup(resp.text, "lxml")
+        """Scrape a single forum URL, skipping it if unchanged since last fetch."""
+        cursor_key = f"forum:{url}"
+        cursor = self.get_cursor(cursor_key)
+
+        headers = dict(_HEADERS)
+        if cursor.get("etag"):
+            headers["If-None-Match"] = cursor["etag"]
+        if cursor.get("last_modified"):
+            headers["If-Modified-Since"] = cursor["last_modified"]
+
+        resp = await self.fetch(
+            client, url, stream=True, headers=headers, timeout=self.timeout, follow_redirects=True
+        )
+        try:
+            if resp.status_code == 304:
+                return []
+            resp.raise_for_status()
+
+            if self._matchers is None:
+                posts = self._extract_with_dom(url, await self._read_capped(resp, url), resp.encoding)
+            elif self.parse_pool is not None:
+                body = await self._read_capped(resp, url)
+                posts = await self.parse_pool.run(
+                    extract_posts, body, url, self.selectors, resp.encoding, self.max_posts
+                )
+            else:
+                posts = await self._extract_streaming(resp, url)
+
+            # Only a page whose posts were extracted may be skipped as unchanged next time
+            validators = {
+                "etag": resp.headers.get("ETag"),
+                "last_modified": resp.headers.get("Last-Modified"),
+            }
+            if any(validators.values()):
+                self.set_cursor(cursor_key, {k: v for k, v in validators.items() if v})
+            return posts
+        finally:
+            await resp.aclose()
+
+    async def _extract_streaming(self, resp: httpx.Response, url: str) -> list[RawPost]:
+        """Parse the page as it downloads; stop once enough posts were found or the budget is spent."""
+        extractor = PostExtractor(url, self._matchers, resp.encoding, max_posts=self.max_posts)
+        budget = self._page_budget()
+        received = 0
+        async for chunk in resp.aiter_bytes():
+            extractor.feed(chunk[:budget - received])
+            received += len(chunk)
+            if extractor.done:
+                break
+            if received >= budget:
+                logger.debug(f"Generic: {url} truncated at {budget} bytes")
+                break
+        return extractor.close()
+
+    async def _read_capped(self, resp: httpx.Response, url: str) -> bytes:
+        """Read the body, up to `max_page_bytes`."""
+        budget = self._page_budget()
+        body = bytearray()
+        async for chunk in resp.aiter_bytes():
+            body += chunk[:budget - len(body)]
+            if len(body) >= budget:
+                logger.debug(f"Generic: {url} truncated at {budget} bytes")
+                break
+        return bytes(body)
+
+    def _page_budget(self) -> int:
+        return self.max_page_bytes or _DEFAULT_MAX_PAGE_BYTES
+
+    def _extract_with_dom(self, url: str, body: bytes, encoding: str) -> list[RawPost]:
+        """BeautifulSoup extraction, for selectors the streaming extractor can't match."""
+        soup = BeautifulSoup(body.decode(encoding or "utf-8", errors="replace"), "lxml")
         posts = []
 
         # Find post containers using configurable selectors
-        containers = soup.select(self.selectors["post_container"])
+        containers = self._css["post_container"].select(soup, limit=self.max_posts)
 
         if not containers:
             # Fallback: try to extract all visible text from the page
@@ -86,10 +210,10 @@ class GenericForumScraper(BaseScraper):
                 )
             return posts
 
-        for container in containers[:25]:  # Limit to 25 posts per page
-            title = self._extract_text(container, self.selectors["title"])
-            content = self._extract_text(container, self.selectors["content"])
-            author = self._extract_text(container, self.selectors["author"])
+        for container in containers:
+            title = self._extract_text(container, self._css["title"])
+            content = self._extract_text(container, self._css["content"])
+            author = self._extract_text(container, self._css["author"])
 
             combined = f"{title}\n\n{content}" if content else title
             if not combined.strip() or len(combined) < 10:
@@ -119,10 +243,10 @@ class GenericForumScraper(BaseScraper):
         return posts
 
     @staticmethod
-    def _extract_text(container, selector: str) -> str:
-        """Extract text from a container element using CSS selector."""
+    def _extract_text(container, selector: soupsieve.SoupSieve) -> str:
+        """Extract text from a container element using a compiled CSS selector."""
         try:
-            element = container.select_one(selector)
+            element = selector.select_one(container)
             if element:
                 return element.get_text(separator=" ", strip=True)
         except Exception:
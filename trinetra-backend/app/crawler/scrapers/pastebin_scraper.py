@@ -6,6 +6,8 @@ but basic access works for limited polling).
 import httpx
 import logging
 from app.crawler.base_scraper import BaseScraper, RawPost
+from app.crawler.source_health import CircuitOpenError
+from app.http_client import get_http_client
 
 logger = logging.getLogger(__name__)
 
@@ -14,8 +16,14 @@ class PastebinScraper(BaseScraper):
     """
     Scrapes recent public pastes from Pastebin.
     Falls back to scraping the raw paste archive if the API is unavailable.
+
+    Crawls incrementally: listings are newest-first, so the newest paste
+    key is kept as a cursor and the next cycle stops as soon as it
+    reaches that key again.
     """
 
+    cursor_prefix = "pastebin:"
+
     def __init__(self, max_pastes: int = 20):
         super().__init__(name="Pastebin Scraper")
         self.max_pastes = max_pastes
@@ -23,65 +31,84 @@ class PastebinScraper(BaseScraper):
         self._raw_url = "https://scrape.pastebin.com/api_scrape_item.php"
 
     async def scrape(self) -> list[RawPost]:
-        """Scrape recent pastes from Pastebin's scraping API."""
-        posts: list[RawPost] = []
-
-        async with httpx.AsyncClient(timeout=15.0) as client:
-            try:
-                # Attempt the official scraping API
-                posts = await self._scrape_via_api(client)
-            except Exception as exc:
+        """
+        Scrape recent pastes from Pastebin's scraping API, falling back to
+        the archive page. Raises if neither could be fetched.
+        """
+        client = get_http_client()
+        try:
+            # Attempt the official scraping API
+            posts = await self.crawl_target(
+                "pastebin:api", lambda: self._scrape_via_api(client)
+            )
+        except Exception as exc:
+            if not isinstance(exc, CircuitOpenError):
                 logger.warning(f"Pastebin API scrape failed: {exc}")
-                # Fallback: try to scrape trending/archive page
-                try:
-                    posts = await self._scrape_archive(client)
-                except Exception as exc2:
-                    logger.warning(f"Pastebin archive scrape also failed: {exc2}")
+            # Fallback: try to scrape trending/archive page
+            try:
+                posts = await self.crawl_target(
+                    "pastebin:archive", lambda: self._scrape_archive(client)
+                )
+            except CircuitOpenError:
+                posts = []
+            except Exception as exc2:
+                logger.warning(f"Pastebin archive scrape also failed: {exc2}")
+                raise
 
         logger.info(f"Pastebin: scraped {len(posts)} pastes")
         return posts
 
     async def _scrape_via_api(self, client: httpx.AsyncClient) -> list[RawPost]:
         """Use Pastebin's scraping API to get recent pastes."""
-        resp = await client.get(
-            self._scrape_url, params={"limit": self.max_pastes}
+        resp = await self.fetch(
+            client, self._scrape_url, params={"limit": self.max_pastes}
         )
         resp.raise_for_status()
 
         paste_list = resp.json()
-        posts = []
 
+        cursor = self.get_cursor("pastebin:api")
+        new_pastes = []
         for paste_meta in paste_list[:self.max_pastes]:
+            # Everything from the last seen paste onwards was already processed
+            if paste_meta.get("key", "") == cursor.get("key") or self._not_newer(
+                paste_meta.get("date", ""), cursor.get("date")
+            ):
+                break
+            new_pastes.append(paste_meta)
+
+        async def _fetch_paste(paste_meta: dict) -> RawPost | None:
             paste_key = paste_meta.get("key", "")
             title = paste_meta.get("title", "Untitled")
-            user = paste_meta.get("user", "Anonymous")
-            date = paste_meta.get("date", "")
 
-            # Fetch the raw content of each paste
-            try:
-                raw_resp = await client.get(
-                    self._raw_url, params={"i": paste_key}
-                )
-                raw_resp.raise_for_status()
-                content = raw_resp.text
-            except Exception:
-                content = title  # Use title as fallback
+            # Fetch the raw content of each paste; a failure fails the target
+            # before the cursor moves, so the paste is fetched again
+            raw_resp = await self.fetch(
+                client, self._raw_url, params={"i": paste_key}
+            )
+            raw_resp.raise_for_status()
+            content = raw_resp.text
 
             if not content.strip():
-                continue
-
-            posts.append(
-                RawPost(
-                    content=content[:5000],  # Limit content size
-                    title=title,
-                    author=user,
-                    url=f"https://pastebin.com/{paste_key}",
-                    timestamp=self._unix_to_iso(date),
-                    source_name="Pastebin",
-                )
+                return None
+
+            return RawPost(
+                content=content[:5000],  # Limit content size
+                full_content=content if len(content) > 5000 else "",
+                title=title,
+                author=paste_meta.get("user", "Anonymous"),
+                url=f"https://pastebin.com/{paste_key}",
+                timestamp=self._unix_to_iso(paste_meta.get("date", "")),
+                source_name="Pastebin",
             )
 
-        return posts
+        posts = await self.gather_bounded(_fetch_paste, new_pastes)
+        if paste_list:
+            self.set_cursor(
+                "pastebin:api",
+                {"key": paste_list[0].get("key", ""), "date": paste_list[0].get("date", "")},
+            )
+        return [post for post in posts if post is not None]
 
     async def _scrape_archive(self, client: httpx.AsyncClient) -> list[RawPost]:
         """
@@ -90,21 +117,24 @@ class PastebinScraper(BaseScraper):
         """
         from bs4 import BeautifulSoup
 
-        resp = await client.get(
+        resp = await self.fetch(
+            client,
             "https://pastebin.com/archive",
             headers={"User-Agent": "Trinetra-ThreatIntel/1.0"},
         )
         resp.raise_for_status()
 
         soup = BeautifulSoup(resp.text, "lxml")
-        posts = []
 
         # Find paste links in the archive table
         table = soup.find("table", class_="maintable")
         if not table:
-            return posts
+            return []
 
         rows = table.find_all("tr")[1:]  # Skip header row
+        cursor = self.get_cursor("pastebin:archive")
+        new_pastes: list[tuple[str, str]] = []
+
         for row in rows[: self.max_pastes]:
             cells = row.find_all("td")
             if len(cells) < 2:
@@ -118,29 +148,45 @@ class PastebinScraper(BaseScraper):
             href = link_tag.get("href", "")
             paste_key = href.strip("/")
 
-            # Fetch raw content
-            try:
-                raw_resp = await client.get(
-                    f"https://pastebin.com/raw/{paste_key}",
-                    headers={"User-Agent": "Trinetra-ThreatIntel/1.0"},
-                )
-                raw_resp.raise_for_status()
-                content = raw_resp.text[:5000]
-            except Exception:
-                content = title
-
-            posts.append(
-                RawPost(
-                    content=content,
-                    title=title,
-                    author="Anonymous",
-                    url=f"https://pastebin.com/{paste_key}",
-                    source_name="Pastebin Archive",
-                )
+            # Archive is newest-first; stop at the last paste seen
+            if paste_key == cursor.get("key"):
+                break
+            new_pastes.append((paste_key, title))
+
+        async def _fetch_paste(paste: tuple[str, str]) -> RawPost:
+            paste_key, title = paste
+
+            # Fetch raw content; a failure fails the target before the cursor moves
+            raw_resp = await self.fetch(
+                client,
+                f"https://pastebin.com/raw/{paste_key}",
+                headers={"User-Agent": "Trinetra-ThreatIntel/1.0"},
+            )
+            raw_resp.raise_for_status()
+            content = raw_resp.text
+
+            return RawPost(
+                content=content[:5000],
+                full_content=content if len(content) > 5000 else "",
+                title=title,
+                author="Anonymous",
+                url=f"https://pastebin.com/{paste_key}",
+                source_name="Pastebin Archive",
             )
 
+        posts = await self.gather_bounded(_fetch_paste, new_pastes)
+        if new_pastes:
+            self.set_cursor("pastebin:archive", {"key": new_pastes[0][0]})
         return posts
 
+    @staticmethod
+    def _not_newer(date: str, cursor_date: str | None) -> bool:
+        """True if a paste's Unix date is older than the cursor's."""
+        try:
+            return int(date) < int(cursor_date)
+        except (ValueError, TypeError):
+            return False
+
     @staticmethod
     def _unix_to_iso(unix_str: str) -> str:
         """Convert Unix timestamp string to ISO 8601."""
@@ -4,7 +4,10 @@ No API key required. Uses the .json endpoint available on all public subreddits.
 """
 import httpx
 import logging
+import time
 from app.crawler.base_scraper import BaseScraper, RawPost
+from app.crawler.source_health import CircuitOpenError
+from app.http_client import get_http_client
 
 logger = logging.getLogger(__name__)
 
@@ -22,13 +25,23 @@ _HEADERS = {
     "User-Agent": "Trinetra-ThreatIntel/1.0 (Threat Intelligence Platform)"
 }
 
+# A `before` anchor that returns nothing for this long is assumed deleted
+# (Reddit then returns an empty listing forever), so the cursor is reset.
+_STALE_CURSOR_SECONDS = 6 * 3600
+
 
 class RedditScraper(BaseScraper):
     """
     Scrapes posts from cybersecurity-related subreddits using
     Reddit's public .json API (no authentication needed).
+
+    Crawls incrementally: the newest post's fullname is kept as a
+    per-subreddit cursor and passed as `before`, so each cycle only
+    returns posts newer than the last one seen.
     """
 
+    cursor_prefix = "reddit:"
+
     def __init__(
         self,
         subreddits: list[str] | None = None,
@@ -39,38 +52,72 @@ class RedditScraper(BaseScraper):
         self.posts_per_sub = posts_per_sub
 
     async def scrape(self) -> list[RawPost]:
-        """Scrape recent posts from all configured subreddits."""
-        all_posts: list[RawPost] = []
-
-        async with httpx.AsyncClient(
-            headers=_HEADERS, timeout=15.0, follow_redirects=True
-        ) as client:
-            for subreddit in self.subreddits:
-                try:
-                    posts = await self._scrape_subreddit(client, subreddit)
-                    all_posts.extend(posts)
-                    logger.info(
-                        f"Reddit: scraped {len(posts)} posts from r/{subreddit}"
-                    )
-                except Exception as exc:
-                    logger.warning(
-                        f"Reddit: failed to scrape r/{subreddit}: {exc}"
-                    )
-
-        return all_posts
+        """
+        Scrape recent posts from all configured subreddits. Raises only if
+        every subreddit that was tried failed.
+        """
+        client = get_http_client()
+        failures: list[Exception] = []
+
+        async def _scrape_one(subreddit: str) -> list[RawPost]:
+            try:
+                posts = await self.crawl_target(
+                    f"reddit:{subreddit}",
+                    lambda: self._scrape_subreddit(client, subreddit),
+                )
+                logger.info(
+                    f"Reddit: scraped {len(posts)} posts from r/{subreddit}"
+                )
+                return posts
+            except CircuitOpenError as exc:
+                logger.debug(f"Reddit: skipping r/{subreddit}: {exc}")
+                return []
+            except Exception as exc:
+                failures.append(exc)
+                logger.warning(
+                    f"Reddit: failed to scrape r/{subreddit}: {exc}"
+                )
+                return []
+
+        results = await self.gather_bounded(_scrape_one, self.subreddits)
+        posts = [post for posts in results for post in posts]
+        if failures and len(failures) == len(self.subreddits):
+            raise RuntimeError(f"all {len(failures)} subreddits failed: {failures[0]}")
+        return posts
 
     async def _scrape_subreddit(
         self, client: httpx.AsyncClient, subreddit: str
     ) -> list[RawPost]:
-        """Scrape a single subreddit's recent posts."""
-        url = f"https://www.reddit.com/r/{subreddit}/new.json?limit={self.posts_per_sub}"
-        resp = await client.get(url)
+        """Scrape a single subreddit's posts newer than its cursor."""
+        cursor_key = f"reddit:{subreddit}"
+        cursor = self.get_cursor(cursor_key)
+
+        url = f"https://www.reddit.com/r/{subreddit}/new.json"
+        params = {"limit": self.posts_per_sub}
+        if cursor.get("before"):
+            params["before"] = cursor["before"]
+
+        resp = await self.fetch(
+            client, url, params=params, headers=_HEADERS, follow_redirects=True
+        )
         resp.raise_for_status()
         data = resp.json()
 
         posts = []
         children = data.get("data", {}).get("children", [])
 
+        # Listings are newest-first: the first child becomes the new cursor
+        if children:
+            newest = children[0].get("data", {})
+            self.set_cursor(
+                cursor_key,
+                {"before": newest.get("name", ""), "created_utc": newest.get("created_utc", 0)},
+            )
+        elif cursor.get("before") and (
+            time.time() - cursor.get("created_utc", 0) > _STALE_CURSOR_SECONDS
+        ):
+            self.set_cursor(cursor_key, {})
+
         for child in children:
             post_data = child.get("data", {})
             title = post_data.get("title", "")
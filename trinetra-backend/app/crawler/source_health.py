@@ -0,0 +1,293 @@
+"""
+Source Health — retries, circuit breakers and fetch statistics per source.
+
+Every fetch target (a scraper as a whole, and each subreddit, paste feed
+or forum URL it crawls) gets a `SourceHealth` record:
+
+- transient failures (timeouts, connection errors, 429 / 5xx) are retried
+  within the cycle with jittered exponential backoff,
+- after `failure_threshold` consecutive failed fetches the target's
+  circuit opens and it is skipped until a cool-down has passed; then a
+  single trial fetch is let through (half-open). A failed trial doubles
+  the cool-down, up to `max_reset_seconds`; a successful one closes it,
+- success rate (over the last `window` fetches), latency and the time
+  of the last success are kept for the API and the dashboard.
+"""
+import asyncio
+import logging
+import random
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import Awaitable, Callable, Iterable, Optional, TypeVar
+
+import httpx
+
+from app.metrics import Counter
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+# Weight of the latest fetch in the latency moving average
+_EMA_ALPHA = 0.3
+
+SOURCE_RETRIES = Counter(
+    "trinetra_source_retries_total",
+    "Fetches retried after a transient failure",
+    ["source"],
+)
+SOURCE_CIRCUIT_OPENED = Counter(
+    "trinetra_source_circuit_opened_total",
+    "Times a source's circuit breaker opened",
+    ["source"],
+)
+
+
+class CircuitOpenError(Exception):
+    """Raised instead of fetching a source whose circuit breaker is open."""
+
+    def __init__(self, key: str, retry_in: float):
+        super().__init__(f"Circuit open for {key}, retry in {retry_in:.0f}s")
+        self.key = key
+        self.retry_in = retry_in
+
+
+def _utc_now() -> str:
+    return datetime.now(timezone.utc).isoformat()
+
+
+def is_retryable(exc: BaseException) -> bool:
+    """Timeouts, connection errors, 429 and 5xx are worth retrying; anything else is not."""
+    if isinstance(exc, httpx.HTTPStatusError):
+        status = exc.response.status_code
+        return status == 429 or status >= 500
+    return isinstance(exc, (httpx.TransportError, asyncio.TimeoutError, ConnectionError))
+
+
+def backoff_delay(attempt: int, base: float, cap: float) -> float:
+    """Full-jitter exponential backoff: uniform in [0, min(cap, base * 2^attempt)]."""
+    return random.uniform(0, min(cap, base * (2 ** attempt)))
+
+
+@dataclass
+class SourceHealth:
+    """Fetch statistics and circuit breaker state of a single source."""
+    key: str
+    state: str = CLOSED
+    attempts: int = 0
+    successes: int = 0
+    failures: int = 0
+    consecutive_failures: int = 0
+    latency_ema: float = 0.0
+    last_latency: float = 0.0
+    last_success: Optional[str] = None
+    last_failure: Optional[str] = None
+    last_error: Optional[str] = None
+    opened_until: float = 0.0      # Monotonic time the open circuit allows a trial
+    reset_seconds: float = 0.0     # Current cool-down (doubles on a failed trial)
+    recent: deque = field(default_factory=deque)  # Recent outcomes, True = success
+
+    @property
+    def success_rate(self) -> Optional[float]:
+        """Share of successful fetches over the recent window (None before the first)."""
+        if not self.recent:
+            return None
+        return sum(self.recent) / len(self.recent)
+
+    def to_dict(self) -> dict:
+        return {
+            "key": self.key,
+            "state": self.state,
+            "attempts": self.attempts,
+            "successes": self.successes,
+            "failures": self.failures,
+            "consecutive_failures": self.consecutive_failures,
+            "success_rate": round(self.success_rate, 3) if self.success_rate is not None else None,
+            "latency_ms": round(self.latency_ema * 1000, 1),
+            "last_latency_ms": round(self.last_latency * 1000, 1),
+            "last_success": self.last_success,
+            "last_failure": self.last_failure,
+            "last_error": self.last_error,
+            "retry_in_seconds": (
+                round(max(0.0, self.opened_until - time.monotonic()), 1)
+                if self.state == OPEN else None
+            ),
+        }
+
+
+class HealthRegistry:
+    """
+    Health records and circuit breakers for all sources.
+
+    Usage:
+        posts = await health.call("forum:https://x.example/board", lambda: fetch(...))
+        health.snapshot()["forum:https://x.example/board"]["success_rate"]
+    """
+
+    def __init__(
+        self,
+        failure_threshold: int = 5,
+        reset_seconds: float = 300,
+        max_reset_seconds: float = 3600,
+        retries: int = 2,
+        retry_base_seconds: float = 1.0,
+        retry_max_seconds: float = 30.0,
+        window: int = 20,
+    ):
+        self.failure_threshold = failure_threshold
+        self.reset_seconds = reset_seconds
+        self.max_reset_seconds = max_reset_seconds
+        self.retries = retries
+        self.retry_base_seconds = retry_base_seconds
+        self.retry_max_seconds = retry_max_seconds
+        self.window = window
+        self._sources: dict[str, SourceHealth] = {}
+
+    def get(self, key: str) -> SourceHealth:
+        health = self._sources.get(key)
+        if health is None:
+            health = self._sources[key] = SourceHealth(
+                key=key, reset_seconds=self.reset_seconds, recent=deque(maxlen=self.window)
+            )
+        return health
+
+    # ═══ Circuit breaker ═══
+
+    def allow(self, key: str, now: Optional[float] = None) -> bool:
+        """
+        Whether `key` may be fetched now. An open circuit whose cool-down has
+        passed turns half-open and lets exactly one trial fetch through.
+        """
+        health = self.get(key)
+        if health.state == CLOSED:
+            return True
+        if health.state == HALF_OPEN:
+            return False  # The trial fetch is still running
+        now = time.monotonic() if now is None else now
+        if now < health.opened_until:
+            return False
+        health.state = HALF_OPEN
+        return True
+
+    def retry_in(self, key: str, now: Optional[float] = None) -> float:
+        """Seconds until an open circuit allows a trial fetch (0 if not open)."""
+        health = self._sources.get(key)
+        if health is None or health.state != OPEN:
+            return 0.0
+        now = time.monotonic() if now is None else now
+        return max(0.0, health.opened_until - now)
+
+    def record(
+        self,
+        key: str,
+        ok: bool,
+        latency: float,
+        error: Optional[BaseException] = None,
+        now: Optional[float] = None,
+    ) -> None:
+        """Record a fetch outcome and advance the circuit breaker."""
+        now = time.monotonic() if now is None else now
+        health = self.get(key)
+        health.attempts += 1
+        health.last_latency = latency
+        health.latency_ema = (
+            latency if health.attempts == 1
+            else health.latency_ema + _EMA_ALPHA * (latency - health.latency_ema)
+        )
+        health.recent.append(ok)
+
+        if ok:
+            health.successes += 1
+            health.consecutive_failures = 0
+            health.last_success = _utc_now()
+            if health.state != CLOSED:
+                logger.info(f"Circuit closed for {key}")
+            health.state = CLOSED
+            health.reset_seconds = self.reset_seconds
+            return
+
+        health.failures += 1
+        health.consecutive_failures += 1
+        health.last_failure = _utc_now()
+        health.last_error = f"{type(error).__name__}: {error}"[:300] if error else None
+
+        if health.state == HALF_OPEN:
+            # The trial failed: stay open for longer
+            health.reset_seconds = min(self.max_reset_seconds, health.reset_seconds * 2)
+            self._open(health, now)
+        elif health.state == CLOSED and health.consecutive_failures >= self.failure_threshold:
+            self._open(health, now)
+
+    def _open(self, health: SourceHealth, now: float) -> None:
+        health.state = OPEN
+        # ±10% jitter so sources that failed together don't all retry together
+        health.opened_until = now + health.reset_seconds * random.uniform(0.9, 1.1)
+        SOURCE_CIRCUIT_OPENED.labels(health.key).inc()
+        logger.warning(
+            f"Circuit opened for {health.key} after {health.consecutive_failures} "
+            f"consecutive failures; next trial in {health.reset_seconds:.0f}s"
+        )
+
+    # ═══ Guarded fetch ═══
+
+    async def call(self, key: str, fn: Callable[[], Awaitable[T]]) -> T:
+        """
+        Run `fn` through `key`'s circuit breaker, retrying transient failures
+        with jittered exponential backoff. The whole call, retries included,
+        counts as one fetch. Raises CircuitOpenError if the circuit is open.
+        """
+        if not self.allow(key):
+            raise CircuitOpenError(key, self.retry_in(key))
+
+        started = time.monotonic()
+        attempt = 0
+        while True:
+            try:
+                result = await fn()
+            except asyncio.CancelledError:
+                # Not the source's fault: let a half-open circuit trial again
+                health = self.get(key)
+                if health.state == HALF_OPEN:
+                    health.state = OPEN
+                raise
+            except Exception as exc:
+                if attempt < self.retries and is_retryable(exc):
+                    SOURCE_RETRIES.labels(key).inc()
+                    await asyncio.sleep(
+                        backoff_delay(attempt, self.retry_base_seconds, self.retry_max_seconds)
+                    )
+                    attempt += 1
+                    continue
+                self.record(key, False, time.monotonic() - started, exc)
+                raise
+            self.record(key, True, time.monotonic() - started)
+            return result
+
+    # ═══ Stats ═══
+
+    def snapshot(self) -> dict[str, dict]:
+        """Serializable health of every source, keyed by source key."""
+        return {key: health.to_dict() for key, health in self._sources.items()}
+
+
+def merge_snapshots(snapshots: Iterable[dict[str, dict]]) -> dict[str, dict]:
+    """
+    Combine health snapshots from several replicas. For each source the
+    entry from the replica that fetched it most recently wins.
+    """
+    def _last_fetch(entry: dict) -> str:
+        return max(entry.get("last_success") or "", entry.get("last_failure") or "")
+
+    merged: dict[str, dict] = {}
+    for snapshot in snapshots:
+        for key, entry in snapshot.items():
+            current = merged.get(key)
+            if current is None or _last_fetch(entry) > _last_fetch(current):
+                merged[key] = entry
+    return merged
@@ -0,0 +1,265 @@
+"""
+Post Spool — durable write-ahead log between scraping and analysis.
+
+Every fetched post is appended to the spool (and fsynced) before it
+enters the pipeline, and acknowledged once the pipeline is done with it
+(stored, or dropped as a duplicate / non-threat). Posts whose processing
+failed — e.g. Firestore was down — stay unacknowledged and are re-queued
+periodically and after a restart, instead of being lost or re-fetched.
+
+Layout (in `directory`):
+    segment-000000000001.wal   JSON lines: {"seq", "source_key", "post"}
+    segment-000000000001.ack   acknowledged seq numbers, one per line
+
+Segments roll over at `segment_bytes`; a closed segment whose entries are
+all acknowledged is deleted. If the spool grows beyond `max_bytes`, the
+oldest segments are discarded.
+"""
+import asyncio
+import glob
+import json
+import logging
+import os
+from dataclasses import asdict, dataclass, field, fields
+
+from app.crawler.base_scraper import RawPost
+
+logger = logging.getLogger(__name__)
+
+_POST_FIELDS = {f.name for f in fields(RawPost)}
+
+
+@dataclass
+class SpooledPost:
+    """An unacknowledged post read back from the spool."""
+    seq: int
+    source_key: str
+    post: RawPost
+
+
+@dataclass
+class _Segment:
+    first_seq: int
+    path: str
+    size: int = 0
+    seqs: set[int] = field(default_factory=set)   # Entries written to this segment
+    acked: set[int] = field(default_factory=set)  # Entries acknowledged
+
+    @property
+    def ack_path(self) -> str:
+        return self.path[:-len(".wal")] + ".ack"
+
+    @property
+    def complete(self) -> bool:
+        return self.seqs <= self.acked
+
+
+class PostSpool:
+    """
+    Segmented append-only spool of scraped posts.
+
+    Usage:
+        spool = PostSpool("crawler_state/spool")
+        pending = spool.open()                        # unacked posts from before a restart
+        seqs = await spool.append("Reddit Scraper", posts)
+        spool.ack(seqs[0])
+        await spool.flush_acks()
+    """
+
+    def __init__(
+        self,
+        directory: str,
+        segment_bytes: int = 8 * 1024 * 1024,
+        max_bytes: int = 256 * 1024 * 1024,
+    ):
+        self.directory = directory
+        self.segment_bytes = segment_bytes
+        self.max_bytes = max_bytes
+        self._segments: list[_Segment] = []
+        self._segment_of: dict[int, _Segment] = {}  # Unacked seq -> segment
+        self._pending_acks: list[int] = []
+        self._next_seq = 1
+        self._write_lock = asyncio.Lock()
+
+    @property
+    def unacked(self) -> int:
+        """Number of unacknowledged posts."""
+        return len(self._segment_of)
+
+    @property
+    def size(self) -> int:
+        return sum(segment.size for segment in self._segments)
+
+    # ═══ Recovery ═══
+
+    def open(self) -> list[SpooledPost]:
+        """Load existing segments and return every unacknowledged post, oldest first."""
+        os.makedirs(self.directory, exist_ok=True)
+        self._segments, self._segment_of = [], {}
+        pending: list[SpooledPost] = []
+
+        for path in sorted(glob.glob(os.path.join(self.directory, "segment-*.wal"))):
+            first_seq = int(os.path.basename(path)[len("segment-"):-len(".wal")])
+            segment = _Segment(first_seq=first_seq, path=path, size=os.path.getsize(path))
+            segment.acked = self._read_acks(segment.ack_path)
+
+            for entry in self._records(path):
+                segment.seqs.add(entry.seq)
+                self._next_seq = max(self._next_seq, entry.seq + 1)
+                if entry.seq not in segment.acked:
+                    pending.append(entry)
+                    self._segment_of[entry.seq] = segment
+
+            self._segments.append(segment)
+
+        # Everything reopened is closed; new appends go to a fresh segment
+        for segment in list(self._segments):
+            if segment.complete:
+                self._delete(segment)
+        self._segments.append(self._new_segment())
+
+        if pending:
+            logger.info(f"Spool: {len(pending)} unprocessed posts recovered from {self.directory}")
+        return pending
+
+    def pending(self, exclude: set[int] = frozenset()) -> list[SpooledPost]:
+        """
+        Read back every unacknowledged post not in `exclude` (e.g. posts
+        still in the pipeline). Blocking — run in a worker thread.
+        """
+        pending = []
+        for segment in list(self._segments):
+            if segment.complete or not os.path.exists(segment.path):
+                continue
+            for entry in self._records(segment.path):
+                if entry.seq in self._segment_of and entry.seq not in exclude:
+                    pending.append(entry)
+        return pending
+
+    @staticmethod
+    def _records(path: str):
+        with open(path, "r", encoding="utf-8") as fh:
+            for line in fh:
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    continue  # Torn write from a crash
+                post = RawPost(**{
+                    k: v for k, v in record.get("post", {}).items() if k in _POST_FIELDS
+                })
+                yield SpooledPost(record["seq"], record.get("source_key", ""), post)
+
+    @staticmethod
+    def _read_acks(path: str) -> set[int]:
+        if not os.path.exists(path):
+            return set()
+        with open(path, "r", encoding="utf-8") as fh:
+            return {int(line) for line in fh if line.strip().isdigit()}
+
+    # ═══ Append / Ack ═══
+
+    async def append(self, source_key: str, posts: list[RawPost]) -> list[int]:
+        """Durably append posts; returns their sequence numbers."""
+        if not posts:
+            return []
+        async with self._write_lock:
+            if not self._segments:
+                self.open()
+            seqs = list(range(self._next_seq, self._next_seq + len(posts)))
+            self._next_seq += len(posts)
+            payload = "".join(
+                json.dumps({"seq": seq, "source_key": source_key, "post": asdict(post)}) + "\n"
+                for seq, post in zip(seqs, posts)
+            ).encode("utf-8")
+
+            segment = self._segments[-1]
+            if segment.size and segment.size + len(payload) > self.segment_bytes:
+                segment = self._roll()
+
+            await asyncio.to_thread(self._write, segment.path, payload)
+            segment.size += len(payload)
+            segment.seqs.update(seqs)
+            for seq in seqs:
+                self._segment_of[seq] = segment
+
+            self._enforce_cap()
+        return seqs
+
+    def ack(self, seq: int) -> None:
+        """Mark a post as processed (persisted on the next `flush_acks()`)."""
+        if seq in self._segment_of:
+            self._pending_acks.append(seq)
+
+    async def flush_acks(self) -> None:
+        """Write pending acks and delete fully acknowledged closed segments."""
+        if not self._pending_acks:
+            return
+        async with self._write_lock:
+            acks, self._pending_acks = self._pending_acks, []
+            by_segment: dict[str, list[int]] = {}
+            for seq in acks:
+                segment = self._segment_of.pop(seq, None)
+                if segment is not None:
+                    segment.acked.add(seq)
+                    by_segment.setdefault(segment.ack_path, []).append(seq)
+
+            await asyncio.to_thread(self._write_acks, by_segment)
+            for segment in self._segments[:-1]:
+                if segment.complete:
+                    self._delete(segment)
+
+    def close(self) -> None:
+        """Persist pending acks synchronously (shutdown)."""
+        by_segment: dict[str, list[int]] = {}
+        for seq in self._pending_acks:
+            segment = self._segment_of.pop(seq, None)
+            if segment is not None:
+                segment.acked.add(seq)
+                by_segment.setdefault(segment.ack_path, []).append(seq)
+        self._pending_acks = []
+        self._write_acks(by_segment)
+
+    # ═══ Segments ═══
+
+    def _new_segment(self) -> _Segment:
+        path = os.path.join(self.directory, f"segment-{self._next_seq:012d}.wal")
+        return _Segment(first_seq=self._next_seq, path=path)
+
+    def _roll(self) -> _Segment:
+        segment = self._new_segment()
+        self._segments.append(segment)
+        return segment
+
+    def _enforce_cap(self) -> None:
+        """Discard the oldest segments while the spool exceeds `max_bytes`."""
+        while len(self._segments) > 1 and self.size > self.max_bytes:
+            oldest = self._segments[0]
+            lost = len(oldest.seqs - oldest.acked)
+            logger.warning(
+                f"Spool over {self.max_bytes // (1024 * 1024)} MiB: discarding "
+                f"{os.path.basename(oldest.path)} with {lost} unprocessed posts"
+            )
+            self._delete(oldest)
+
+    def _delete(self, segment: _Segment) -> None:
+        for seq in segment.seqs:
+            self._segment_of.pop(seq, None)
+        for path in (segment.path, segment.ack_path):
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+        self._segments.remove(segment)
+
+    @staticmethod
+    def _write(path: str, payload: bytes) -> None:
+        with open(path, "ab") as fh:
+            fh.write(payload)
+            fh.flush()
+            os.fsync(fh.fileno())
+
+    @staticmethod
+    def _write_acks(by_segment: dict[str, list[int]]) -> None:
+        for ack_path, seqs in by_segment.items():
+            with open(ack_path, "a", encoding="utf-8") as fh:
+                fh.write("".join(f"{seq}\n" for seq in seqs))
@@ -0,0 +1,150 @@
+"""
+Threat Writer — batched Firestore persistence for detected threats.
+
+Instead of one blocking `set()` round trip per threat, documents are
+collected and committed together with a Firestore `WriteBatch` once
+either the size threshold or the time threshold is reached. Each caller
+gets a future that resolves only after its document has been committed,
+so notifications can wait for a successful write. If a batch commit
+fails, its documents are retried one by one so every failure is reported
+against the document that caused it.
+"""
+import asyncio
+import logging
+from typing import Optional
+
+from app.firebase_client import get_firestore
+
+logger = logging.getLogger(__name__)
+
+# Firestore rejects batches with more than 500 writes
+FIRESTORE_BATCH_LIMIT = 500
+
+
+class ThreatWriter:
+    """
+    Collects threat documents and flushes them to Firestore in batches.
+
+    Usage:
+        writer = ThreatWriter(batch_size=100, flush_interval=1.0)
+        await writer.start()
+        await writer.submit(threat_id, threat_doc)  # resolves after commit
+        await writer.stop()                         # flushes what is left
+    """
+
+    def __init__(
+        self,
+        collection: str = "threats",
+        batch_size: int = 100,
+        flush_interval: float = 1.0,
+    ):
+        self.collection = collection
+        self.batch_size = max(1, min(batch_size, FIRESTORE_BATCH_LIMIT))
+        self.flush_interval = flush_interval
+        self._pending: list[tuple[str, dict, asyncio.Future]] = []
+        self._wakeup = asyncio.Event()
+        self._task: Optional[asyncio.Task] = None
+        self._stopping = False
+
+        # Counters for logging / monitoring
+        self.committed = 0
+        self.failed = 0
+
+    async def start(self) -> None:
+        """Start the background flush loop."""
+        if self._task is None:
+            self._stopping = False
+            self._task = asyncio.create_task(self._flush_loop())
+
+    async def stop(self) -> None:
+        """
+        Stop the flush loop and commit any pending documents. The loop is
+        woken rather than cancelled, so a batch it is committing is settled
+        instead of being dropped with its futures unresolved.
+        """
+        if self._task:
+            self._stopping = True
+            self._wakeup.set()
+            await self._task
+            self._task = None
+        await self.flush()
+
+    def submit(self, doc_id: str, doc: dict) -> asyncio.Future:
+        """
+        Queue a document for the next batch.
+        The returned future resolves once the document is committed,
+        or raises the error that prevented this document from being written.
+        """
+        future = asyncio.get_running_loop().create_future()
+        self._pending.append((doc_id, doc, future))
+        if len(self._pending) >= self.batch_size:
+            self._wakeup.set()
+        return future
+
+    async def flush(self) -> None:
+        """Commit everything queued so far, in batches of at most batch_size."""
+        while self._pending:
+            entries = self._pending[: self.batch_size]
+            self._pending = self._pending[self.batch_size:]
+
+            try:
+                errors = await asyncio.to_thread(self._commit, entries)
+            except Exception as exc:
+                # Firestore unavailable — fail every document in this batch
+                errors = [exc] * len(entries)
+
+            for (doc_id, _, future), error in zip(entries, errors):
+                if error is None:
+                    self.committed += 1
+                    if not future.done():
+                        future.set_result(None)
+                else:
+                    self.failed += 1
+                    logger.warning(f"Failed to persist threat {doc_id}: {error}")
+                    if not future.done():
+                        future.set_exception(error)
+
+    async def _flush_loop(self) -> None:
+        """Flush when the batch fills up or the flush interval elapses, until stopped."""
+        while not self._stopping:
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout=self.flush_interval)
+            except asyncio.TimeoutError:
+                pass
+            self._wakeup.clear()
+
+            try:
+                await self.flush()
+            except Exception as exc:
+                logger.error(f"Threat batch flush failed: {exc}", exc_info=True)
+
+    def _commit(self, entries: list[tuple[str, dict, asyncio.Future]]) -> list[Optional[Exception]]:
+        """
+        Commit a batch (runs in a worker thread).
+        Returns one error (or None) per entry, in order.
+        """
+        db = get_firestore()
+        collection = db.collection(self.collection)
+
+        batch = db.batch()
+        for doc_id, doc, _ in entries:
+            batch.set(collection.document(doc_id), doc)
+
+        try:
+            batch.commit()
+            return [None] * len(entries)
+        except Exception as exc:
+            logger.warning(
+                f"Batch commit of {len(entries)} threats failed ({exc}); "
+                "retrying documents individually"
+            )
+
+        # Isolate the failing documents so each one is reported on its own
+        errors: list[Optional[Exception]] = []
+        for doc_id, doc, _ in entries:
+            try:
+                collection.document(doc_id).set(doc)
+                errors.append(None)
+            except Exception as exc:
+                errors.append(exc)
+        return errors
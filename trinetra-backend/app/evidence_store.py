@@ -0,0 +1,198 @@
+"""
+Evidence Store — content-addressed, compressed storage of full threat evidence.
+
+Threat documents used to embed the first 2000 characters of a post as
+`rawEvidence`, shipped with every list and search response, while
+anything past 5000 characters was lost at scrape time. The full original
+content now lives here, keyed by its SHA-256 digest; threat documents
+hold only the digest, the size and a short snippet, and
+`GET /api/threats/{id}/evidence` streams the full text on demand.
+
+- Content-addressed: identical evidence (re-pastes) is stored once
+- Compressed with zstd when the `zstandard` package is installed, gzip
+  otherwise; readers detect the codec from the stored bytes
+- Backends: local filesystem (`local`) or a Cloud Storage bucket (`gcs`).
+  Off by default (`none`): threat documents then keep 2000 characters
+  inline. The local store lives on the crawler's host, so it only serves
+  an API running the crawler in-process; separate workers need `gcs`
+"""
+import gzip
+import hashlib
+import io
+import logging
+import os
+import tempfile
+from abc import ABC, abstractmethod
+from typing import BinaryIO, Optional
+
+from app.config import settings
+
+logger = logging.getLogger(__name__)
+
+_GZIP_MAGIC = b"\x1f\x8b"
+_ZSTD_MAGIC = b"\x28\xb5\x2f\xfd"
+
+_store: Optional["EvidenceStore"] = None
+_store_created = False
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+
+def evidence_digest(data: bytes) -> str:
+    """Hex SHA-256 of the evidence bytes (its key in the store)."""
+    return hashlib.sha256(data).hexdigest()
+
+
+def compress(data: bytes) -> bytes:
+    if zstandard is not None:
+        return zstandard.ZstdCompressor(level=10).compress(data)
+    return gzip.compress(data, compresslevel=6, mtime=0)
+
+
+def decompressing_reader(raw: BinaryIO) -> BinaryIO:
+    """Wrap a stored object's byte stream in a streaming decompressor for its codec."""
+    if not hasattr(raw, "peek"):
+        raw = io.BufferedReader(raw)
+    magic = raw.peek(4)[:4]
+    if magic.startswith(_GZIP_MAGIC):
+        reader = gzip.GzipFile(fileobj=raw, mode="rb")
+        reader.myfileobj = raw  # Closed with the reader, as when GzipFile opens the file itself
+        return reader
+    if magic == _ZSTD_MAGIC:
+        if zstandard is None:
+            raise RuntimeError("Evidence is zstd-compressed but `zstandard` is not installed")
+        return zstandard.ZstdDecompressor().stream_reader(raw, closefd=True)
+    raise ValueError("Unrecognized evidence encoding")
+
+
+class EvidenceStore(ABC):
+    """
+    Blocking, content-addressed evidence storage — call from a worker thread.
+
+    Usage:
+        digest = store.put(content.encode("utf-8"))
+        with store.open(digest) as fh:
+            data = fh.read()
+    """
+
+    def put(self, data: bytes) -> str:
+        """Store `data` (once per distinct content); returns its digest."""
+        digest = evidence_digest(data)
+        if not self.exists(digest):
+            self._write(digest, compress(data))
+        return digest
+
+    def open(self, digest: str) -> BinaryIO:
+        """Decompressed byte stream of the evidence. Raises KeyError if unknown."""
+        return decompressing_reader(self._open_raw(digest))
+
+    def read(self, digest: str) -> bytes:
+        with self.open(digest) as fh:
+            return fh.read()
+
+    @staticmethod
+    def _name(digest: str) -> str:
+        if len(digest) != 64 or any(c not in "0123456789abcdef" for c in digest):
+            raise KeyError(digest)
+        return f"{digest[:2]}/{digest[2:4]}/{digest}"
+
+    @abstractmethod
+    def exists(self, digest: str) -> bool:
+        ...
+
+    @abstractmethod
+    def _write(self, digest: str, payload: bytes) -> None:
+        ...
+
+    @abstractmethod
+    def _open_raw(self, digest: str) -> BinaryIO:
+        ...
+
+
+class LocalEvidenceStore(EvidenceStore):
+    """Evidence files under `directory`, fanned out by digest prefix."""
+
+    def __init__(self, directory: str):
+        self.directory = directory
+
+    def _path(self, digest: str) -> str:
+        return os.path.join(self.directory, *self._name(digest).split("/"))
+
+    def exists(self, digest: str) -> bool:
+        return os.path.exists(self._path(digest))
+
+    def _write(self, digest: str, payload: bytes) -> None:
+        path = self._path(digest)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        # Write-then-rename, so readers never see a partial object
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as fh:
+                fh.write(payload)
+            os.replace(tmp_path, path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+
+    def _open_raw(self, digest: str) -> BinaryIO:
+        try:
+            return open(self._path(digest), "rb")
+        except FileNotFoundError:
+            raise KeyError(digest) from None
+
+
+class GCSEvidenceStore(EvidenceStore):
+    """Evidence objects in a Cloud Storage bucket (the Firebase project's by default)."""
+
+    def __init__(self, bucket: str = "", prefix: str = "evidence"):
+        from firebase_admin import storage
+        from app.firebase_client import init_firebase
+
+        init_firebase()
+        self.bucket = storage.bucket(bucket or None)
+        self.prefix = prefix.strip("/")
+
+    def _blob(self, digest: str):
+        return self.bucket.blob(f"{self.prefix}/{self._name(digest)}")
+
+    def exists(self, digest: str) -> bool:
+        return self._blob(digest).exists()
+
+    def _write(self, digest: str, payload: bytes) -> None:
+        blob = self._blob(digest)
+        blob.cache_control = "private, max-age=31536000, immutable"
+        blob.upload_from_string(payload, content_type="application/octet-stream")
+
+    def _open_raw(self, digest: str) -> BinaryIO:
+        from google.api_core.exceptions import NotFound
+
+        blob = self._blob(digest)
+        try:
+            blob.reload()
+        except NotFound:
+            raise KeyError(digest) from None
+        return blob.open("rb")
+
+
+def create_evidence_store(backend: str) -> Optional[EvidenceStore]:
+    """Build the configured store; None when evidence is kept inline in threat documents."""
+    backend = backend.lower()
+    if backend == "local":
+        return LocalEvidenceStore(settings.state_path("evidence"))
+    if backend == "gcs":
+        return GCSEvidenceStore(settings.evidence_bucket, settings.evidence_prefix)
+    if backend not in ("", "none"):
+        logger.warning(f"Unknown evidence backend '{backend}', keeping evidence inline")
+    return None
+
+
+def get_evidence_store() -> Optional[EvidenceStore]:
+    """Get the shared evidence store. Creates it lazily on first call."""
+    global _store, _store_created
+    if not _store_created:
+        _store = create_evidence_store(settings.evidence_backend)
+        _store_created = True
+    return _store
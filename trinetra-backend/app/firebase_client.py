@@ -2,13 +2,32 @@
 Firebase Admin SDK initialization.
 Provides Firestore client and Auth verification helpers.
 """
+import functools
+import logging
+
 import firebase_admin
 from firebase_admin import credentials, firestore, auth
+from google.cloud.firestore_v1 import batch, document, query
 from app.config import settings
+from app.metrics import Counter, current_endpoint
 import os
 
+logger = logging.getLogger(__name__)
+
 _app: firebase_admin.App | None = None
 _db: firestore.Client | None = None
+_instrumented = False
+
+FIRESTORE_READS = Counter(
+    "trinetra_firestore_reads_total",
+    "Firestore documents read, by API endpoint or background component",
+    ["endpoint"],
+)
+FIRESTORE_WRITES = Counter(
+    "trinetra_firestore_writes_total",
+    "Firestore document writes, by API endpoint or background component",
+    ["endpoint"],
+)
 
 
 def init_firebase() -> None:
@@ -42,10 +61,96 @@ def get_firestore() -> firestore.Client:
     if _db is None:
         if _app is None:
             init_firebase()
+        _instrument_firestore()
         _db = firestore.client()
     return _db
 
 
+def use_firestore(client) -> None:
+    """Route get_firestore() to another client (e.g. the in-memory store used by corpus replay)."""
+    global _db
+    _db = client
+
+
+class _CountingStream:
+    """Wraps a query stream, counting each document read as it is yielded."""
+
+    def __init__(self, stream):
+        self._stream = stream
+        self._reads = FIRESTORE_READS.labels(current_endpoint.get())
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        snapshot = next(self._stream)
+        self._reads.inc()
+        return snapshot
+
+    def __getattr__(self, name):
+        return getattr(self._stream, name)
+
+
+# Public SDK methods that are wrapped to count reads and writes, with the
+# result each wrapper relies on. google-cloud-firestore is pinned in
+# requirements.txt; test_firestore_metrics.py fails when these change.
+INSTRUMENTED_METHODS = (
+    (query.Query, "stream"),                     # every collection / query read
+    (document.DocumentReference, "get"),         # every single-document read
+    (document.DocumentReference, "delete"),      # the one write that commits directly
+    (batch.WriteBatch, "commit"),                # set/update/create; returns one WriteResult per write
+)
+
+
+def count_writes(amount: int = 1) -> None:
+    """Count writes the SDK wrappers can't see (e.g. those committed in a transaction)."""
+    FIRESTORE_WRITES.labels(current_endpoint.get()).inc(amount)
+
+
+def _instrument_firestore() -> None:
+    """
+    Count Firestore reads and writes per endpoint (see app.metrics.current_endpoint).
+    Only the public methods in INSTRUMENTED_METHODS are wrapped; writes
+    committed in transactions are counted by their callers with
+    count_writes(). A wrapper never fails the call it wraps: if the SDK
+    changes shape, the metric is lost, not the read or write.
+    """
+    global _instrumented
+    if _instrumented:
+        return
+    _instrumented = True
+
+    def _count(counter, method, amount=lambda result: 1):
+        @functools.wraps(method)
+        def wrapper(self, *args, **kwargs):
+            result = method(self, *args, **kwargs)
+            try:
+                counter.labels(current_endpoint.get()).inc(amount(result))
+            except Exception:
+                pass
+            return result
+        return wrapper
+
+    def _counting_stream(method):
+        @functools.wraps(method)
+        def wrapper(self, *args, **kwargs):
+            return _CountingStream(method(self, *args, **kwargs))
+        return wrapper
+
+    wrappers = {
+        (query.Query, "stream"): _counting_stream,
+        (document.DocumentReference, "get"): lambda m: _count(FIRESTORE_READS, m),
+        (document.DocumentReference, "delete"): lambda m: _count(FIRESTORE_WRITES, m),
+        (batch.WriteBatch, "commit"): lambda m: _count(FIRESTORE_WRITES, m, len),
+    }
+    for cls, name in INSTRUMENTED_METHODS:
+        method = getattr(cls, name, None)
+        if method is None:
+            logger.warning(f"Firestore metrics: {cls.__name__}.{name} not found, not counted")
+            continue
+        setattr(cls, name, wrappers[cls, name](method))
+
+
 def verify_firebase_token(id_token: str) -> dict:
     """
     Verify a Firebase ID token and return the decoded claims.
@@ -0,0 +1,188 @@
+"""
+Shared outbound HTTP client.
+
+One long-lived `httpx.AsyncClient` is used by every scraper and outbound
+service (Telegram, AI summaries, Firebase REST login), so connections,
+TLS sessions and DNS lookups are reused across crawl cycles instead of
+being rebuilt per request batch.
+
+- HTTP/2 when the `h2` package is installed
+- Per-host concurrency limit on top of the global connection pool
+- Keep-alive pool sizing and expiry from settings
+- TTL DNS cache in front of the system resolver
+"""
+import asyncio
+import ipaddress
+import logging
+import socket
+import time
+from typing import Optional
+
+import httpcore
+import httpx
+
+from app.config import settings
+
+logger = logging.getLogger(__name__)
+
+_client: Optional[httpx.AsyncClient] = None
+
+
+def _http2_available() -> bool:
+    try:
+        import h2  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+class CachingResolverBackend(httpcore.AsyncNetworkBackend):
+    """
+    Network backend that resolves hostnames through a TTL cache.
+
+    TLS still uses the original hostname for SNI and certificate checks —
+    httpcore passes it to `start_tls` separately from the TCP address.
+    """
+
+    def __init__(self, ttl_seconds: float = 300):
+        self.ttl = ttl_seconds
+        self._backend = httpcore.AnyIOBackend()
+        self._cache: dict[tuple[str, int], tuple[float, list[str]]] = {}
+
+    async def resolve(self, host: str, port: int, timeout: Optional[float] = None) -> list[str]:
+        """Return the addresses for `host`, from cache when fresh."""
+        try:
+            ipaddress.ip_address(host)
+            return [host]
+        except ValueError:
+            pass
+
+        cached = self._cache.get((host, port))
+        if cached and cached[0] > time.monotonic():
+            return cached[1]
+
+        loop = asyncio.get_running_loop()
+        try:
+            infos = await asyncio.wait_for(
+                loop.getaddrinfo(host, port, type=socket.SOCK_STREAM), timeout
+            )
+        except (OSError, asyncio.TimeoutError) as exc:
+            raise httpcore.ConnectError(f"DNS lookup failed for {host}: {exc}") from exc
+
+        # Keep resolver order, drop duplicates
+        addresses = list(dict.fromkeys(info[4][0] for info in infos))
+        self._cache[(host, port)] = (time.monotonic() + self.ttl, addresses)
+        return addresses
+
+    async def connect_tcp(
+        self,
+        host: str,
+        port: int,
+        timeout: Optional[float] = None,
+        local_address: Optional[str] = None,
+        socket_options=None,
+    ) -> httpcore.AsyncNetworkStream:
+        last_error: Optional[Exception] = None
+        for address in await self.resolve(host, port, timeout):
+            try:
+                return await self._backend.connect_tcp(
+                    address, port, timeout=timeout,
+                    local_address=local_address, socket_options=socket_options,
+                )
+            except (httpcore.ConnectError, httpcore.ConnectTimeout) as exc:
+                last_error = exc
+
+        # Every cached address failed — the record may be stale
+        self._cache.pop((host, port), None)
+        raise last_error or httpcore.ConnectError(f"No addresses for {host}")
+
+    async def connect_unix_socket(self, path: str, timeout: Optional[float] = None, socket_options=None):
+        return await self._backend.connect_unix_socket(path, timeout=timeout, socket_options=socket_options)
+
+    async def sleep(self, seconds: float) -> None:
+        await self._backend.sleep(seconds)
+
+
+class _ReleasingStream(httpx.AsyncByteStream):
+    """Response body stream that frees the host slot once closed."""
+
+    def __init__(self, stream: httpx.AsyncByteStream, release):
+        self._stream = stream
+        self._release = release
+
+    async def __aiter__(self):
+        async for chunk in self._stream:
+            yield chunk
+
+    async def aclose(self) -> None:
+        try:
+            await self._stream.aclose()
+        finally:
+            if self._release:
+                self._release()
+                self._release = None
+
+
+class PooledTransport(httpx.AsyncHTTPTransport):
+    """
+    HTTP transport with a per-host request limit and a caching DNS backend.
+    A host slot is held until the response body is closed.
+    """
+
+    def __init__(self, max_per_host: int, dns_ttl_seconds: float, **kwargs):
+        super().__init__(**kwargs)
+        # httpx doesn't expose the pool's network backend; swap in the caching one
+        self._pool._network_backend = CachingResolverBackend(dns_ttl_seconds)
+        self.max_per_host = max_per_host
+        self._host_slots: dict[tuple[str, str, int], asyncio.Semaphore] = {}
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        origin = (request.url.scheme, request.url.host, request.url.port or 0)
+        slots = self._host_slots.get(origin)
+        if slots is None:
+            slots = self._host_slots[origin] = asyncio.Semaphore(self.max_per_host)
+
+        await slots.acquire()
+        try:
+            response = await super().handle_async_request(request)
+        except BaseException:
+            slots.release()
+            raise
+        response.stream = _ReleasingStream(response.stream, slots.release)
+        return response
+
+
+def create_http_client() -> httpx.AsyncClient:
+    """Build a pooled client from settings."""
+    http2 = settings.http2_enabled and _http2_available()
+    transport = PooledTransport(
+        max_per_host=settings.http_max_connections_per_host,
+        dns_ttl_seconds=settings.http_dns_cache_ttl_seconds,
+        http2=http2,
+        limits=httpx.Limits(
+            max_connections=settings.http_max_connections,
+            max_keepalive_connections=settings.http_keepalive_connections,
+            keepalive_expiry=settings.http_keepalive_expiry_seconds,
+        ),
+    )
+    logger.info(
+        f"HTTP client pool created (HTTP/2: {'on' if http2 else 'off'}, "
+        f"{settings.http_max_connections_per_host} per host)"
+    )
+    return httpx.AsyncClient(transport=transport, timeout=settings.http_timeout_seconds)
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """Get the shared HTTP client. Creates it lazily on first call (or after close)."""
+    global _client
+    if _client is None or _client.is_closed:
+        _client = create_http_client()
+    return _client
+
+
+async def close_http_client() -> None:
+    """Close the shared client and its pooled connections."""
+    global _client
+    if _client is not None:
+        await _client.aclose()
+        _client = None
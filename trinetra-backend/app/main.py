@@ -4,13 +4,18 @@ FastAPI application with auto-discovery of routers, CORS configuration,
 Firebase initialization, and background crawler engine start.
 """
 import logging
+import time
 from contextlib import asynccontextmanager
-from fastapi import FastAPI
+from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
+from starlette.routing import Match
 from app.firebase_client import initialize_firebase
 from app.config import settings
 from app.crawler.engine import get_engine
-from app.routers import auth, threats, entities, sectors, sources, keywords, stats, websocket
+from app.http_client import close_http_client
+from app.metrics import Counter, Histogram, current_endpoint
+from app.routers import auth, threats, entities, sectors, sources, keywords, stats, websocket, metrics
+from app.services.threat_relay import ThreatRelay
 
 # ═══ Logging Configuration ═══
 logging.basicConfig(
@@ -20,18 +25,32 @@ logging.basicConfig(
 )
 logger = logging.getLogger("trinetra")
 
+HTTP_REQUEST_SECONDS = Histogram(
+    "trinetra_http_request_seconds",
+    "API request latency",
+    ["endpoint", "method"],
+)
+HTTP_REQUESTS = Counter(
+    "trinetra_http_requests_total",
+    "API requests by status code",
+    ["endpoint", "method", "status"],
+)
+
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """
     Application lifecycle manager.
     - On startup: Initialize Firebase, seed data, start crawler
+      (unless CRAWLER_ENABLED=false — then it runs as `python -m app.crawler`
+      and its threats reach WebSocket clients through the threat relay)
     - On shutdown: Stop crawler gracefully
     """
     # ═══ STARTUP ═══
     logger.info("═══ Trinetra Backend Starting ═══")
 
     engine = None
+    relay = None
     try:
         # Initialize Firebase Admin SDK
         initialize_firebase()
@@ -42,9 +61,14 @@ async def lifespan(app: FastAPI):
         await seed_initial_data()
 
         # Start the background crawler engine
-        engine = get_engine()
-        await engine.start()
-        logger.info("Crawler engine started")
+        if settings.crawler_enabled:
+            engine = get_engine()
+            await engine.start()
+            logger.info("Crawler engine started")
+        else:
+            logger.info("Crawler disabled in this process (run `python -m app.crawler`)")
+            relay = ThreatRelay(websocket.broadcast_threat)
+            await relay.start()
     except Exception as exc:
         logger.warning(
             f"Non-fatal startup error (Firestore may still be activating): {exc}"
@@ -58,6 +82,9 @@ async def lifespan(app: FastAPI):
     if engine:
         await engine.stop()
         logger.info("Crawler engine stopped")
+    if relay:
+        await relay.stop()
+    await close_http_client()
 
 
 # ═══ FastAPI App ═══
@@ -84,6 +111,35 @@ app.add_middleware(
 )
 
 
+# ═══ Request Metrics ═══
+@app.middleware("http")
+async def request_metrics(request: Request, call_next):
+    """
+    Time each request and label it with its route template (not the raw
+    path, which would explode metric cardinality). The route is also
+    published via `current_endpoint` so Firestore reads/writes made while
+    serving it are attributed to the endpoint.
+    """
+    endpoint = "unmatched"
+    for route in request.app.router.routes:
+        match, _ = route.matches(request.scope)
+        if match == Match.FULL:
+            endpoint = route.path
+            break
+
+    token = current_endpoint.set(endpoint)
+    started = time.perf_counter()
+    status_code = 500
+    try:
+        response = await call_next(request)
+        status_code = response.status_code
+        return response
+    finally:
+        current_endpoint.reset(token)
+        HTTP_REQUEST_SECONDS.labels(endpoint, request.method).observe(time.perf_counter() - started)
+        HTTP_REQUESTS.labels(endpoint, request.method, str(status_code)).inc()
+
+
 # ═══ Register Routers ═══
 app.include_router(auth.router, prefix="/api")
 app.include_router(threats.router, prefix="/api")
@@ -92,6 +148,7 @@ app.include_router(sectors.router, prefix="/api")
 app.include_router(sources.router, prefix="/api")
 app.include_router(keywords.router, prefix="/api")
 app.include_router(stats.router, prefix="/api")
+app.include_router(metrics.router, prefix="/api")
 app.include_router(websocket.router)
 
 
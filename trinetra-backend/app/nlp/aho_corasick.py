@@ -0,0 +1,113 @@
+"""
+Aho-Corasick — find every occurrence of many keywords in one pass.
+
+`AhoCorasick` compiles a keyword set into a trie with failure links once;
+a scan then walks the text a single time, however many keywords there
+are, and reports each occurrence whose surroundings satisfy the
+keyword's boundary rule:
+
+- WORD:  not preceded or followed by a word character, like the regex
+         `(?:^|\\W)keyword(?:$|\\W)`
+- SPACE: preceded and followed by a space or the start / end of the
+         text, like `f" {keyword} " in f" {text} "`
+- None:  any occurrence
+
+Matching is case-sensitive: lowercase keywords and text for
+case-insensitive matching.
+"""
+from collections import deque
+from typing import Generic, Hashable, Iterable, Iterator, Optional, TypeVar
+
+WORD = "word"
+SPACE = "space"
+
+T = TypeVar("T", bound=Hashable)
+
+
+def _is_word(ch: str) -> bool:
+    """Same as the regex `\\w` on str patterns."""
+    return ch.isalnum() or ch == "_"
+
+
+class AhoCorasick(Generic[T]):
+    """
+    Multi-keyword matcher. Each keyword maps to a value; several keywords
+    may share a value and the same keyword may be added with several values.
+
+    Usage:
+        automaton = AhoCorasick([("ddos", "attack", WORD), ("job", "negative", SPACE)])
+        automaton.find("ddos job offer")  # {"attack", "negative"}
+    """
+
+    def __init__(self, keywords: Iterable[tuple[str, T, Optional[str]]]):
+        self._goto: list[dict[str, int]] = [{}]
+        # Per state: (length, value, boundary) of every keyword ending here
+        self._out: list[tuple[tuple[int, T, Optional[str]], ...]] = [()]
+        self._size = 0
+        for keyword, value, boundary in keywords:
+            self._add(keyword, value, boundary)
+        self._fail = self._link()
+
+    def __len__(self) -> int:
+        return self._size
+
+    def _add(self, keyword: str, value: T, boundary: Optional[str]) -> None:
+        if not keyword:
+            raise ValueError("Empty keyword")
+        if boundary not in (WORD, SPACE, None):
+            raise ValueError(f"Unknown boundary {boundary!r}")
+        state = 0
+        for ch in keyword:
+            nxt = self._goto[state].get(ch)
+            if nxt is None:
+                nxt = len(self._goto)
+                self._goto[state][ch] = nxt
+                self._goto.append({})
+                self._out.append(())
+            state = nxt
+        self._out[state] += ((len(keyword), value, boundary),)
+        self._size += 1
+
+    def _link(self) -> list[int]:
+        """Breadth-first failure links; each state also reports its suffixes' keywords."""
+        fail = [0] * len(self._goto)
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for ch, nxt in self._goto[state].items():
+                queue.append(nxt)
+                fallback = fail[state]
+                while fallback and ch not in self._goto[fallback]:
+                    fallback = fail[fallback]
+                fail[nxt] = self._goto[fallback].get(ch, 0)
+                self._out[nxt] += self._out[fail[nxt]]
+        return fail
+
+    def iter(self, text: str) -> Iterator[tuple[int, int, T]]:
+        """Yield (start, end, value) for every occurrence that satisfies its boundary."""
+        goto, fail, out = self._goto, self._fail, self._out
+        last = len(text) - 1
+        state = 0
+        for i, ch in enumerate(text):
+            while state and ch not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(ch, 0)
+            if not out[state]:
+                continue
+            for length, value, boundary in out[state]:
+                start = i - length + 1
+                if boundary == WORD:
+                    if start > 0 and _is_word(text[start - 1]):
+                        continue
+                    if i < last and _is_word(text[i + 1]):
+                        continue
+                elif boundary == SPACE:
+                    if start > 0 and text[start - 1] != " ":
+                        continue
+                    if i < last and text[i + 1] != " ":
+                        continue
+                yield start, i + 1, value
+
+    def find(self, text: str) -> set[T]:
+        """Distinct values of the keywords occurring in `text`."""
+        return {value for _, _, value in self.iter(text)}
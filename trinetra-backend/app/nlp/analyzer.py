@@ -1,13 +1,16 @@
 """
-NLP Analyzer — keyword-based and contextual threat detection using
-regex patterns, keyword matching, and TF-IDF based contextual analysis.
-No heavy ML dependencies — uses scikit-learn's TfidfVectorizer for
-context-aware analysis and built-in pattern matching for keyword detection.
+NLP Analyzer — keyword-based threat detection using keyword matching,
+sector targeting and negative filtering. No heavy ML dependencies; the
+contextual second opinion on its candidates comes from the hashed-feature
+classifier in app.nlp.classifier (see app.crawler.relevance_filter).
 """
-import re
+import functools
 import logging
 from dataclasses import dataclass, field
 
+from app.nlp.aho_corasick import SPACE, WORD, AhoCorasick
+from app.nlp.ioc_extractor import get_ioc_extractor
+
 logger = logging.getLogger(__name__)
 
 
@@ -127,13 +130,51 @@ NEGATIVE_KEYWORDS: list[str] = [
     "discussion", "question", "help needed", "looking for advice",
 ]
 
+_SEVERITY_ORDER = {"Critical": 4, "High": 3, "Medium": 2, "Low": 1}
+
+# Entity label and per-post limit of each IOC type, in reporting order
+_ENTITY_TYPES: dict[str, tuple[str, int]] = {
+    "ip": ("IP", 5),
+    "email": ("Email", 5),
+    "domain": ("Domain", 5),
+    "url": ("URL", 3),
+    "cve": ("CVE", 5),
+    "md5": ("Hash", 3),
+    "sha1": ("Hash", 3),
+    "sha256": ("Hash", 3),
+    "btc": ("Wallet", 3),
+    "eth": ("Wallet", 3),
+}
+
+# Keyword groups in the analyzer's automaton
+_ATTACK, _CREDENTIAL, _CUSTOM, _SECTOR, _NEGATIVE = range(5)
+
+
+@functools.lru_cache(maxsize=8)
+def _keyword_automaton(custom_keywords: tuple[str, ...]) -> AhoCorasick:
+    """
+    One automaton over every keyword list, built once per custom keyword set.
+    Threat keywords match on word boundaries; sector and negative keywords
+    keep their original space-delimited matching.
+    """
+    entries = [(kw, (_ATTACK, kw), WORD) for kw in ATTACK_KEYWORDS]
+    entries += [(kw, (_CREDENTIAL, kw), WORD) for kw in CREDENTIAL_KEYWORDS]
+    entries += [(kw, (_CUSTOM, kw), WORD) for kw in custom_keywords]
+    for sector, keywords in INDIA_SECTORS.items():
+        entries += [(kw.lower(), (_SECTOR, sector), SPACE) for kw in keywords]
+    entries += [(kw, (_NEGATIVE, kw), SPACE) for kw in NEGATIVE_KEYWORDS]
+    return AhoCorasick(entries)
+
+
 class NLPAnalyzer:
     """
     Analyzes text content for cybersecurity threats using:
-    1. Regex-based keyword matching (avoiding substring false positives)
+    1. Keyword matching on word boundaries (avoiding substring false positives)
     2. Credential leak keyword detection
     3. India-sector targeting detection
     4. Contextual scoring and negative filtering
+
+    All keyword lists are matched in a single Aho-Corasick pass over the post.
     """
 
     def __init__(self, custom_keywords: list[str] | None = None):
@@ -145,6 +186,7 @@ class NLPAnalyzer:
             for kw in (custom_keywords or [])
             if kw.strip()
         }
+        self._automaton = _keyword_automaton(tuple(self.custom_keywords))
 
     def analyze(self, content: str) -> ThreatIndicator:
         """
@@ -158,25 +200,25 @@ class NLPAnalyzer:
 
         lower_content = content.lower()
 
+        # Every keyword list in one pass
+        found = self._automaton.find(lower_content)
+
         # Phase 0: Negative filtering (Education, Jobs, etc.)
-        if self._has_negative_keywords(lower_content):
-            # If it's clearly a job post or tutorial, downgrade strictly
-            # Unless it has a CRITICAL credential leak (e.g., password dump)
-            is_job_or_edu = True
-        else:
-            is_job_or_edu = False
+        # If it's clearly a job post or tutorial, downgrade strictly
+        # Unless it has a CRITICAL credential leak (e.g., password dump)
+        is_job_or_edu = any(group == _NEGATIVE for group, _ in found)
 
         # Phase 1: Attack keyword detection (with word boundaries)
-        attack_matches = self._match_keywords(lower_content, ATTACK_KEYWORDS)
+        attack_matches = self._match_keywords(found, _ATTACK, ATTACK_KEYWORDS)
 
         # Phase 2: Credential leak keyword detection
-        cred_matches = self._match_keywords(lower_content, CREDENTIAL_KEYWORDS)
+        cred_matches = self._match_keywords(found, _CREDENTIAL, CREDENTIAL_KEYWORDS)
 
         # Phase 3: Custom keyword matching
-        custom_matches = self._match_keywords(lower_content, self.custom_keywords)
+        custom_matches = self._match_keywords(found, _CUSTOM, self.custom_keywords)
 
         # Phase 4: India sector targeting
-        targeted_sectors = self._detect_sectors(lower_content)
+        targeted_sectors = [sector for sector in INDIA_SECTORS if (_SECTOR, sector) in found]
 
         # Phase 5: Entity extraction
         entities = self._extract_entities(content)
@@ -240,66 +282,46 @@ class NLPAnalyzer:
             target_sector=targeted_sectors[0] if targeted_sectors else "",
         )
 
+    def analyze_batch(self, contents: list[str]) -> list[ThreatIndicator]:
+        """
+        Analyze many posts with the same keyword automaton.
+        Returns one ThreatIndicator per post, in input order.
+        """
+        analyze = self.analyze
+        return [analyze(content) for content in contents]
+
     def _match_keywords(
-        self, content: str, keyword_dict: dict[str, str]
+        self, found: set[tuple[int, str]], group: int, keyword_dict: dict[str, str]
     ) -> list[tuple[str, str]]:
         """
-        Find keyword matches using regex word boundaries to avoid substring issues.
+        Keywords of one group found by the automaton, in dictionary order.
         Returns list of (keyword, severity).
         """
-        matches = []
-        for keyword, severity in keyword_dict.items():
-            # Escape keyword for regex compatibility
-            escaped_kw = re.escape(keyword)
-            # Match whole words only (start/end of string or non-word char)
-            pattern = f"(?:^|\\W){escaped_kw}(?:$|\\W)"
-            if re.search(pattern, content):
-                matches.append((keyword, severity))
-        return matches
-
-    def _has_negative_keywords(self, content: str) -> bool:
-        """Check for presence of negative keywords (jobs, education)."""
-        for kw in NEGATIVE_KEYWORDS:
-             # Fast substring check is okay for negative keywords, 
-             # but word boundary is safer to avoid suppressing 'career' in 'career-hacker' (unlikely but possible)
-             if f" {kw} " in f" {content} ": # Simple boundary simulation
-                 return True
-        return False
-
-    def _detect_sectors(self, content: str) -> list[str]:
-        """Detect which Indian infrastructure sectors are mentioned."""
-        detected = []
-        for sector, keywords in INDIA_SECTORS.items():
-            for keyword in keywords:
-                if f" {keyword.lower()} " in f" {content} ": # Simple boundary check
-                    if sector not in detected:
-                        detected.append(sector)
-                        break
-        return detected
+        return [
+            (keyword, severity)
+            for keyword, severity in keyword_dict.items()
+            if (group, keyword) in found
+        ]
 
     def _extract_entities(self, content: str) -> list[str]:
-        """Simple entity extraction using regex."""
+        """Validated IOCs (see app.nlp.ioc_extractor), grouped by type, e.g. "IP:1.2.3.4"."""
+        by_type: dict[str, list[str]] = {ioc_type: [] for ioc_type in _ENTITY_TYPES}
+        for ioc in get_ioc_extractor().extract(content, types=_ENTITY_TYPES):
+            values = by_type[ioc.type]
+            if ioc.value not in values and len(values) < _ENTITY_TYPES[ioc.type][1]:
+                values.append(ioc.value)
+
         entities = []
-        # IP addresses
-        ips = re.findall(r"\b(?:\d{1,3}\.){3}\d{1,3}\b", content)
-        entities.extend([f"IP:{ip}" for ip in ips[:5]])
-        # Emails
-        emails = re.findall(r"\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b", content)
-        entities.extend([f"Email:{email}" for email in emails[:5]])
-        # Domains
-        domains = re.findall(r"\b(?:[a-z0-9](?:[a-z0-9-]{0,61}[a-z0-9])?\.)+(?:com|org|net|in|gov\.in|co\.in|io|dev)\b", content.lower())
-        entities.extend([f"Domain:{d}" for d in domains[:5]])
-        # URLs
-        urls = re.findall(r"https?://[^\s<>\"']+", content)
-        entities.extend([f"URL:{url[:60]}" for url in urls[:3]])
+        for ioc_type, values in by_type.items():
+            label = _ENTITY_TYPES[ioc_type][0]
+            entities.extend(f"{label}:{value[:60] if ioc_type == 'url' else value}" for value in values)
         return entities
 
     def _highest_severity(self, matches: list[tuple[str, str]]) -> str:
         """Determine the highest severity from matches."""
-        severity_order = {"Critical": 4, "High": 3, "Medium": 2, "Low": 1}
         max_sev = "Low"
         for _, sev in matches:
-            if severity_order.get(sev, 0) > severity_order.get(max_sev, 0):
+            if _SEVERITY_ORDER.get(sev, 0) > _SEVERITY_ORDER.get(max_sev, 0):
                 max_sev = sev
         return max_sev
 
@@ -0,0 +1,186 @@
+"""
+Contextual Classifier — hashed text features and an online logistic model.
+
+Keyword matching flags any post that mentions "exploit" or "data breach",
+news and tooling chatter included. This classifier scores the keyword
+candidates with a linear model over the whole post, trained incrementally
+from analyst triage (Escalated = real threat, Resolved = false positive),
+so the pipeline can drop candidates the analysts would have dismissed.
+
+- `HashingVectorizer`: word unigrams and bigrams hashed (signed) into a
+  fixed number of features, sublinear term frequency, L2-normalized rows.
+  No vocabulary to fit or ship.
+- `OnlineLogisticClassifier`: logistic regression trained with SGD one
+  batch of labels at a time, with class weights balanced from the labels
+  seen so far. Scores a whole batch of posts per call.
+
+numpy only; the model is saved to and loaded from a single `.npz` file.
+"""
+import logging
+import os
+import re
+import tempfile
+import zlib
+from typing import Optional
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+_TOKEN = re.compile(r"\w[\w.@-]*\w|\w")
+
+# Longer posts are scored on their first tokens only
+_MAX_TOKENS = 2000
+
+
+class HashingVectorizer:
+    """Maps texts to sparse, L2-normalized rows of `2 ** bits` hashed features."""
+
+    def __init__(self, bits: int = 18):
+        self.bits = bits
+        self.n_features = 1 << bits
+        self._mask = self.n_features - 1
+
+    def _row(self, text: str) -> dict[int, float]:
+        tokens = _TOKEN.findall(text.lower())[:_MAX_TOKENS]
+        grams = tokens + [f"{a} {b}" for a, b in zip(tokens, tokens[1:])]
+        counts: dict[int, float] = {}
+        for gram in grams:
+            h = zlib.crc32(gram.encode("utf-8"))
+            # The top bit picks the sign, so colliding features tend to cancel out
+            sign = -1.0 if h & 0x80000000 else 1.0
+            index = h & self._mask
+            counts[index] = counts.get(index, 0.0) + sign
+        return counts
+
+    def transform(self, texts: list[str]) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Vectorize a batch. Returns (rows, columns, values) of the non-zero
+        entries; `rows` indexes into `texts`.
+        """
+        rows, cols, vals = [], [], []
+        for i, text in enumerate(texts):
+            counts = self._row(text or "")
+            if not counts:
+                continue
+            values = np.fromiter(counts.values(), dtype=np.float64, count=len(counts))
+            # Sublinear tf, keeping the hash sign
+            values = np.sign(values) * np.log1p(np.abs(values))
+            norm = np.linalg.norm(values)
+            if norm == 0:
+                continue
+            rows.append(np.full(len(counts), i, dtype=np.int64))
+            cols.append(np.fromiter(counts.keys(), dtype=np.int64, count=len(counts)))
+            vals.append(values / norm)
+        if not rows:
+            empty = np.empty(0, dtype=np.int64)
+            return empty, empty, np.empty(0, dtype=np.float64)
+        return np.concatenate(rows), np.concatenate(cols), np.concatenate(vals)
+
+
+class OnlineLogisticClassifier:
+    """
+    Logistic regression over hashed features, updated one label batch at a time.
+
+    Usage:
+        model = OnlineLogisticClassifier.load(path) or OnlineLogisticClassifier()
+        model.partial_fit(["leaked db dump ...", "hiring pentesters ..."], [1, 0])
+        model.predict_proba(posts)  # array of P(threat)
+        model.save(path)
+    """
+
+    def __init__(self, bits: int = 18, learning_rate: float = 0.5, l2: float = 1e-5):
+        self.vectorizer = HashingVectorizer(bits)
+        self.learning_rate = learning_rate
+        self.l2 = l2
+        self.weights = np.zeros(self.vectorizer.n_features, dtype=np.float64)
+        self.bias = 0.0
+        self.label_counts = np.zeros(2, dtype=np.int64)  # [negative, positive]
+
+    @property
+    def n_labels(self) -> int:
+        return int(self.label_counts.sum())
+
+    def _decision(
+        self, weights: np.ndarray, bias: float, n: int, rows, cols, vals
+    ) -> np.ndarray:
+        return np.bincount(rows, weights=weights[cols] * vals, minlength=n) + bias
+
+    def predict_proba(self, texts: list[str]) -> np.ndarray:
+        """P(threat) for each text, in input order."""
+        if not texts:
+            return np.empty(0, dtype=np.float64)
+        rows, cols, vals = self.vectorizer.transform(texts)
+        weights, bias = self.weights, self.bias  # A consistent snapshot while training swaps them
+        z = self._decision(weights, bias, len(texts), rows, cols, vals)
+        return 1.0 / (1.0 + np.exp(-np.clip(z, -35, 35)))
+
+    def partial_fit(self, texts: list[str], labels: list[int], epochs: int = 1) -> None:
+        """
+        Update the model with a batch of labeled texts (1 = threat, 0 = not).
+        Trains on a copy and swaps it in, so concurrent scoring never sees
+        a half-updated model.
+        """
+        if not texts:
+            return
+        y = np.asarray(labels, dtype=np.float64)
+        counts = self.label_counts + np.bincount(y.astype(np.int64), minlength=2)
+        # Balanced class weights from every label seen so far
+        class_weights = counts.sum() / (2.0 * np.maximum(counts, 1))
+        sample_weights = class_weights[y.astype(np.int64)]
+
+        rows, cols, vals = self.vectorizer.transform(texts)
+        weights, bias = self.weights.copy(), self.bias
+        for _ in range(epochs):
+            p = 1.0 / (1.0 + np.exp(-np.clip(
+                self._decision(weights, bias, len(texts), rows, cols, vals), -35, 35
+            )))
+            error = (p - y) * sample_weights
+            step = self.learning_rate / len(texts)
+            weights *= 1.0 - self.learning_rate * self.l2
+            np.add.at(weights, cols, -step * error[rows] * vals)
+            bias -= step * float(error.sum())
+
+        self.weights, self.bias, self.label_counts = weights, bias, counts
+
+    # ═══ Persistence ═══
+
+    def save(self, path: str, **meta) -> None:
+        """Atomically write the model (plus any `meta` scalars) to `path`."""
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path) or ".", suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as fh:
+                np.savez_compressed(
+                    fh,
+                    weights=self.weights,
+                    bias=np.float64(self.bias),
+                    label_counts=self.label_counts,
+                    hyper=np.array([self.vectorizer.bits, self.learning_rate, self.l2]),
+                    **{f"meta_{key}": np.asarray(value) for key, value in meta.items()},
+                )
+            os.replace(tmp_path, path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+
+    @classmethod
+    def load(cls, path: str) -> Optional[tuple["OnlineLogisticClassifier", dict]]:
+        """(model, meta) saved at `path`, or None if there is no readable model."""
+        try:
+            with np.load(path) as data:
+                bits, learning_rate, l2 = data["hyper"]
+                model = cls(int(bits), float(learning_rate), float(l2))
+                model.weights = data["weights"].astype(np.float64)
+                model.bias = float(data["bias"])
+                model.label_counts = data["label_counts"].astype(np.int64)
+                meta = {
+                    key[len("meta_"):]: data[key].item()
+                    for key in data.files if key.startswith("meta_")
+                }
+        except FileNotFoundError:
+            return None
+        except Exception as exc:
+            logger.warning(f"Ignoring unreadable classifier model {path}: {exc}")
+            return None
+        return model, meta
@@ -0,0 +1,297 @@
+"""
+IOC Extractor — typed, validated indicators of compromise in one pass.
+
+The analyzer and the entity graph used to pull IPs, emails, domains and
+URLs out of post text with separate (and differing) regexes. Every IOC
+type is now one alternative of a single compiled pattern, so a text is
+scanned once; each candidate is then validated and normalized by its
+type:
+
+- ip:     IPv4, octets 0-255 without leading zeros
+- email:  the address, with a valid domain part
+- domain: lowercased, with a known public suffix and a registrable label
+- url:    http(s) only; scheme and host lowercased, default port, fragment
+          and trailing punctuation dropped
+- cve:    uppercased CVE ID
+- md5 / sha1 / sha256: lowercased hex digests
+- btc:    legacy (Base58Check) and SegWit (bech32 / bech32m) addresses,
+          checksum-verified
+- eth:    lowercased 0x addresses
+
+Domains are checked against the `publicsuffixlist` package when it is
+installed, and against a built-in list of common suffixes otherwise.
+More types can be added with `IOCExtractor.with_types(IOCType(...))`.
+"""
+import hashlib
+import ipaddress
+import re
+from dataclasses import dataclass
+from typing import Callable, Collection, Optional
+from urllib.parse import urlsplit, urlunsplit
+
+try:
+    from publicsuffixlist import PublicSuffixList
+except ImportError:
+    PublicSuffixList = None
+
+_psl = PublicSuffixList() if PublicSuffixList is not None else None
+
+
+@dataclass(frozen=True)
+class IOC:
+    """One indicator found in a text: its type, normalized value and raw span."""
+    type: str
+    value: str
+    start: int
+    end: int
+
+    @property
+    def host(self) -> Optional[str]:
+        """The domain a domain, email or URL indicator points at (None otherwise)."""
+        if self.type == "domain":
+            return self.value
+        if self.type == "email":
+            return self.value.rsplit("@", 1)[1]
+        if self.type == "url":
+            host = urlsplit(self.value).hostname or ""
+            return host if is_valid_domain(host) else None
+        return None
+
+
+@dataclass(frozen=True)
+class IOCType:
+    """
+    An extractable indicator type. `pattern` becomes one alternative of the
+    extractor's combined regex (matched case-insensitively; it must not
+    contain named groups). `normalize` returns the canonical value of a
+    candidate, or None to reject it.
+    """
+    name: str
+    pattern: str
+    normalize: Callable[[str], Optional[str]]
+
+
+# ═══ Domains ═══
+
+# Fallback when `publicsuffixlist` is not installed. Extensions that are
+# mostly seen as file names in pastes (.py, .sh, .md, .zip, ...) are left out.
+_TLDS = frozenset("""
+    com net org info biz gov edu mil int io ai app dev co me tv cc xyz top online
+    site tech store shop club live cloud link pro mobi asia tel travel onion
+    ac ae af ag al am ar at au az ba bd be bg bh br by ca ch cl cn cy cz de dk
+    dz ee eg es eu fi fr ge gh gr hk hr hu ie il in iq ir is it jo jp ke kg kh
+    kr kw kz la lb lk lt lu lv ly ma mm mn mo mt mu mx my ng nl no np nz om pe
+    ph pk pt qa ro ru sa se sg si sk su th tj tk tn tr tw tz ua ug uk us uy uz
+    ve vn za zw
+""".split())
+
+_SECOND_LEVEL_SUFFIXES = frozenset("""
+    co.in gov.in nic.in ac.in org.in net.in res.in edu.in mil.in firm.in gen.in ind.in
+    co.uk org.uk ac.uk gov.uk com.au net.au org.au gov.au edu.au co.jp co.kr
+    com.br com.cn com.pk gov.pk com.bd co.za com.sg com.my com.tr com.mx
+""".split())
+
+_LABEL = re.compile(r"^[a-z0-9](?:[a-z0-9-]{0,61}[a-z0-9])?$")
+
+
+def is_valid_domain(domain: str) -> bool:
+    """A syntactically valid, registrable name under a known public suffix."""
+    if not domain or len(domain) > 253:
+        return False
+    labels = domain.split(".")
+    if len(labels) < 2 or not all(_LABEL.match(label) for label in labels):
+        return False
+    if _psl is not None:
+        return _psl.privatesuffix(domain, accept_unknown=False) is not None
+    if labels[-1] not in _TLDS:
+        return False
+    if ".".join(labels[-2:]) in _SECOND_LEVEL_SUFFIXES:
+        return len(labels) >= 3
+    return True
+
+
+def _normalize_domain(raw: str) -> Optional[str]:
+    domain = raw.lower()
+    return domain if is_valid_domain(domain) else None
+
+
+def _normalize_email(raw: str) -> Optional[str]:
+    local, _, domain = raw.rpartition("@")
+    domain = domain.lower()
+    if not local or local.startswith(".") or not is_valid_domain(domain):
+        return None
+    return f"{local}@{domain}"
+
+
+# ═══ IPs and URLs ═══
+
+def _normalize_ip(raw: str) -> Optional[str]:
+    try:
+        return str(ipaddress.IPv4Address(raw))
+    except ValueError:
+        return None  # Octet out of range or with a leading zero
+
+
+_DEFAULT_PORTS = {"http": 80, "https": 443}
+
+
+def _normalize_url(url: str) -> Optional[str]:
+    try:
+        parts = urlsplit(url)
+        port = parts.port
+    except ValueError:
+        return None
+    scheme = parts.scheme.lower()
+    host = (parts.hostname or "").rstrip(".")
+    if not host or (_normalize_ip(host) is None and not is_valid_domain(host)):
+        return None
+    netloc = host
+    if parts.username:
+        netloc = f"{parts.username}@{netloc}"
+    if port is not None and port != _DEFAULT_PORTS.get(scheme):
+        netloc = f"{netloc}:{port}"
+    return urlunsplit((scheme, netloc, parts.path or "/", parts.query, ""))
+
+
+# ═══ Hashes, CVEs, wallets ═══
+
+def _normalize_hash(raw: str) -> Optional[str]:
+    digest = raw.lower()
+    # Hex-only words (dates, long numbers, "deadbeef...") are rarely real digests
+    if not any(c.isdigit() for c in digest) or not any(c.isalpha() for c in digest):
+        return None
+    return digest
+
+
+_BASE58 = "123456789ABCDEFGHJKLMNPQRSTUVWXYZabcdefghijkmnopqrstuvwxyz"
+_BECH32 = "qpzry9x8gf2tvdw0s3jn54khce6mua7l"
+
+
+def _normalize_btc(raw: str) -> Optional[str]:
+    if raw[:3].lower() == "bc1":
+        return _check_bech32(raw.lower())
+    return _check_base58(raw)
+
+
+def _check_base58(address: str) -> Optional[str]:
+    """Legacy P2PKH / P2SH address with a valid Base58Check checksum."""
+    number = 0
+    for ch in address:
+        index = _BASE58.find(ch)
+        if index < 0:
+            return None
+        number = number * 58 + index
+    pad = len(address) - len(address.lstrip("1"))
+    try:
+        payload = b"\0" * pad + number.to_bytes((number.bit_length() + 7) // 8, "big")
+    except OverflowError:
+        return None
+    if len(payload) != 25 or payload[0] not in (0x00, 0x05):
+        return None
+    checksum = hashlib.sha256(hashlib.sha256(payload[:-4]).digest()).digest()[:4]
+    return address if checksum == payload[-4:] else None
+
+
+def _check_bech32(address: str) -> Optional[str]:
+    """SegWit address with a valid bech32 (v0) or bech32m (v1+) checksum."""
+    hrp, _, data = address.rpartition("1")
+    if hrp != "bc" or len(data) < 7 or any(ch not in _BECH32 for ch in data):
+        return None
+    values = [ord(ch) >> 5 for ch in hrp] + [0] + [ord(ch) & 31 for ch in hrp]
+    values += [_BECH32.index(ch) for ch in data]
+    checksum = 1
+    for value in values:
+        top = checksum >> 25
+        checksum = (checksum & 0x1FFFFFF) << 5 ^ value
+        for i, generator in enumerate((0x3B6A57B2, 0x26508E6D, 0x1EA119FA, 0x3D4233DD, 0x2A1462B3)):
+            if (top >> i) & 1:
+                checksum ^= generator
+    witness_version = _BECH32.index(data[0])
+    expected = 1 if witness_version == 0 else 0x2BC830A3
+    return address if checksum == expected else None
+
+
+_DOMAIN = r"(?:[a-z0-9](?:[a-z0-9-]{0,61}[a-z0-9])?\.)+[a-z](?:[a-z0-9-]{0,61}[a-z0-9])?"
+
+# Order matters: at any position the first alternative that matches wins,
+# so URLs and emails are taken whole before their domains are.
+DEFAULT_TYPES: tuple[IOCType, ...] = (
+    # Trailing punctuation ends the sentence, not the URL
+    IOCType("url", r"\bhttps?://[^\s<>\"'`]*[^\s<>\"'`.,;:!?)\]}]", _normalize_url),
+    IOCType("email", rf"\b[a-z0-9._%+-]+@{_DOMAIN}(?![\w-])", _normalize_email),
+    IOCType("cve", r"\bCVE-\d{4}-\d{4,7}\b", str.upper),
+    IOCType("eth", r"\b0x[a-f0-9]{40}\b", str.lower),
+    IOCType("sha256", r"\b[a-f0-9]{64}\b", _normalize_hash),
+    IOCType("sha1", r"\b[a-f0-9]{40}\b", _normalize_hash),
+    IOCType("md5", r"\b[a-f0-9]{32}\b", _normalize_hash),
+    IOCType("btc", r"\b(?:bc1[a-z0-9]{11,71}|[13][a-z0-9]{25,34})\b", _normalize_btc),
+    IOCType("ip", r"(?<![\w.])(?:\d{1,3}\.){3}\d{1,3}(?!\.?\d)", _normalize_ip),
+    IOCType("domain", rf"(?<![\w.@-]){_DOMAIN}(?![\w-])", _normalize_domain),
+)
+
+
+class IOCExtractor:
+    """
+    Extracts every configured IOC type from a text in a single regex pass.
+
+    Usage:
+        extractor = get_ioc_extractor()
+        for ioc in extractor.extract(text, types={"ip", "domain"}):
+            print(ioc.type, ioc.value, ioc.start)
+    """
+
+    def __init__(self, types: Collection[IOCType] = DEFAULT_TYPES):
+        self.types = tuple(types)
+        self._by_group = {f"t{i}": ioc_type for i, ioc_type in enumerate(self.types)}
+        self._pattern = re.compile(
+            "|".join(f"(?P<{group}>{t.pattern})" for group, t in self._by_group.items()),
+            re.IGNORECASE,
+        )
+        # Extractors for a subset of the types, keyed by type names (see extract)
+        self._subsets: dict[frozenset[str], "IOCExtractor"] = {}
+
+    def with_types(self, *extra: IOCType) -> "IOCExtractor":
+        """A new extractor that also recognizes `extra` (tried before the domain fallback)."""
+        return IOCExtractor(
+            [t for t in self.types if t.name != "domain"]
+            + list(extra)
+            + [t for t in self.types if t.name == "domain"]
+        )
+
+    def extract(self, text: str, types: Optional[Collection[str]] = None) -> list[IOC]:
+        """
+        Every valid indicator in `text` (of `types`, if given), in text order.
+        With `types`, only those types are matched at all, so e.g. the host
+        of a URL is found as a domain when URLs aren't requested.
+        """
+        if not text or not self.types:
+            return []
+        if types is not None:
+            return self._subset(types).extract(text)
+        found = []
+        for match in self._pattern.finditer(text):
+            ioc_type = self._by_group[match.lastgroup]
+            value = ioc_type.normalize(match.group())
+            if value is not None:
+                found.append(IOC(ioc_type.name, value, match.start(), match.end()))
+        return found
+
+    def _subset(self, types: Collection[str]) -> "IOCExtractor":
+        """The (cached) extractor for just `types`, compiled on first use."""
+        key = frozenset(types)
+        extractor = self._subsets.get(key)
+        if extractor is None:
+            extractor = IOCExtractor([t for t in self.types if t.name in key])
+            self._subsets[key] = extractor
+        return extractor
+
+
+_extractor: Optional[IOCExtractor] = None
+
+
+def get_ioc_extractor() -> IOCExtractor:
+    """Get the shared extractor with the default IOC types. Compiles it on first call."""
+    global _extractor
+    if _extractor is None:
+        _extractor = IOCExtractor()
+    return _extractor
@@ -4,7 +4,7 @@ Uses Firebase REST API for email/password sign-in, then verifies tokens
 via Firebase Admin SDK.
 """
 from fastapi import APIRouter, Depends, HTTPException, status
-import httpx
+from app.http_client import get_http_client
 from app.schemas.auth import LoginRequest, LoginResponse, UserResponse
 from app.utils.security import get_current_user
 from app.firebase_client import get_firebase_user
@@ -25,15 +25,14 @@ async def login(request: LoginRequest):
         f"?key={settings.firebase_api_key}"
     )
 
-    async with httpx.AsyncClient() as client:
-        resp = await client.post(
-            firebase_url,
-            json={
-                "email": request.email,
-                "password": request.password,
-                "returnSecureToken": True,
-            },
-        )
+    resp = await get_http_client().post(
+        firebase_url,
+        json={
+            "email": request.email,
+            "password": request.password,
+            "returnSecureToken": True,
+        },
+    )
 
     if resp.status_code != 200:
         error_msg = resp.json().get("error", {}).get("message", "Authentication failed")
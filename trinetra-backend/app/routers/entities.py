@@ -6,23 +6,19 @@ Strategy:
 2. Otherwise, dynamically build an entity graph from the 'threats' collection
    by extracting actors (sources), targets, IPs, and domains from threat records.
 """
-import re
 import math
 import hashlib
 import logging
 from fastapi import APIRouter
 from app.firebase_client import get_firestore
+from app.nlp.ioc_extractor import get_ioc_extractor
 from app.schemas.entity import EntityResponse, LinkResponse
 
 logger = logging.getLogger(__name__)
 router = APIRouter(prefix="/entities", tags=["Entities"])
 
-# ── Regex patterns for extracting entity mentions from threat evidence ──
-IP_PATTERN = re.compile(r'\b(?:\d{1,3}\.){3}\d{1,3}\b')
-DOMAIN_PATTERN = re.compile(
-    r'\b(?:[a-zA-Z0-9-]+\.)+(?:com|org|net|in|gov|io|info|co)\b',
-    re.IGNORECASE,
-)
+# IOC types whose values (IPs) or hosts (domains) become graph entities
+_GRAPH_IOC_TYPES = {"ip", "domain", "email", "url"}
 
 
 def _stable_id(label: str) -> int:
@@ -109,7 +105,8 @@ def _build_entities_from_threats(threats: list[dict]) -> tuple[list[dict], list[
 
         # ── Extract IPs from evidence ──
         evidence_text = f"{raw_evidence} {title}"
-        ips = IP_PATTERN.findall(evidence_text)
+        iocs = get_ioc_extractor().extract(evidence_text, types=_GRAPH_IOC_TYPES)
+        ips = [ioc.value for ioc in iocs if ioc.type == "ip"]
         for ip in ips:
             if ip not in entity_map:
                 entity_map[ip] = {
@@ -126,10 +123,10 @@ def _build_entities_from_threats(threats: list[dict]) -> tuple[list[dict], list[
                 seen_links.add((ip_id, src_id))
 
         # ── Extract domains from evidence ──
-        domains = DOMAIN_PATTERN.findall(evidence_text)
+        domains = [ioc.host for ioc in iocs if ioc.type != "ip" and ioc.host]
         for domain in domains:
             # Skip common non-entity domains
-            if domain.lower() in ("localhost", "example.com", "t.me"):
+            if domain in ("localhost", "example.com", "t.me"):
                 continue
             if domain not in entity_map:
                 entity_map[domain] = {
@@ -0,0 +1,14 @@
+"""
+Metrics router — Prometheus text-format metrics for the crawl pipeline and API.
+"""
+from fastapi import APIRouter
+from fastapi.responses import Response
+from app.metrics import CONTENT_TYPE, render
+
+router = APIRouter(tags=["Metrics"])
+
+
+@router.get("/metrics", include_in_schema=False)
+async def get_metrics():
+    """Scrape endpoint for Prometheus."""
+    return Response(content=render(), media_type=CONTENT_TYPE)
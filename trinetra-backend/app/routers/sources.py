@@ -3,24 +3,34 @@ Sources router — CRUD for data source configurations.
 Manages what forums/sites the crawler monitors.
 """
 from fastapi import APIRouter, HTTPException
+from app.config import settings
+from app.crawler.registry import available_scrapers, get_scraper_class, source_key
+from app.crawler.source_health import merge_snapshots
 from app.firebase_client import get_firestore
-from app.schemas.source import SourceResponse, SourceCreate, SourceUpdate
+from app.schemas.source import SourceCrawlSettings, SourceResponse, SourceCreate, SourceUpdate
+import logging
 import time
 
+logger = logging.getLogger(__name__)
+
 router = APIRouter(prefix="/sources", tags=["Sources"])
 
+_CRAWL_FIELDS = set(SourceCrawlSettings.model_fields)
+
 
 @router.get("", response_model=list[SourceResponse])
 async def list_sources():
-    """Get all configured data sources."""
+    """Get all configured data sources, with the crawler's health stats for each."""
     db = get_firestore()
     docs = db.collection("sources").get()
-    return [_doc_to_source(doc) for doc in docs]
+    health = _source_health(db)
+    return [_doc_to_source(doc, health) for doc in docs]
 
 
 @router.post("", response_model=SourceResponse, status_code=201)
 async def create_source(source: SourceCreate):
     """Add a new data source to monitor."""
+    _check_scraper(source.scraper)
     db = get_firestore()
     new_id = int(time.time() * 1000)  # Timestamp-based ID, matches frontend pattern
     doc_data = {
@@ -29,6 +39,7 @@ async def create_source(source: SourceCreate):
         "active": True,
         "type": source.type,
         "url": source.url,
+        **source.model_dump(include=_CRAWL_FIELDS, exclude_none=True),
     }
     db.collection("sources").document(str(new_id)).set(doc_data)
     return SourceResponse(**doc_data)
@@ -37,6 +48,7 @@ async def create_source(source: SourceCreate):
 @router.patch("/{source_id}", response_model=SourceResponse)
 async def update_source(source_id: str, update: SourceUpdate):
     """Toggle active status or update a data source."""
+    _check_scraper(update.scraper)
     db = get_firestore()
     doc_ref = db.collection("sources").document(source_id)
     doc = doc_ref.get()
@@ -65,12 +77,55 @@ async def delete_source(source_id: str):
     doc_ref.delete()
 
 
-def _doc_to_source(doc) -> SourceResponse:
+def _doc_to_source(doc, health: dict[str, dict] | None = None) -> SourceResponse:
     data = doc.to_dict()
+    key = _health_key(data)
     return SourceResponse(
         id=int(data.get("id", 0)),
         name=data.get("name", ""),
         active=data.get("active", False),
         type=data.get("type", "Custom"),
         url=data.get("url"),
+        **{field: data[field] for field in _CRAWL_FIELDS if data.get(field) is not None},
+        health=(health or {}).get(key) if key else None,
     )
+
+
+def _check_scraper(name: str | None) -> None:
+    if name and get_scraper_class(name) is None:
+        raise HTTPException(
+            status_code=422,
+            detail=f"Unknown scraper '{name}' (available: {', '.join(available_scrapers())})",
+        )
+
+
+def _health_key(data: dict) -> str | None:
+    """The crawler's health key for a source document (see CrawlerEngine._sources)."""
+    source_type = data.get("type", "").lower()
+    if source_type == "reddit":
+        return "Reddit Scraper"
+    if source_type == "pastebin":
+        return "Pastebin Scraper"
+    if data.get("url"):
+        return source_key(data)
+    return None
+
+
+def _source_health(db) -> dict[str, dict]:
+    """
+    Source health published by every crawler replica, plus the in-process
+    engine's live stats when this API server runs the crawler itself.
+    """
+    snapshots = []
+    try:
+        snapshots = [
+            (doc.to_dict() or {}).get("sources", {})
+            for doc in db.collection("source_health").stream()
+        ]
+    except Exception as exc:
+        logger.warning(f"Reading source health failed: {exc}")
+
+    if settings.crawler_enabled:
+        from app.crawler.engine import get_engine
+        snapshots.append(get_engine().health.snapshot())
+    return merge_snapshots(snapshots)
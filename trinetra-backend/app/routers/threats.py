@@ -2,11 +2,22 @@
 Threats router — CRUD, search, timeline, and escalation endpoints.
 All data stored in Firestore 'threats' collection.
 """
-from fastapi import APIRouter, HTTPException, Query
-from typing import Optional
+from fastapi import APIRouter, Header, HTTPException, Query
+from fastapi.responses import StreamingResponse
+from typing import Iterator, Optional
+from app.crawler.relevance_filter import TRIAGE_COLLECTION, triage_label_doc
+from app.evidence_store import get_evidence_store
 from app.firebase_client import get_firestore
 from app.schemas.threat import ThreatResponse, TimelineDataResponse
 from datetime import datetime, timezone
+import asyncio
+import io
+import logging
+import re
+
+logger = logging.getLogger(__name__)
+
+_RANGE = re.compile(r"^bytes=(\d*)-(\d*)$")
 
 router = APIRouter(prefix="/threats", tags=["Threats"])
 
@@ -105,7 +116,60 @@ async def get_threat(threat_id: str):
     return _doc_to_threat(doc)
 
 
-    return _doc_to_threat(doc)
+@router.get("/{threat_id}/evidence")
+async def get_threat_evidence(
+    threat_id: str, range_header: Optional[str] = Header(None, alias="Range")
+):
+    """
+    Stream a threat's full evidence as UTF-8 text. Supports a single
+    `Range: bytes=start-end` request (206 Partial Content). Threats stored
+    before the evidence store existed, or whose stored evidence is not
+    available to this process, serve their inline `rawEvidence`.
+    """
+    db = get_firestore()
+    doc = db.collection("threats").document(threat_id).get()
+
+    if not doc.exists:
+        raise HTTPException(status_code=404, detail=f"Threat {threat_id} not found")
+
+    data = doc.to_dict()
+    digest = data.get("evidence_digest")
+    store = get_evidence_store() if digest else None
+    stream, etag = None, None
+    if store is not None and data.get("evidence_size") is not None:
+        try:
+            stream = await asyncio.to_thread(store.open, digest)
+            total, etag = int(data["evidence_size"]), f'"{digest}"'
+        except KeyError:
+            # E.g. written to another host's local store; the snippet is better than nothing
+            logger.warning(f"Evidence {digest} of {threat_id} not in the store, serving the inline snippet")
+    if stream is None:
+        inline = str(data.get("rawEvidence", "") or "").encode("utf-8")
+        stream, total = io.BytesIO(inline), len(inline)
+
+    try:
+        byte_range = _parse_range(range_header, total)
+    except HTTPException:
+        stream.close()
+        raise
+    start, end = byte_range or (0, total - 1)
+
+    headers = {
+        "Accept-Ranges": "bytes",
+        "Content-Length": str(max(0, end - start + 1)),
+        "Cache-Control": "private, max-age=3600",
+    }
+    if etag:
+        headers["ETag"] = etag
+    if byte_range:
+        headers["Content-Range"] = f"bytes {start}-{end}/{total}"
+
+    return StreamingResponse(
+        _read_range(stream, start, end),
+        status_code=206 if byte_range else 200,
+        media_type="text/plain; charset=utf-8",
+        headers=headers,
+    )
 
 
 @router.post("/{threat_id}/analyze")
@@ -149,6 +213,7 @@ async def escalate_threat(threat_id: str):
         "status": "Escalated",
         "details": f"Escalated to CERT-In at {datetime.now(timezone.utc).isoformat()}. Email Status: {email_status}",
     })
+    _record_triage(db, threat_id, threat_data, "Escalated")
 
     return {
         "message": f"Threat {threat_id} escalated", 
@@ -157,6 +222,73 @@ async def escalate_threat(threat_id: str):
     }
 
 
+@router.post("/{threat_id}/resolve")
+async def resolve_threat(threat_id: str):
+    """Close a threat as not actionable — updates status to 'Resolved'."""
+    db = get_firestore()
+    doc_ref = db.collection("threats").document(threat_id)
+    doc = doc_ref.get()
+
+    if not doc.exists:
+        raise HTTPException(status_code=404, detail=f"Threat {threat_id} not found")
+
+    doc_ref.update({"status": "Resolved"})
+    _record_triage(db, threat_id, doc.to_dict(), "Resolved")
+
+    return {"message": f"Threat {threat_id} resolved", "status": "Resolved"}
+
+
+def _record_triage(db, threat_id: str, threat_data: dict, status: str) -> None:
+    """Record the analyst's verdict; the crawler trains its contextual classifier on it."""
+    label_doc = triage_label_doc(threat_id, threat_data, status)
+    if label_doc is not None:
+        # One label per threat: a later verdict replaces the earlier one
+        db.collection(TRIAGE_COLLECTION).document(threat_id).set(label_doc)
+
+
+def _parse_range(header: Optional[str], total: int) -> Optional[tuple[int, int]]:
+    """
+    Parse a single `bytes=` range into inclusive (start, end). Returns None
+    (serve everything) without a header or for multiple ranges; raises 416
+    for a range that can't be satisfied.
+    """
+    match = _RANGE.match(header.strip()) if header else None
+    if not match or not (match.group(1) or match.group(2)):
+        return None
+    if match.group(1):
+        start = int(match.group(1))
+        end = min(int(match.group(2)), total - 1) if match.group(2) else total - 1
+    else:  # Suffix range: the last N bytes
+        start, end = max(0, total - int(match.group(2))), total - 1
+    if start >= total or start > end:
+        raise HTTPException(
+            status_code=416,
+            detail="Requested range not satisfiable",
+            headers={"Content-Range": f"bytes */{total}"},
+        )
+    return start, end
+
+
+def _read_range(stream, start: int, end: int, chunk_size: int = 64 * 1024) -> Iterator[bytes]:
+    """Yield bytes start..end (inclusive) of a decompressing stream, then close it."""
+    try:
+        remaining = start
+        while remaining > 0:  # Compressed streams can't seek; read past the prefix
+            skipped = stream.read(min(chunk_size, remaining))
+            if not skipped:
+                return
+            remaining -= len(skipped)
+        remaining = end - start + 1
+        while remaining > 0:
+            chunk = stream.read(min(chunk_size, remaining))
+            if not chunk:
+                return
+            remaining -= len(chunk)
+            yield chunk
+    finally:
+        stream.close()
+
+
 def _doc_to_threat(doc) -> ThreatResponse:
     """Convert a Firestore document to a ThreatResponse."""
     data = doc.to_dict()
@@ -174,4 +306,5 @@ def _doc_to_threat(doc) -> ThreatResponse:
         rawEvidence=data.get("rawEvidence", ""),
         location=location if location else None,
         details=data.get("details"),
+        evidenceSize=data.get("evidence_size"),
     )
@@ -5,6 +5,8 @@ Connected clients receive new threats as they're detected by the crawler.
 from fastapi import APIRouter, WebSocket, WebSocketDisconnect
 import json
 import logging
+import time
+from app.metrics import Gauge, Histogram
 
 logger = logging.getLogger(__name__)
 router = APIRouter(tags=["WebSocket"])
@@ -12,6 +14,16 @@ router = APIRouter(tags=["WebSocket"])
 # Global connection manager
 _connections: list[WebSocket] = []
 
+WEBSOCKET_CLIENTS = Gauge(
+    "trinetra_websocket_clients",
+    "Connected WebSocket clients",
+)
+WEBSOCKET_CLIENTS.set_function(lambda: len(_connections))
+BROADCAST_SECONDS = Histogram(
+    "trinetra_websocket_broadcast_seconds",
+    "Time to push one threat to every connected WebSocket client",
+)
+
 
 @router.websocket("/ws")
 async def websocket_endpoint(websocket: WebSocket):
@@ -53,11 +65,13 @@ async def broadcast_threat(threat_data: dict) -> None:
     })
 
     disconnected = []
+    started = time.perf_counter()
     for ws in _connections:
         try:
             await ws.send_text(message)
         except Exception:
             disconnected.append(ws)
+    BROADCAST_SECONDS.observe(time.perf_counter() - started)
 
     # Clean up disconnected clients
     for ws in disconnected:
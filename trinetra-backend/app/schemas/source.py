@@ -3,21 +3,46 @@ from pydantic import BaseModel
 from typing import Optional
 
 
-class SourceResponse(BaseModel):
+class SourceHealthResponse(BaseModel):
+    state: str  # closed, open, half_open (circuit breaker)
+    attempts: int = 0
+    successes: int = 0
+    failures: int = 0
+    consecutive_failures: int = 0
+    success_rate: Optional[float] = None  # Over the most recent fetches
+    latency_ms: float = 0.0  # Moving average
+    last_latency_ms: float = 0.0
+    last_success: Optional[str] = None
+    last_failure: Optional[str] = None
+    last_error: Optional[str] = None
+    retry_in_seconds: Optional[float] = None  # While the circuit is open
+
+
+class SourceCrawlSettings(BaseModel):
+    """Per-source crawl settings (URL sources only; unset fields use the defaults)."""
+    scraper: Optional[str] = None  # Registered scraper type, default "forum"
+    selectors: Optional[dict[str, str]] = None  # post_container, title, content, author
+    max_posts: Optional[int] = None
+    max_page_kb: Optional[int] = None
+    timeout_seconds: Optional[float] = None
+
+
+class SourceResponse(SourceCrawlSettings):
     id: int
     name: str
     active: bool
     type: str  # Social, Scraper, Intel, Custom
     url: Optional[str] = None
+    health: Optional[SourceHealthResponse] = None  # Absent until the crawler has fetched it
 
 
-class SourceCreate(BaseModel):
+class SourceCreate(SourceCrawlSettings):
     name: str
     type: str = "Custom"
     url: Optional[str] = None
 
 
-class SourceUpdate(BaseModel):
+class SourceUpdate(SourceCrawlSettings):
     active: Optional[bool] = None
     name: Optional[str] = None
     url: Optional[str] = None
@@ -35,9 +35,10 @@ class ThreatResponse(BaseModel):
     credibility: int  # 0-100
     timestamp: str
     status: ThreatStatus
-    rawEvidence: str
+    rawEvidence: str  # Snippet when the full text is in the evidence store
     location: Optional[LocationSchema] = None
     details: Optional[str] = None
+    evidenceSize: Optional[int] = None  # Bytes of full evidence at /threats/{id}/evidence
 
 
 class ThreatCreate(BaseModel):
@@ -3,10 +3,10 @@ AI Service Wrapper for OpenRouter.
 Provides a unified interface for interacting with LLMs via OpenRouter.
 Falls back to a simple heuristic if API key is missing.
 """
-import httpx
 import logging
 import json
 from ..config import settings
+from ..http_client import get_http_client
 
 logger = logging.getLogger(__name__)
 
@@ -40,28 +40,28 @@ async def generate_threat_insight(threat: dict) -> str:
     """
 
     try:
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                OPENROUTER_URL,
-                headers={
-                    "Authorization": f"Bearer {settings.openrouter_api_key}",
-                    "HTTP-Referer": "https://trinetra.cyber", 
-                    "X-Title": "Trinetra Threat Intel",
-                },
-                json={
-                    "model": DEFAULT_MODEL,
-                    "messages": [
-                        {"role": "system", "content": "You are a senior threat intelligence officer."},
-                        {"role": "user", "content": prompt}
-                    ],
-                    "temperature": 0.3, # Low temp for factual analysis
-                    "max_tokens": 100,
-                },
-                timeout=10.0
-            )
-            response.raise_for_status()
-            data = response.json()
-            return data['choices'][0]['message']['content'].strip()
+        client = get_http_client()
+        response = await client.post(
+            OPENROUTER_URL,
+            headers={
+                "Authorization": f"Bearer {settings.openrouter_api_key}",
+                "HTTP-Referer": "https://trinetra.cyber", 
+                "X-Title": "Trinetra Threat Intel",
+            },
+            json={
+                "model": DEFAULT_MODEL,
+                "messages": [
+                    {"role": "system", "content": "You are a senior threat intelligence officer."},
+                    {"role": "user", "content": prompt}
+                ],
+                "temperature": 0.3, # Low temp for factual analysis
+                "max_tokens": 100,
+            },
+            timeout=10.0
+        )
+        response.raise_for_status()
+        data = response.json()
+        return data['choices'][0]['message']['content'].strip()
 
     except Exception as e:
         logger.error(f"AI Generation failed: {e}")
@@ -1,6 +1,6 @@
-import httpx
 import logging
 from ..config import settings
+from ..http_client import get_http_client
 
 logger = logging.getLogger(__name__)
 
@@ -38,11 +38,10 @@ async def send_telegram_alert(threat_data: dict) -> None:
     }
 
     try:
-        async with httpx.AsyncClient() as client:
-            resp = await client.post(url, json=payload, timeout=10.0)
-            if resp.status_code != 200:
-                logger.error(f"Telegram send failed: {resp.text}")
-            else:
-                logger.info(f"Telegram alert sent for threat {threat_data.get('id')}")
+        resp = await get_http_client().post(url, json=payload, timeout=10.0)
+        if resp.status_code != 200:
+            logger.error(f"Telegram send failed: {resp.text}")
+        else:
+            logger.info(f"Telegram alert sent for threat {threat_data.get('id')}")
     except Exception as e:
         logger.error(f"Telegram connection failed: {e}")
@@ -0,0 +1,89 @@
+"""
+Threat Relay — live WebSocket alerts for threats stored by another process.
+
+With the crawler in a standalone worker (`python -m app.crawler`,
+CRAWLER_ENABLED=false on the API), the worker's own `broadcast_threat`
+has no connected clients: dashboards connect to the API. Each API replica
+therefore listens to the `threats` collection for documents detected
+after it started and pushes every newly added threat to its own WebSocket
+clients. Updates to existing threats (near-duplicate sightings, triage)
+are not re-broadcast.
+
+Listener callbacks run on Firestore's background threads; threats are
+handed over to the event loop like ConfigWatcher does. A background task
+re-attaches the listener if it can't be attached yet or dies later; the
+new listener picks up after the newest threat already relayed.
+"""
+import asyncio
+import logging
+from datetime import datetime, timezone
+from typing import Awaitable, Callable, Optional
+
+from app.firebase_client import get_firestore
+from app.snapshot_listeners import SnapshotListeners
+
+logger = logging.getLogger(__name__)
+
+# Check the listener (and re-attach it) this often
+_ATTACH_RETRY_SECONDS = 30
+
+
+class ThreatRelay:
+    """
+    Usage:
+        relay = ThreatRelay(broadcast_threat)
+        await relay.start()
+        ...
+        await relay.stop()
+    """
+
+    def __init__(self, broadcast: Callable[[dict], Awaitable[None]]):
+        self.broadcast = broadcast
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._since = ""  # Relay threats detected after this (ISO timestamp)
+        self._listeners = SnapshotListeners("Threat relay", [self._attach])
+        self._task: Optional[asyncio.Task] = None
+
+    @property
+    def listening(self) -> bool:
+        return self._listeners.alive
+
+    async def start(self) -> None:
+        """Attach the listener and keep it attached in the background."""
+        self._loop = asyncio.get_running_loop()
+        # Only threats detected from now on; earlier ones were alerted already
+        self._since = datetime.now(timezone.utc).isoformat()
+        self._task = asyncio.create_task(self._listeners.supervise(_ATTACH_RETRY_SECONDS))
+
+    async def stop(self) -> None:
+        if self._task:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        self._listeners.close()
+
+    def _attach(self):
+        query = get_firestore().collection("threats").where("detected_at", ">", self._since)
+        return query.on_snapshot(self._callback)
+
+    def _callback(self, snapshots, changes, read_time) -> None:
+        added = [
+            change.document.to_dict() or {}
+            for change in changes
+            if change.type.name == "ADDED"
+        ]
+        # A re-attached listener resumes after the newest threat relayed so far
+        for threat in added:
+            self._since = max(self._since, threat.get("detected_at") or "")
+        if added and self._loop is not None and not self._loop.is_closed():
+            for threat in added:
+                asyncio.run_coroutine_threadsafe(self._relay(threat), self._loop)
+
+    async def _relay(self, threat: dict) -> None:
+        try:
+            await self.broadcast(threat)
+        except Exception as exc:
+            logger.warning(f"Relaying threat {threat.get('id')} failed: {exc}")
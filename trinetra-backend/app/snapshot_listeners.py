@@ -0,0 +1,81 @@
+"""
+Snapshot Listeners — Firestore `on_snapshot` listeners that re-attach.
+
+A listener retries transient stream errors on its own, but a
+non-retryable one (revoked permissions, exhausted quota, a long network
+partition) closes it for good: the callback silently stops firing while
+its owner still holds the watch. `SnapshotListeners` owns one group of
+listeners, notices when any of them is no longer active and re-attaches
+the whole group. A fresh listener starts with a full snapshot, so changes
+made while the old one was dead are delivered too.
+
+Used by ConfigWatcher (checked every crawl cycle) and ThreatRelay
+(checked by its own background task).
+"""
+import asyncio
+import logging
+from typing import Callable
+
+logger = logging.getLogger(__name__)
+
+
+class SnapshotListeners:
+    """
+    Usage:
+        listeners = SnapshotListeners("Config", [lambda: query.on_snapshot(callback), ...])
+        listeners.ensure()        # attach, or re-attach a dead group; False if unavailable
+        ...
+        listeners.close()
+    """
+
+    def __init__(self, name: str, factories: list[Callable[[], object]]):
+        self.name = name
+        self._factories = factories
+        self._watches: list = []
+
+    @property
+    def alive(self) -> bool:
+        """True while every listener is attached and its stream is still running."""
+        return bool(self._watches) and all(_is_active(watch) for watch in self._watches)
+
+    def ensure(self) -> bool:
+        """Attach the listeners unless they are all alive. Returns False if Firestore is unavailable."""
+        if self.alive:
+            return True
+        if self._watches:
+            logger.warning(f"{self.name} listener stopped, re-attaching")
+            self.close()
+
+        try:
+            for factory in self._factories:
+                self._watches.append(factory())
+        except Exception as exc:
+            logger.warning(f"{self.name} listeners unavailable: {exc}")
+            self.close()
+            return False
+
+        logger.info(f"{self.name} listeners attached")
+        return True
+
+    async def supervise(self, interval: float) -> None:
+        """Keep the listeners attached, checking every `interval` seconds (run as a task)."""
+        while True:
+            self.ensure()
+            await asyncio.sleep(interval)
+
+    def close(self) -> None:
+        """Detach all listeners."""
+        for watch in self._watches:
+            try:
+                watch.unsubscribe()
+            except Exception:
+                pass
+        self._watches = []
+
+
+def _is_active(watch) -> bool:
+    # Watch.is_active turns False once the stream is closed for good
+    try:
+        return bool(watch.is_active)
+    except Exception:
+        return False
@@ -0,0 +1,27 @@
+"""Check that the Firestore SDK methods wrapped for metrics still exist and return what the wrappers count."""
+import inspect
+
+from app import firebase_client
+from app.firebase_client import INSTRUMENTED_METHODS
+
+# Return annotation each wrapper relies on (commit: one WriteResult per write)
+EXPECTED_RETURNS = {
+    "Query.stream": "StreamGenerator",
+    "DocumentReference.get": "DocumentSnapshot",
+    "DocumentReference.delete": "Timestamp",
+    "WriteBatch.commit": "list",
+}
+
+for cls, name in INSTRUMENTED_METHODS:
+    qualname = f"{cls.__name__}.{name}"
+    method = getattr(cls, name, None)
+    assert callable(method), f"{qualname} no longer exists"
+    returns = str(inspect.signature(method).return_annotation)
+    assert returns.startswith(EXPECTED_RETURNS[qualname]), f"{qualname} now returns {returns}"
+    print(f"{qualname} -> {returns}")
+
+firebase_client._instrument_firestore()
+for cls, name in INSTRUMENTED_METHODS:
+    assert hasattr(getattr(cls, name), "__wrapped__"), f"{cls.__name__}.{name} was not instrumented"
+
+print("\nAll tests passed!")
@@ -0,0 +1,61 @@
+"""Check that edited and re-headed reposts merge into the original while unrelated posts stay apart."""
+import random
+
+from app.config import settings
+from app.crawler.near_duplicate import NearDuplicateIndex, simhash
+
+random.seed(11)
+VOCABULARY = [
+    "database", "dump", "leaked", "credentials", "admin", "password", "portal", "gov", "bank",
+    "aadhaar", "records", "server", "access", "exploit", "shell", "root", "customer", "email",
+    "phone", "address", "hash", "table", "backup", "sql", "injection", "panel", "login", "users",
+    "mirror", "download", "archive", "private", "key", "token", "session", "cookie", "attack",
+    "target", "ministry", "railway", "telecom", "hospital", "patients", "invoice", "payment",
+    "card", "cvv", "expiry", "wallet", "transfer", "account", "verified", "fresh", "combo",
+]
+
+
+def post(words: int = 300) -> list[str]:
+    return [random.choice(VOCABULARY) for _ in range(words)]
+
+
+def edited(tokens: list[str]) -> list[str]:
+    tokens = list(tokens)
+    tokens[random.randrange(len(tokens))] = "redacted"
+    return tokens
+
+
+def reheaded(tokens: list[str]) -> list[str]:
+    return ["reposted", "from", "pastebin", "mirror", "by", "anon"] + tokens
+
+
+def resigned(tokens: list[str]) -> list[str]:
+    return tokens[:-4] + ["greetz", "to", "the", "crew"]
+
+
+index = NearDuplicateIndex(threshold=settings.near_duplicate_threshold)
+originals = {}
+for i in range(200):
+    tokens = post()
+    threat_id = f"threat-{i}"
+    originals[threat_id] = tokens
+    index.add(threat_id, simhash(" ".join(tokens)))
+print(f"Indexed {len(index)} posts, max distance {index.max_distance} bits")
+
+merged = 0
+for threat_id, tokens in originals.items():
+    for variant in (edited, reheaded, resigned):
+        # Reposts also reflow whitespace and line breaks
+        text = "\n".join(" ".join(variant(tokens)[i:i + 12]) for i in range(0, 310, 12))
+        match = index.find(simhash(text))
+        assert match == threat_id, f"{variant.__name__} repost of {threat_id} matched {match}"
+        merged += 1
+print(f"{merged} edited / re-headed / re-signed reposts merged into their original")
+
+for _ in range(500):
+    match = index.find(simhash(" ".join(post())))
+    assert match is None, f"Unrelated post matched {match}"
+print("500 unrelated posts: no false merges")
+
+assert simhash("too short to fingerprint") is None
+print("\nAll tests passed!")
@@ -11,6 +11,7 @@ export interface Threat {
     location?: { lat: number; lng: number; name: string };
     details?: string;
     title: string;
+    evidenceSize?: number; // Bytes of full evidence, fetched via api.threats.evidence
 }
 
 export interface Entity {
@@ -19,6 +19,7 @@ const AlertDetail: React.FC = () => {
     const navigate = useNavigate();
     const [threat, setThreat] = useState<Threat | null>(null);
     const [escalated, setEscalated] = useState(false);
+    const [resolved, setResolved] = useState(false);
     const [error, setError] = useState<string | null>(null);
 
     useEffect(() => {
@@ -28,6 +29,13 @@ const AlertDetail: React.FC = () => {
                 const data = await api.threats.get(id);
                 setThreat(data);
                 setEscalated(data.status === 'Escalated');
+                setResolved(data.status === 'Resolved');
+
+                // rawEvidence is only a snippet when the full text is in the evidence store
+                if (data.evidenceSize && data.evidenceSize > data.rawEvidence.length) {
+                    const evidence = await api.threats.evidence(id).catch(() => null);
+                    if (evidence) setThreat({ ...data, rawEvidence: evidence });
+                }
             } catch (err) {
                 console.error('[AlertDetail] Failed to fetch threat:', err);
                 setError('Threat not found or API unavailable.');
@@ -165,6 +173,23 @@ const AlertDetail: React.FC = () => {
                                 {escalated ? <CheckCircle size={20} /> : <ShieldAlert size={20} />}
                                 {escalated ? 'Escalated to CERT-In' : 'Escalate to CERT-In'}
                             </Button>
+                            <Button
+                                variant="amber"
+                                className="col-span-2"
+                                onClick={async () => {
+                                    try {
+                                        await api.threats.resolve(threat.id);
+                                        setResolved(true);
+                                    } catch (err) {
+                                        console.error('[AlertDetail] Resolve failed:', err);
+                                        alert("Failed to resolve threat. Please try again.");
+                                    }
+                                }}
+                                disabled={resolved || escalated}
+                            >
+                                <CheckCircle size={20} />
+                                {resolved ? 'Resolved' : 'Resolve as Not Actionable'}
+                            </Button>
                         </div>
                     </div>
                 </div>
@@ -52,6 +52,23 @@ async function apiFetch<T>(
     return response.json();
 }
 
+/**
+ * Fetch a plain-text resource (e.g. full threat evidence).
+ */
+async function apiFetchText(endpoint: string): Promise<string> {
+    const token = getAuthToken();
+    const headers: Record<string, string> = {};
+    if (token) {
+        headers['Authorization'] = `Bearer ${token}`;
+    }
+
+    const response = await fetch(`${API_BASE_URL}${endpoint}`, { headers });
+    if (!response.ok) {
+        throw new Error(`API Error: ${response.status} ${response.statusText}`);
+    }
+    return response.text();
+}
+
 /**
  * API client methods organized by resource.
  */
@@ -76,10 +93,13 @@ export const api = {
             return apiFetch<any[]>(`/threats${qs ? `?${qs}` : ''}`);
         },
         get: (id: string) => apiFetch<any>(`/threats/${id}`),
+        evidence: (id: string) => apiFetchText(`/threats/${id}/evidence`),
         search: (query: string) => apiFetch<any[]>(`/threats/search?q=${encodeURIComponent(query)}`),
         timeline: () => apiFetch<any[]>('/threats/timeline'),
         escalate: (id: string) =>
             apiFetch<{ message: string; status: string }>(`/threats/${id}/escalate`, { method: 'POST' }),
+        resolve: (id: string) =>
+            apiFetch<{ message: string; status: string }>(`/threats/${id}/resolve`, { method: 'POST' }),
         analyze: (id: string) =>
             apiFetch<{ analysis: string; model: string }>(`/threats/${id}/analyze`, { method: 'POST' }),
     },